@@ -138,7 +138,8 @@ def main() -> None:
     engine = BacktestEngine(
         config=config,
         strategy=SimpleLOFStrategy(),
-        data_loader=data_loader
+        data_loader=data_loader,
+        use_compiled=runtime_config.get('use_compiled', True)
     )
 
     # Run backtest
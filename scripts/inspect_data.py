@@ -86,15 +86,16 @@ def plot_dashboard(ticker):
     # --- Highlight Limits (限购区域) ---
     # 在所有子图上把限购的时间段标红
     if not df_limits.empty:
-        for _, row in df_limits.iterrows():
+        limit_rows = df_limits[['start_date', 'end_date', 'max_amount']].itertuples(index=False, name=None)
+        for start_date, end_date, max_amount in limit_rows:
             # 只有当限购额很小（比如<1000）时才高亮，过滤掉正常的限额
-            if row['max_amount'] < 5000: 
+            if max_amount < 5000: 
                 # 在第一个子图添加红色背景区域
                 fig.add_vrect(
-                    x0=row['start_date'], x1=row['end_date'],
+                    x0=start_date, x1=end_date,
                     fillcolor="red", opacity=0.15,
                     layer="below", line_width=0,
-                    annotation_text=f"Limit: {row['max_amount']}", annotation_position="top left"
+                    annotation_text=f"Limit: {max_amount}", annotation_position="top left"
                 )
 
     # --- Layout ---
@@ -0,0 +1,164 @@
+"""
+Caches for parsed LLM results.
+
+FileCache stores exact-match entries as small JSON files at
+``{dir}/{namespace}/{key[:2]}/{key}.json`` so that no single directory grows
+too large. Entries older than ``ttl_days`` are treated as misses.
+
+EmbeddingCache matches inputs by embedding similarity instead (see below).
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class FileCache:
+    """
+    Minimal JSON file cache keyed by hex digest strings.
+
+    Attributes:
+        dir: Root cache directory
+        ttl_days: Entry lifetime in days (None disables expiry)
+    """
+
+    def __init__(self, dir: str = ".cache/llm", ttl_days: Optional[float] = 90):
+        self.dir = Path(dir)
+        self.ttl_days = ttl_days
+
+    def _path(self, namespace: str, key: str) -> Path:
+        # Model names contain ':' and '/', which are not safe in paths
+        safe_ns = re.sub(r"[^\w.-]", "_", namespace)
+        return self.dir / safe_ns / key[:2] / f"{key}.json"
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry/corruption."""
+        path = self._path(namespace, key)
+        try:
+            with open(path, "rb") as f:
+                if self.ttl_days is not None:
+                    age = time.time() - os.fstat(f.fileno()).st_mtime
+                    if age > self.ttl_days * 86400:
+                        return None
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return a dict of the cache hits among ``keys``."""
+        hits = {}
+        for key in keys:
+            value = self.get(namespace, key)
+            if value is not None:
+                hits[key] = value
+        return hits
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store ``value`` atomically (write to temp file, then rename)."""
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-thread temp name: parse_many() writes from a thread pool
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class EmbeddingCache:
+    """
+    Semantic cache: parsed results indexed by the embedding of their input.
+
+    Lookups are a single matrix-vector product over L2-normalised rows. A hit
+    also requires an identical ``signature`` (the caller passes e.g. the
+    ticker plus every number in the text) so that near-identical boilerplate
+    with different dates or amounts never shares a result.
+
+    Attributes:
+        path: File prefix for persistence (``{path}.npy`` + ``{path}.json``),
+              or None to keep the cache in memory only
+        threshold: Minimum cosine similarity for a hit
+    """
+
+    def __init__(self, path: Optional[str] = None, threshold: float = 0.92):
+        self.path = Path(path) if path else None
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._size = 0
+        self._entries: List[Tuple[str, Any]] = []
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _load(self) -> None:
+        npy_path = self.path.with_suffix(".npy")
+        json_path = self.path.with_suffix(".json")
+        try:
+            matrix = np.load(npy_path)
+            with open(json_path, "rb") as f:
+                entries = [tuple(e) for e in json.loads(f.read())]
+        except (OSError, ValueError):
+            return
+        if len(entries) == len(matrix):
+            self._matrix = matrix.astype(np.float32, copy=False)
+            self._size = len(entries)
+            self._entries = entries
+
+    def save(self) -> None:
+        """Persist the cache to ``path`` (no-op for in-memory caches)."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            matrix = self._matrix[: self._size]
+            entries = list(self._entries)
+        np.save(self.path.with_suffix(".npy"), matrix)
+        with open(self.path.with_suffix(".json"), "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        vec = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    def lookup(self, vector: Sequence[float], signature: str) -> Optional[Any]:
+        """Return the stored value of the most similar entry, or None."""
+        with self._lock:
+            if self._size == 0:
+                return None
+            query = self._normalize(vector)
+            if query.shape[0] != self._matrix.shape[1]:
+                return None
+            sims = self._matrix[: self._size] @ query
+            # Best match among entries with the same signature
+            for idx in np.argsort(sims)[::-1]:
+                if sims[idx] < self.threshold:
+                    return None
+                entry_signature, value = self._entries[idx]
+                if entry_signature == signature:
+                    return value
+        return None
+
+    def add(self, vector: Sequence[float], signature: str, value: Any) -> None:
+        """Store ``value`` under ``vector``; the matrix grows by doubling."""
+        row = self._normalize(vector)
+        with self._lock:
+            if self._size and row.shape[0] != self._matrix.shape[1]:
+                return  # embedding model changed; ignore mismatched rows
+            if self._size == self._matrix.shape[0]:
+                grown = np.empty((max(16, 2 * self._size), row.shape[0]), np.float32)
+                if self._size:
+                    grown[: self._size] = self._matrix[: self._size]
+                self._matrix = grown
+            self._matrix[self._size] = row
+            self._entries.append((signature, value))
+            self._size += 1
@@ -15,6 +15,10 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import requests
 
+_UNSAFE_FILENAME_RX = re.compile(r"[\\/:*?\"<>|]")
+_WHITESPACE_RX = re.compile(r"\s+")
+_JSON_PAYLOAD_RX = re.compile(r"\{.*\}", re.S)
+
 
 class AnnouncementDownloader:
     """Downloads LOF fund announcement PDFs within backtest date ranges.
@@ -50,8 +54,8 @@ class AnnouncementDownloader:
     @staticmethod
     def clean_filename(text: str, max_length: int = 120) -> str:
         """Clean filename for Windows compatibility."""
-        cleaned = re.sub(r"[\\/:*?\"<>|]", "_", text)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
+        cleaned = _UNSAFE_FILENAME_RX.sub("_", text)
+        cleaned = _WHITESPACE_RX.sub(" ", cleaned).strip()
         if len(cleaned) > max_length:
             cleaned = cleaned[:max_length].rstrip()
         return cleaned or "announcement"
@@ -105,7 +109,7 @@ class AnnouncementDownloader:
             print(f"[ERROR] API request failed ({fund_code} p{page_index}): {exc}")
             return []
 
-        match = re.search(r"\{.*\}", resp.text, re.S)
+        match = _JSON_PAYLOAD_RX.search(resp.text)
         if not match:
             print(f"[WARN] No JSON payload found ({fund_code} p{page_index})")
             return []
@@ -26,11 +26,14 @@ import logging
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from .llm_client import LLMClient
 from .pdf_extractor import extract_pdf_text
 
+if TYPE_CHECKING:
+    from ._llm_cache import FileCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +64,7 @@ class AnnouncementProcessor:
         db_path: Path | str,
         announcements_dir: Path | str,
         llm_client: Optional[LLMClient] = None,
+        pdf_cache: Optional["FileCache"] = None,
     ):
         """
         Initialize the announcement processor.
@@ -69,10 +73,13 @@ class AnnouncementProcessor:
             db_path: Path to the SQLite database file (fund_status.db)
             announcements_dir: Base directory containing ticker subdirectories with PDFs
             llm_client: Optional LLMClient instance. If None, creates default client.
+            pdf_cache: Optional FileCache for extracted PDF text, keyed by file
+                       content so re-posted announcements are parsed only once.
         """
         self.db_path = Path(db_path)
         self.announcements_dir = Path(announcements_dir)
         self.llm_client = llm_client or LLMClient()
+        self.pdf_cache = pdf_cache
         self.logger = logging.getLogger(__name__)
 
     def process_pdf(self, ticker: str, pdf_path: Path) -> dict:
@@ -116,7 +123,10 @@ class AnnouncementProcessor:
         }
 
         # Step 1: Extract text from PDF
-        extraction_result = extract_pdf_text(pdf_path)
+        if self.pdf_cache is not None:
+            extraction_result = extract_pdf_text(pdf_path, cache=self.pdf_cache)
+        else:
+            extraction_result = extract_pdf_text(pdf_path)
 
         if not extraction_result["success"]:
             error_msg = f"Text extraction failed: {extraction_result.get('error', 'Unknown error')}"
@@ -236,6 +246,8 @@ class AnnouncementProcessor:
         total = len(pdf_files)
 
         self.logger.info(f"Found {total} PDF files for {ticker}")
+        if total:
+            self.llm_client.preload()
 
         stats = {
             "ticker": ticker,
@@ -5,6 +5,8 @@ Downloads market data, NAV, and generates config files compatible with DataLoade
 Handles batch processing to avoid API rate limits.
 """
 
+import asyncio
+import io
 import os
 import time
 import math
@@ -12,7 +14,10 @@ import sqlite3
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # JoinQuant SDK - optional dependency
 try:
@@ -23,6 +28,113 @@ try:
 except ImportError:
     JQ_AVAILABLE = False
 
+# httpx - optional dependency for the JQData HTTP API path
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+# Arrow schemas shared by every per-ticker parquet file. Declaring them once
+# skips per-file schema inference and keeps all files byte-compatible.
+# Prices and NAV are quoted to 3-4 decimals, so float32 (~7 significant
+# digits) is lossless for them and halves the bytes on disk and on load.
+MARKET_SCHEMA = pa.schema(
+    [
+        ("date", pa.timestamp("ns")),
+        ("ticker", pa.dictionary(pa.int32(), pa.string())),
+        ("open", pa.float32()),
+        ("high", pa.float32()),
+        ("low", pa.float32()),
+        ("close", pa.float32()),
+        ("volume", pa.int64()),
+        ("volume_ma5", pa.float32()),
+    ]
+)
+NAV_SCHEMA = pa.schema(
+    [
+        ("date", pa.timestamp("ns")),
+        ("ticker", pa.dictionary(pa.int32(), pa.string())),
+        ("nav", pa.float32()),
+    ]
+)
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+PARQUET_COMPRESSION = "zstd"
+
+# JQData HTTP API (https://www.joinquant.com/help/api/doc?name=JQDatadoc)
+JQ_HTTP_API_URL = "https://dataapi.joinquant.com/apis"
+JQ_HTTP_QUERY_LIMIT = 4000
+
+# Seconds a cached LOF fund list stays valid
+LOF_CODES_CACHE_TTL = 86400
+
+
+def _write_parquet(
+    df: pd.DataFrame, path: Path, schema: pa.Schema, ticker: Optional[str] = None
+) -> None:
+    """Write a DataFrame to parquet using a precomputed Arrow schema.
+
+    Args:
+        df: DataFrame whose columns are a subset of the schema fields.
+        path: Destination parquet file.
+        schema: Arrow schema to write with.
+        ticker: If given, added as a constant dictionary-encoded ``ticker``
+            column at the Arrow level instead of materializing it in pandas.
+    """
+    table = pa.Table.from_pandas(
+        df,
+        schema=pa.schema([schema.field(c) for c in df.columns]),
+        preserve_index=False,
+    )
+    if ticker is not None:
+        ticker_col = pa.DictionaryArray.from_arrays(
+            pa.array(np.zeros(len(df), dtype=np.int32)), pa.array([ticker])
+        )
+        table = table.append_column(schema.field("ticker"), ticker_col)
+        table = table.select([n for n in schema.names if n in table.column_names])
+    pq.write_table(table, path, compression=PARQUET_COMPRESSION)
+
+
+def _write_parquet_if_changed(
+    df: pd.DataFrame, path: Path, schema: pa.Schema, ticker: Optional[str] = None
+) -> bool:
+    """Write a parquet file unless its content is unchanged since the last write.
+
+    A row hash of the DataFrame is kept in a ``{ticker}.hash`` sidecar next to
+    the parquet file. Re-downloads of overlapping date ranges usually produce
+    identical data, so the serialize/compress step is skipped when the hash
+    matches and the sidecar is not older than the parquet file.
+
+    Args:
+        df: DataFrame to write.
+        path: Destination parquet file.
+        schema: Arrow schema to write with.
+        ticker: Optional constant ticker column, see ``_write_parquet``.
+
+    Returns:
+        True if the file was written, False if the write was skipped.
+    """
+    digest = str(int(pd.util.hash_pandas_object(df, index=False).sum()))
+    hash_path = path.with_suffix(".hash")
+
+    if (
+        path.exists()
+        and hash_path.exists()
+        and hash_path.stat().st_mtime >= path.stat().st_mtime
+        and hash_path.read_text() == digest
+    ):
+        return False
+
+    _write_parquet(df, path, schema, ticker=ticker)
+
+    # Replace the sidecar atomically so a crash never leaves a stale match
+    tmp_path = hash_path.with_suffix(".hash.tmp")
+    tmp_path.write_text(digest)
+    os.replace(tmp_path, hash_path)
+    return True
+
 
 class RealDataDownloader:
     """Downloads real LOF data from JoinQuant API.
@@ -36,28 +148,63 @@ class RealDataDownloader:
     Attributes:
         output_dir: Root directory for downloaded data.
         batch_size: Number of funds to process per API batch.
+        use_http_api: Fetch prices and NAV through the JQData HTTP API instead
+            of the blocking SDK calls.
     """
 
-    def __init__(self, output_dir: str = "./data/real_all_lof", batch_size: int = 50):
+    def __init__(
+        self,
+        output_dir: str = "./data/real_all_lof",
+        batch_size: int = 50,
+        use_http_api: bool = False,
+    ):
         """Initialize downloader.
 
         Args:
             output_dir: Root directory for output data.
             batch_size: Number of funds per batch (default 50 to avoid API limits).
+            use_http_api: If True, issue per-fund HTTP requests concurrently over
+                one pooled keep-alive client. The SDK remains the default.
         """
         if not JQ_AVAILABLE:
             raise ImportError(
                 "jqdatasdk is required for RealDataDownloader. "
                 "Install with: pip install jqdatasdk"
             )
+        if use_http_api and not HTTPX_AVAILABLE:
+            raise ImportError(
+                "httpx is required for use_http_api=True. "
+                "Install with: pip install httpx"
+            )
 
         self.output_dir = Path(output_dir)
         self.batch_size = batch_size
+        self.use_http_api = use_http_api
         self.market_dir = self.output_dir / "market"
         self.nav_dir = self.output_dir / "nav"
         self.config_dir = self.output_dir / "config"
         self._authenticated = False
 
+        # One client (and one event loop to drive it) is shared by every batch
+        # so keep-alive connections survive across requests.
+        self._http_client: Optional["httpx.AsyncClient"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http_token: Optional[str] = None
+        if use_http_api:
+            self._loop = asyncio.new_event_loop()
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                timeout=30.0,
+            )
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections, if any."""
+        if self._http_client is not None:
+            self._loop.run_until_complete(self._http_client.aclose())
+            self._loop.close()
+            self._http_client = None
+            self._loop = None
+
     def authenticate(self, username: str, password: str) -> bool:
         """Authenticate with JoinQuant API.
 
@@ -70,6 +217,12 @@ class RealDataDownloader:
         """
         try:
             jq.auth(username, password)
+            if self._http_client is not None:
+                self._http_token = self._loop.run_until_complete(
+                    self._http_request(
+                        {"method": "get_token", "mob": username, "pwd": password}
+                    )
+                )
             count = jq.get_query_count()
             print(
                 f"[OK] JoinQuant login successful | Quota: {count['spare']}/{count['total']}"
@@ -101,11 +254,17 @@ class RealDataDownloader:
             d.mkdir(parents=True, exist_ok=True)
         print(f"[OK] Directory structure ready: {self.output_dir}")
 
-    def fetch_all_lof_codes(self, reference_date: str) -> List[str]:
+    def fetch_all_lof_codes(
+        self, reference_date: str, force_refresh: bool = False
+    ) -> List[str]:
         """Fetch all LOF fund codes from JoinQuant.
 
+        The fund list is cached in ``config/lof_codes_{reference_date}.parquet``
+        and reused for a day, saving an API round-trip (and quota) on reruns.
+
         Args:
             reference_date: Reference date for fund list (YYYY-MM-DD).
+            force_refresh: Ignore the local cache and query JoinQuant.
 
         Returns:
             List of fund codes (e.g., ['160105.XSHE', '161005.XSHE']).
@@ -113,15 +272,36 @@ class RealDataDownloader:
         print(
             f"\n>>> Fetching all LOF fund codes (reference date: {reference_date})..."
         )
+        cache_path = self.config_dir / f"lof_codes_{reference_date}.parquet"
+        if (
+            not force_refresh
+            and cache_path.exists()
+            and time.time() - cache_path.stat().st_mtime < LOF_CODES_CACHE_TTL
+        ):
+            try:
+                codes = pd.read_parquet(cache_path).index.tolist()
+                print(f"    [OK] Found {len(codes)} LOF funds (cached)")
+                return codes
+            except (OSError, ValueError) as e:
+                # Unreadable cache file: fall through and fetch again
+                print(f"    [WARN] Ignoring unreadable LOF list cache: {e}")
+
         try:
             df = jq.get_all_securities(types=["lof"], date=reference_date)
-            codes = df.index.tolist()
-            print(f"    [OK] Found {len(codes)} LOF funds")
-            return codes
         except Exception as e:
             print(f"[ERROR] Failed to fetch LOF list: {e}")
             return []
 
+        codes = df.index.tolist()
+        # A failed cache write must not discard the fetched list
+        try:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_path)
+        except OSError as e:
+            print(f"    [WARN] Failed to cache LOF list: {e}")
+        print(f"    [OK] Found {len(codes)} LOF funds")
+        return codes
+
     def _get_market_data(
         self, codes: List[str], start_date: str, end_date: str
     ) -> pd.DataFrame:
@@ -187,6 +367,117 @@ class RealDataDownloader:
             print(f"    [WARN] NAV data batch error: {e}")
             return pd.DataFrame()
 
+    async def _http_request(self, payload: dict) -> str:
+        """POST one JQData HTTP API call and return the raw response body.
+
+        Raises:
+            RuntimeError: If the API reports an error in the response body.
+        """
+        resp = await self._http_client.post(JQ_HTTP_API_URL, json=payload)
+        resp.raise_for_status()
+        text = resp.text.strip()
+        if text.startswith("error"):
+            raise RuntimeError(text)
+        return text
+
+    async def _get_market_data_http(
+        self, codes: List[str], start_date: str, end_date: str
+    ) -> pd.DataFrame:
+        """Fetch unadjusted daily OHLCV for a batch of codes via the HTTP API."""
+
+        async def fetch(code: str) -> pd.DataFrame:
+            text = await self._http_request(
+                {
+                    "method": "get_price_period",
+                    "token": self._http_token,
+                    "code": code,
+                    "unit": "1d",
+                    "date": start_date,
+                    "end_date": end_date,
+                }
+            )
+            df = pd.read_csv(io.StringIO(text))
+            df["code"] = code
+            return df
+
+        results = await asyncio.gather(
+            *(fetch(c) for c in codes), return_exceptions=True
+        )
+        frames = []
+        for code, res in zip(codes, results):
+            if isinstance(res, Exception):
+                print(f"    [WARN] Market data error ({code}): {res}")
+            elif not res.empty:
+                frames.append(res)
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True)
+        df["date"] = pd.to_datetime(df["date"])
+        return df[["date", "code", "open", "close", "high", "low", "volume"]]
+
+    async def _get_nav_data_http(
+        self, codes: List[str], start_date: str, end_date: str
+    ) -> pd.DataFrame:
+        """Fetch NAV for a batch of codes via the HTTP API ``run_query`` call."""
+
+        async def fetch(code: str) -> pd.DataFrame:
+            pure = code.split(".")[0]
+            text = await self._http_request(
+                {
+                    "method": "run_query",
+                    "token": self._http_token,
+                    "table": "finance.FUND_NET_VALUE",
+                    "columns": "code,day,net_value",
+                    "conditions": (
+                        f"code#=#{pure}&day#>=#{start_date}&day#<=#{end_date}"
+                    ),
+                    "count": JQ_HTTP_QUERY_LIMIT,
+                }
+            )
+            df = pd.read_csv(io.StringIO(text), dtype={"code": str})
+            df["code"] = code
+            return df
+
+        results = await asyncio.gather(
+            *(fetch(c) for c in codes), return_exceptions=True
+        )
+        frames = []
+        for code, res in zip(codes, results):
+            if isinstance(res, Exception):
+                print(f"    [WARN] NAV data error ({code}): {res}")
+            elif not res.empty:
+                frames.append(res)
+        if not frames:
+            return pd.DataFrame()
+
+        nav_df = pd.concat(frames, ignore_index=True)
+        nav_df = nav_df.rename(columns={"day": "date", "net_value": "nav"})
+        nav_df["date"] = pd.to_datetime(nav_df["date"])
+        return nav_df[["date", "code", "nav"]]
+
+    def _fetch_batch(
+        self, codes: List[str], start_date: str, end_date: str
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Fetch market and NAV data for one batch of codes.
+
+        Returns:
+            Tuple of (price_df, nav_df).
+        """
+        if self._http_client is None:
+            return (
+                self._get_market_data(codes, start_date, end_date),
+                self._get_nav_data(codes, start_date, end_date),
+            )
+
+        async def fetch_both() -> Tuple[pd.DataFrame, pd.DataFrame]:
+            return await asyncio.gather(
+                self._get_market_data_http(codes, start_date, end_date),
+                self._get_nav_data_http(codes, start_date, end_date),
+            )
+
+        return tuple(self._loop.run_until_complete(fetch_both()))
+
     def _process_and_save(
         self, codes: List[str], price_df: pd.DataFrame, nav_df: pd.DataFrame
     ) -> List[str]:
@@ -197,47 +488,64 @@ class RealDataDownloader:
         """
         processed_tickers = []
 
+        # Sort and de-duplicate each batch frame once, then split it; groupby
+        # keeps the row order within groups and every group is already its own
+        # frame, so no per-ticker sort, mask or defensive copy is needed.
+        price_groups = {}
+        if not price_df.empty:
+            price_df = price_df.sort_values(["code", "date"], kind="mergesort")
+            price_groups = dict(iter(price_df.groupby("code", sort=False)))
+
+        nav_groups = {}
+        if not nav_df.empty:
+            nav_df = nav_df.sort_values(["code", "date"], kind="mergesort")
+            nav_df = nav_df.drop_duplicates(subset=["code", "date"], keep="last")
+            nav_groups = dict(iter(nav_df.groupby("code", sort=False)))
+
         for code in codes:
             ticker_pure = code.split(".")[0]
 
             # Process market data
-            if not price_df.empty:
-                df_m = price_df[price_df["code"] == code].copy()
-                if not df_m.empty:
-                    df_m["ticker"] = ticker_pure
-                    df_m = df_m.sort_values("date")
-                    df_m["volume_ma5"] = (
-                        df_m["volume"].rolling(window=5).mean().fillna(df_m["volume"])
-                    )
-
-                    cols = [
-                        "date",
-                        "ticker",
-                        "open",
-                        "high",
-                        "low",
-                        "close",
-                        "volume",
-                        "volume_ma5",
-                    ]
-                    final_cols = [c for c in cols if c in df_m.columns]
-
-                    save_path = self.market_dir / f"{ticker_pure}.parquet"
-                    df_m[final_cols].to_parquet(save_path, index=False)
+            df_m = price_groups.get(code)
+            if df_m is not None:
+                df_m["volume_ma5"] = (
+                    df_m["volume"].rolling(window=5).mean().fillna(df_m["volume"])
+                )
+
+                # Downcast to the compact on-disk dtypes of MARKET_SCHEMA
+                price_cols = [c for c in PRICE_COLUMNS if c in df_m.columns]
+                df_m[price_cols] = df_m[price_cols].astype("float32")
+                df_m["volume_ma5"] = df_m["volume_ma5"].astype("float32")
+                # Missing volume (e.g. before listing) means nothing traded
+                df_m["volume"] = df_m["volume"].fillna(0).astype("int64")
+
+                cols = [
+                    "date",
+                    "open",
+                    "high",
+                    "low",
+                    "close",
+                    "volume",
+                    "volume_ma5",
+                ]
+                final_cols = [c for c in cols if c in df_m.columns]
+
+                save_path = self.market_dir / f"{ticker_pure}.parquet"
+                _write_parquet_if_changed(
+                    df_m[final_cols], save_path, MARKET_SCHEMA, ticker=ticker_pure
+                )
 
             # Process NAV data
-            if not nav_df.empty:
-                df_n = nav_df[nav_df["code"] == code].copy()
-                if not df_n.empty:
-                    df_n["ticker"] = ticker_pure
-                    df_n = df_n.sort_values("date")
-                    df_n = df_n.drop_duplicates(subset=["date"], keep="last")
+            df_n = nav_groups.get(code)
+            if df_n is not None:
+                df_n["nav"] = df_n["nav"].astype("float32")
 
-                    nav_cols = ["date", "ticker", "nav"]
-                    save_path = self.nav_dir / f"{ticker_pure}.parquet"
-                    df_n[nav_cols].to_parquet(save_path, index=False)
+                save_path = self.nav_dir / f"{ticker_pure}.parquet"
+                _write_parquet_if_changed(
+                    df_n[["date", "nav"]], save_path, NAV_SCHEMA, ticker=ticker_pure
+                )
 
-                    processed_tickers.append(ticker_pure)
+                processed_tickers.append(ticker_pure)
 
         return list(set(processed_tickers))
 
@@ -312,6 +620,49 @@ class RealDataDownloader:
         conn.commit()
         conn.close()
 
+    def _bulk_insert_limit_events(self, rows: List[tuple]) -> int:
+        """Insert many limit events in a single transaction.
+
+        Uses one ``executemany`` call and one commit instead of a round-trip
+        and commit per row. Callers should pass large batches (>= 1000 rows)
+        where possible for best throughput.
+
+        Args:
+            rows: Tuples of (ticker, start_date, end_date, max_amount, reason,
+                source_announcement_ids). ``is_open_ended`` is derived by SQLite.
+
+        Returns:
+            Number of rows inserted.
+        """
+        if not rows:
+            return 0
+
+        db_path = self.config_dir / "fund_status.db"
+        conn = sqlite3.connect(db_path)
+        try:
+            # Connection-scoped settings only (the journal mode is stored in
+            # the file, and fund_status.db must stay readable without -wal/-shm
+            # sidecars): NORMAL skips the extra fsyncs of the one big commit,
+            # and the larger page cache keeps the index updates in memory
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    """
+                    INSERT INTO limit_events (
+                        ticker, start_date, end_date, max_amount,
+                        reason, source_announcement_ids
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+        finally:
+            conn.close()
+
+        return len(rows)
+
     def _create_announcement_parses_table(self) -> None:
         """Create announcement_parses table for storing LLM extraction results.
 
@@ -432,8 +783,7 @@ class RealDataDownloader:
             )
 
             # Download data
-            price_df = self._get_market_data(batch_codes, start_date, end_date)
-            nav_df = self._get_nav_data(batch_codes, start_date, end_date)
+            price_df, nav_df = self._fetch_batch(batch_codes, start_date, end_date)
 
             # Save data
             processed = self._process_and_save(batch_codes, price_df, nav_df)
@@ -468,6 +818,7 @@ def download_all_lof(
     end_date: str,
     output_dir: str = "./data/real_all_lof",
     batch_size: int = 50,
+    use_http_api: bool = False,
 ) -> Tuple[int, List[str]]:
     """Convenience function to download all LOF data.
 
@@ -478,13 +829,19 @@ def download_all_lof(
         end_date: End date (YYYY-MM-DD).
         output_dir: Output directory path.
         batch_size: Batch size for API calls.
+        use_http_api: Fetch through the pooled JQData HTTP API client.
 
     Returns:
         Tuple of (total_processed_count, list_of_processed_tickers).
     """
-    downloader = RealDataDownloader(output_dir=output_dir, batch_size=batch_size)
+    downloader = RealDataDownloader(
+        output_dir=output_dir, batch_size=batch_size, use_http_api=use_http_api
+    )
 
-    if not downloader.authenticate(username, password):
-        return 0, []
+    try:
+        if not downloader.authenticate(username, password):
+            return 0, []
 
-    return downloader.download(start_date, end_date)
+        return downloader.download(start_date, end_date)
+    finally:
+        downloader.close()
@@ -2,53 +2,317 @@
 Core data generation logic for LOF mock data.
 """
 
+import hashlib
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from .config import MockConfig
 
+# Numba - optional dependency, JIT-compiles the premium spike scan
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def _evolve_premium_vectorized(
+    u: np.ndarray,
+    norm_small: np.ndarray,
+    norm_spike: np.ndarray,
+    spike_mag: np.ndarray,
+    decay: np.ndarray,
+    p_spike: float,
+    release_thr: float,
+) -> np.ndarray:
+    """Vectorized equivalent of ``_evolve_premium`` for use without numba.
+
+    Normal days are filled in bulk, each spike start is found with a binary
+    search over the trigger draws, and each spike's trajectory is evaluated
+    with ``np.cumprod`` over windows of the decay draws until it first drops
+    below the exit threshold. The cumulative product multiplies in the same
+    order as the scalar loop, so results are bit-identical. The exit test
+    includes the daily noise and is therefore not monotone, which is why a
+    forward scan over windows is used rather than a single searchsorted.
+    """
+    n_days = u.shape[0]
+    premium_rates = norm_small.copy()  # Normal premium fluctuation
+    spike_starts = np.flatnonzero(u < p_spike)
+
+    day = 0
+    while True:
+        k = np.searchsorted(spike_starts, day)
+        if k == len(spike_starts):
+            break
+
+        # Trigger premium spike
+        s = spike_starts[k]
+        premium_rates[s] = spike_mag[s]
+
+        # Mean reversion after spike, in growing windows until exit
+        level = spike_mag[s]
+        pos = s + 1
+        window = 16
+        day = n_days
+        while pos < n_days:
+            end = min(pos + window, n_days)
+            levels = np.cumprod(np.concatenate(([level], decay[pos:end])))[1:]
+            trajectory = levels + norm_spike[pos:end]
+            exits = np.flatnonzero(trajectory < release_thr)
+            if exits.size:
+                stop = pos + exits[0] + 1
+                premium_rates[pos:stop] = trajectory[: exits[0] + 1]
+                day = stop
+                break
+            premium_rates[pos:end] = trajectory
+            level = levels[-1]
+            pos = end
+            window *= 2
+
+    return premium_rates
+
+
+def _ticker_seed(key: str) -> int:
+    """Derive a stable 64-bit RNG seed from a string.
+
+    Unlike the built-in ``hash``, which is salted per interpreter process
+    (PYTHONHASHSEED), this gives the same seed in every run and worker.
+
+    Args:
+        key: Seed key, e.g. the ticker symbol.
+
+    Returns:
+        Non-negative 64-bit integer seed.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(key.encode(), digest_size=8).digest(), "little"
+    )
+
+
+@njit(cache=True)
+def _evolve_premium(
+    u: np.ndarray,
+    norm_small: np.ndarray,
+    norm_spike: np.ndarray,
+    spike_mag: np.ndarray,
+    decay: np.ndarray,
+    p_spike: float,
+    release_thr: float,
+) -> np.ndarray:
+    """Run the two-state (normal/spike) premium process over pre-drawn variates.
+
+    Args:
+        u: Uniform[0, 1) draws deciding whether a spike starts.
+        norm_small: Normal premium noise outside a spike.
+        norm_spike: Normal premium noise during a spike.
+        spike_mag: Initial spike premium magnitudes.
+        decay: Per-day multiplicative spike decay factors.
+        p_spike: Probability of a spike starting on a normal day.
+        release_thr: Premium below which a spike ends.
+
+    Returns:
+        Array of daily premium rates.
+    """
+    n_days = u.shape[0]
+    premium_rates = np.empty(n_days)
+    in_spike = False
+    spike_decay = 0.0
+
+    for i in range(n_days):
+        if not in_spike:
+            if u[i] < p_spike:
+                # Trigger premium spike
+                premium_rates[i] = spike_mag[i]
+                in_spike = True
+                spike_decay = spike_mag[i]
+            else:
+                # Normal premium fluctuation
+                premium_rates[i] = norm_small[i]
+        else:
+            # Mean reversion after spike
+            spike_decay *= decay[i]
+            premium_rates[i] = spike_decay + norm_spike[i]
+
+            # Exit spike mode when premium drops low enough
+            if premium_rates[i] < release_thr:
+                in_spike = False
+
+    return premium_rates
+
+
+@njit(cache=True)
+def _scan_limit_events(
+    premium_rates: np.ndarray,
+    trigger_thr: float,
+    release_thr: float,
+    consecutive_days: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Run the purchase-limit state machine over daily premium rates.
+
+    Args:
+        premium_rates: Daily premium rates.
+        trigger_thr: Premium above which a day counts towards a limit.
+        release_thr: Premium below which an active limit ends.
+        consecutive_days: High-premium days in a row needed to trigger.
+
+    Returns:
+        Tuple of (trigger_days, release_days) index arrays, one entry per
+        event. A release index of -1 marks a limit still open at the end.
+    """
+    n_days = premium_rates.shape[0]
+    trigger_days = np.empty(n_days, dtype=np.int64)
+    release_days = np.empty(n_days, dtype=np.int64)
+    n_events = 0
+
+    in_limit = False
+    high_premium_days = 0
+
+    for i in range(n_days):
+        premium = premium_rates[i]
+        if not in_limit:
+            if premium > trigger_thr:
+                high_premium_days += 1
+                if high_premium_days >= consecutive_days:
+                    in_limit = True
+                    trigger_days[n_events] = i
+                    high_premium_days = 0
+            else:
+                high_premium_days = 0
+        elif premium < release_thr:
+            release_days[n_events] = i
+            n_events += 1
+            in_limit = False
+
+    # Limit extends to end of data
+    if in_limit:
+        release_days[n_events] = -1
+        n_events += 1
+
+    return trigger_days[:n_events], release_days[:n_events]
+
+
+def _find_limit_events(
+    premium_rates: np.ndarray,
+    trigger_thr: float,
+    release_thr: float,
+    consecutive_days: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized equivalent of ``_scan_limit_events`` for use without numba.
+
+    Only O(#events) Python steps are taken: trigger days come from a
+    convolution over the high-premium mask and each release is found with
+    a binary search over the low-premium days.
+    """
+    n_days = len(premium_rates)
+    k = consecutive_days
+    trigger_days: List[int] = []
+    release_days: List[int] = []
+
+    if n_days >= k:
+        # Days closing a window of k consecutive high-premium days; the first
+        # such day of each run is where the limit would trigger
+        high = (premium_rates > trigger_thr).astype(np.int32)
+        full = np.convolve(high, np.ones(k, dtype=np.int32), mode="valid") == k
+        run_start = full & ~np.concatenate(([False], full[:-1]))
+        candidates = np.flatnonzero(run_start) + k - 1
+
+        low = np.flatnonzero(premium_rates < release_thr)
+
+        free_from = 0  # First day counted after the previous limit ended
+        for i in candidates:
+            if i - k + 1 < free_from:
+                # High-premium run began while a limit was still active
+                continue
+            trigger_days.append(i)
+
+            r = np.searchsorted(low, i + 1)
+            if r == len(low):
+                release_days.append(-1)
+                break
+            release_days.append(low[r])
+            free_from = low[r] + 1
+
+    return (
+        np.asarray(trigger_days, dtype=np.int64),
+        np.asarray(release_days, dtype=np.int64),
+    )
+
 
 class NAVGenerator:
     """Generates Net Asset Value (NAV) data using geometric Brownian motion."""
 
     def __init__(self, config: MockConfig):
         self.config = config
+        # Business days (Mon-Fri) are identical for every ticker; build once
+        days = np.arange(
+            np.datetime64(config.start_date, "D"),
+            np.datetime64(config.end_date, "D") + 1,
+        )
+        self._dates = days[np.is_busday(days)].astype("datetime64[ns]")
 
-    def generate(self, ticker: str) -> pd.DataFrame:
+    def generate(self, ticker: str) -> Tuple[np.ndarray, np.ndarray]:
         """Generate NAV time series for a given ticker.
 
         Args:
             ticker: Fund ticker symbol.
 
         Returns:
-            DataFrame with columns: date, ticker, nav
+            Tuple of (dates, nav) arrays; use ``to_table`` to materialize them.
         """
-        dates = pd.bdate_range(
-            start=self.config.start_date,
-            end=self.config.end_date,
-            freq="B",  # Business days only
-        )
+        dates = self._dates  # Business days only
 
         n_days = len(dates)
 
-        # Geometric Brownian Motion for NAV
-        # dS = μ*S*dt + σ*S*dW
-        np.random.seed(hash(ticker) % (2**32))  # Reproducible per ticker
+        # Geometric Brownian Motion for NAV, sampled with the exact solution
+        # S(t) = S0 * exp((mu - sigma^2/2) * t + sigma * W(t)), dt = 1 day
+        rng = np.random.default_rng(_ticker_seed(ticker))  # Reproducible per ticker
+
+        drift = np.float32(self.config.nav_drift)
+        vol = np.float32(self.config.nav_volatility)
+
+        w = np.cumsum(rng.standard_normal(n_days, dtype=np.float32))
+        t = np.arange(1, n_days + 1, dtype=np.float32)
+        log_s = (drift - np.float32(0.5) * vol * vol) * t + vol * w
 
-        returns = np.random.normal(
-            self.config.nav_drift, self.config.nav_volatility, n_days
+        nav_series = np.float32(self.config.initial_nav) * np.exp(
+            log_s, dtype=np.float32
         )
 
-        nav_series = self.config.initial_nav * np.exp(np.cumsum(returns))
+        return dates, nav_series
 
-        df = pd.DataFrame({"date": dates, "ticker": ticker, "nav": nav_series})
+    @staticmethod
+    def to_table(ticker: str, dates: np.ndarray, nav: np.ndarray) -> pa.Table:
+        """Build the Arrow table written to ``nav/{ticker}.parquet``.
 
-        return df
+        Args:
+            ticker: Fund ticker symbol.
+            dates: Trading dates from ``generate``.
+            nav: NAV values from ``generate``.
+
+        Returns:
+            Table with columns: date, ticker, nav
+        """
+        return pa.Table.from_arrays(
+            [
+                pa.array(dates),
+                pa.array([ticker] * len(dates)).dictionary_encode(),
+                pa.array(nav),
+            ],
+            names=["date", "ticker", "nav"],
+        )
 
 
 class PriceGenerator:
@@ -56,64 +320,74 @@ class PriceGenerator:
 
     def __init__(self, config: MockConfig):
         self.config = config
+        # Scratch buffers for the pre-drawn variates, reused across tickers
+        self._z = np.empty((6, 0))
+        self._u = np.empty((3, 0))
 
-    def generate(self, ticker: str, nav_df: pd.DataFrame) -> pd.DataFrame:
+    def generate(self, ticker: str, dates: np.ndarray, nav: np.ndarray) -> pd.DataFrame:
         """Generate market price data based on NAV with premium rates.
 
         Args:
             ticker: Fund ticker symbol.
-            nav_df: DataFrame with NAV data.
+            dates: Trading dates from ``NAVGenerator.generate``.
+            nav: NAV values from ``NAVGenerator.generate``.
 
         Returns:
             DataFrame with columns: date, ticker, open, high, low, close, volume
         """
-        np.random.seed(hash(ticker + "_price") % (2**32))
-
-        n_days = len(nav_df)
-        premium_rates = np.zeros(n_days)
-
-        # Generate premium rates with spike mechanism
-        in_spike = False
-        spike_decay = 0.0
-
-        for i in range(n_days):
-            if not in_spike:
-                # Check for spike event
-                if np.random.random() < self.config.spike_probability:
-                    # Trigger premium spike
-                    premium_rates[i] = np.random.uniform(0.10, 0.25)
-                    in_spike = True
-                    spike_decay = premium_rates[i]
-                else:
-                    # Normal premium fluctuation
-                    premium_rates[i] = np.random.normal(
-                        0.0, self.config.premium_volatility
-                    )
-            else:
-                # Mean reversion after spike
-                spike_decay *= np.random.uniform(0.85, 0.95)  # Decay factor
-                noise = np.random.normal(0.0, self.config.premium_volatility * 0.5)
-                premium_rates[i] = spike_decay + noise
-
-                # Exit spike mode when premium drops low enough
-                if premium_rates[i] < self.config.limit_release_threshold * 1.5:
-                    in_spike = False
+        rng = np.random.default_rng(_ticker_seed(ticker + "_price"))
+
+        n_days = len(nav)
+
+        # Draw every variate with one call per distribution; rows are sliced
+        # out below instead of calling into the generator per quantity.
+        # z: premium noise (normal, spike), open, high, low, volume
+        # u: spike trigger, spike magnitude, spike decay
+        if self._z.shape[1] != n_days:
+            self._z = np.empty((6, n_days))
+            self._u = np.empty((3, n_days))
+        z = rng.standard_normal(out=self._z)
+        u = rng.random(out=self._u)
+
+        # Generate premium rates with spike mechanism. All variates are drawn
+        # up front so the stateful scan runs without per-day RNG calls.
+        vol = self.config.premium_volatility
+        evolve_premium = (
+            _evolve_premium if NUMBA_AVAILABLE else _evolve_premium_vectorized
+        )
+        premium_rates = evolve_premium(
+            u[0],
+            vol * z[0],
+            vol * 0.5 * z[1],
+            0.10 + 0.15 * u[1],
+            0.85 + 0.10 * u[2],  # Decay factor
+            self.config.spike_probability,
+            self.config.limit_release_threshold * 1.5,
+        )
 
         # Calculate close prices based on NAV and premium
-        close_prices = nav_df["nav"].values * (1 + premium_rates)
+        close_prices = nav * (1 + premium_rates)
 
         # Generate OHLC based on close
         intraday_volatility = 0.01  # 1% intraday volatility
 
-        open_prices = close_prices * (
-            1 + np.random.normal(0, intraday_volatility, n_days)
-        )
-        high_prices = np.maximum(open_prices, close_prices) * (
-            1 + np.abs(np.random.normal(0, intraday_volatility * 0.5, n_days))
-        )
-        low_prices = np.minimum(open_prices, close_prices) * (
-            1 - np.abs(np.random.normal(0, intraday_volatility * 0.5, n_days))
-        )
+        # The rows of z are consumed in place to avoid temporaries
+        open_prices = z[2]
+        open_prices *= intraday_volatility
+        open_prices += 1.0
+        open_prices *= close_prices
+
+        high_prices = np.maximum(open_prices, close_prices)
+        high_factor = np.abs(z[3], out=z[3])
+        high_factor *= intraday_volatility * 0.5
+        high_factor += 1.0
+        high_prices *= high_factor
+
+        low_prices = np.minimum(open_prices, close_prices)
+        low_factor = np.abs(z[4], out=z[4])
+        low_factor *= intraday_volatility * 0.5
+        np.subtract(1.0, low_factor, out=low_factor)
+        low_prices *= low_factor
 
         # Generate volume (correlated with premium rate)
         # Higher premium -> higher volume
@@ -121,13 +395,14 @@ class PriceGenerator:
         volume_multiplier = (
             1 + np.abs(premium_rates) * 5
         )  # 5x volume increase at high premium
-        volumes = np.random.lognormal(
-            np.log(base_volume) + np.log(volume_multiplier), 0.5, n_days
-        ).astype(int)
+        log_volume = z[5]
+        log_volume *= 0.5
+        log_volume += np.log(base_volume * volume_multiplier)
+        volumes = np.exp(log_volume, out=log_volume).astype(int)
 
         df = pd.DataFrame(
             {
-                "date": nav_df["date"],
+                "date": dates,
                 "ticker": ticker,
                 "open": open_prices,
                 "high": high_prices,
@@ -153,28 +428,25 @@ class FeeConfigGenerator:
         Args:
             output_path: Path to save fees.csv
         """
-        fee_data = []
-
-        for ticker in self.config.tickers:
-            # Tiered fee structure (common for public funds in China)
-            # Tier 1: < 500k CNY -> 1.5% fee rate
-            # Tier 2: 500k - 2M CNY -> 1.0% fee rate
-            # Tier 3: >= 2M CNY -> 1000 CNY fixed fee
-            # Redemption fee (< 7 days): 1.5%
-
-            fee_data.append(
-                {
-                    "ticker": ticker,
-                    "fee_rate_tier_1": 0.015,  # 1.5%
-                    "fee_limit_1": 500_000.0,  # 50万
-                    "fee_rate_tier_2": 0.010,  # 1.0%
-                    "fee_limit_2": 2_000_000.0,  # 200万
-                    "fee_fixed": 1000.0,  # 固定1000元
-                    "redeem_fee_7d": 0.015,  # 7天内赎回1.5%
-                }
-            )
-
-        df = pd.DataFrame(fee_data)
+        tickers = self.config.tickers
+        n = len(tickers)
+
+        # Tiered fee structure (common for public funds in China)
+        # Tier 1: < 500k CNY -> 1.5% fee rate
+        # Tier 2: 500k - 2M CNY -> 1.0% fee rate
+        # Tier 3: >= 2M CNY -> 1000 CNY fixed fee
+        # Redemption fee (< 7 days): 1.5%
+        df = pd.DataFrame(
+            {
+                "ticker": tickers,
+                "fee_rate_tier_1": np.full(n, 0.015),  # 1.5%
+                "fee_limit_1": np.full(n, 500_000.0),  # 50万
+                "fee_rate_tier_2": np.full(n, 0.010),  # 1.0%
+                "fee_limit_2": np.full(n, 2_000_000.0),  # 200万
+                "fee_fixed": np.full(n, 1000.0),  # 固定1000元
+                "redeem_fee_7d": np.full(n, 0.015),  # 7天内赎回1.5%
+            }
+        )
         df.to_csv(output_path, index=False, encoding="utf-8-sig")
 
 
@@ -183,23 +455,43 @@ class FundStatusGenerator:
 
     def __init__(self, config: MockConfig):
         self.config = config
+        self._conn: Optional[sqlite3.Connection] = None
 
-    def generate(self, ticker: str, price_df: pd.DataFrame, output_db: Path) -> int:
+    def generate(self, ticker: str, price_df: pd.DataFrame) -> int:
         """Generate fund status events and store in SQLite database.
 
+        Uses the connection opened by ``initialize_db``, which must be called
+        once before generating events for any ticker.
+
         Args:
             ticker: Fund ticker symbol.
             price_df: DataFrame with price data including premium_rate column.
-            output_db: Path to SQLite database file.
 
         Returns:
             Number of limit events generated for this ticker.
+
+        Raises:
+            RuntimeError: If ``initialize_db`` has not been called.
         """
-        # Identify limit events based on premium rate
-        limit_events = self._identify_limit_events(ticker, price_df)
+        events = self.identify_limit_events(ticker, price_df)
+        self.store_limit_events(events)
+        return len(events)
 
-        # Store in database
+    def initialize_db(self, output_db: Path) -> None:
+        """Open the database and create the fund status tables if needed.
+
+        The connection is kept open for subsequent ``generate`` and
+        ``store_limit_events`` calls until ``close`` is called.
+
+        Args:
+            output_db: Path to SQLite database file.
+        """
         conn = sqlite3.connect(output_db)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        self._conn = conn
         cursor = conn.cursor()
 
         # Create table if not exists
@@ -276,29 +568,55 @@ class FundStatusGenerator:
             ON limit_event_log(created_at)
         """)
 
-        # Insert limit events with source_announcement_ids (empty array for mock data)
-        for event in limit_events:
-            cursor.execute(
-                """
-                INSERT INTO limit_events (ticker, start_date, end_date, max_amount, reason, source_announcement_ids)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    event["ticker"],
-                    event["start_date"],
-                    event["end_date"],
-                    event["max_amount"],
-                    event["reason"],
-                    "[]",  # Empty JSON array for mock data (no real announcements)
-                ),
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection opened by ``initialize_db``."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def store_limit_events(self, limit_events: List[Dict]) -> None:
+        """Insert limit events in a single transaction.
+
+        Args:
+            limit_events: Event dictionaries from ``identify_limit_events``,
+                possibly spanning several tickers.
+
+        Raises:
+            RuntimeError: If ``initialize_db`` has not been called.
+        """
+        if self._conn is None:
+            raise RuntimeError(
+                "FundStatusGenerator.initialize_db() must be called before "
+                "storing limit events"
             )
 
+        # Empty JSON array for source_announcement_ids (no real announcements)
+        rows = [
+            (
+                event["ticker"],
+                event["start_date"],
+                event["end_date"],
+                event["max_amount"],
+                event["reason"],
+                "[]",
+            )
+            for event in limit_events
+        ]
+
+        conn = self._conn
+        conn.execute("BEGIN")
+        conn.executemany(
+            """
+            INSERT INTO limit_events (ticker, start_date, end_date, max_amount, reason, source_announcement_ids)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            rows,
+        )
         conn.commit()
-        conn.close()
-
-        return len(limit_events)
 
-    def _identify_limit_events(self, ticker: str, price_df: pd.DataFrame) -> List[Dict]:
+    def identify_limit_events(self, ticker: str, price_df: pd.DataFrame) -> List[Dict]:
         """Identify periods when purchase limits should be triggered.
 
         Logic:
@@ -314,64 +632,42 @@ class FundStatusGenerator:
         Returns:
             List of limit event dictionaries.
         """
-        events = []
-
         premium_rates = price_df["premium_rate"].values
         dates = price_df["date"].values
+        n_days = len(premium_rates)
+
+        find_events = _scan_limit_events if NUMBA_AVAILABLE else _find_limit_events
+        trigger_days, release_days = find_events(
+            premium_rates,
+            self.config.limit_trigger_threshold,
+            self.config.limit_release_threshold,
+            self.config.consecutive_days,
+        )
 
-        in_limit = False
-        high_premium_days = 0
-        limit_start = None
-
-        for i, (date, premium) in enumerate(zip(dates, premium_rates)):
-            if not in_limit:
-                # Check if premium exceeds trigger threshold
-                if premium > self.config.limit_trigger_threshold:
-                    high_premium_days += 1
-
-                    # Trigger limit if consecutive days reached
-                    if high_premium_days >= self.config.consecutive_days:
-                        in_limit = True
-                        # Limit starts on next trading day
-                        if i + 1 < len(dates):
-                            limit_start = pd.Timestamp(dates[i + 1]).strftime(
-                                "%Y-%m-%d"
-                            )
-                        else:
-                            limit_start = pd.Timestamp(date).strftime("%Y-%m-%d")
-                        high_premium_days = 0
-                else:
-                    high_premium_days = 0
-            else:
-                # Check if premium falls below release threshold
-                if premium < self.config.limit_release_threshold:
-                    # End limit period
-                    limit_end = pd.Timestamp(date).strftime("%Y-%m-%d")
-
-                    events.append(
-                        {
-                            "ticker": ticker,
-                            "start_date": limit_start,
-                            "end_date": limit_end,
-                            "max_amount": self.config.limit_max_amount,
-                            "reason": f"High premium (>{self.config.limit_trigger_threshold * 100:.0f}%) for {self.config.consecutive_days} consecutive days",
-                        }
-                    )
-
-                    in_limit = False
-                    limit_start = None
-
-        # Handle case where limit extends to end of data
-        # Use None for end_date to represent a genuinely open-ended limit
-        if in_limit and limit_start:
-            events.append(
-                {
-                    "ticker": ticker,
-                    "start_date": limit_start,
-                    "end_date": None,
-                    "max_amount": self.config.limit_max_amount,
-                    "reason": f"High premium (>{self.config.limit_trigger_threshold * 100:.0f}%) for {self.config.consecutive_days} consecutive days",
-                }
-            )
+        reason = f"High premium (>{self.config.limit_trigger_threshold * 100:.0f}%) for {self.config.consecutive_days} consecutive days"
+
+        # Limit starts on next trading day (or the trigger day at the end)
+        start_idx = np.minimum(trigger_days + 1, n_days - 1)
+        open_ended = release_days < 0
+
+        # Format only the event boundaries, in one vectorized call
+        day_strs = np.datetime_as_string(
+            dates[np.concatenate((start_idx, release_days[~open_ended]))].astype(
+                "datetime64[D]"
+            ),
+            unit="D",
+        ).tolist()
+        start_strs = day_strs[: len(start_idx)]
+        end_strs = iter(day_strs[len(start_idx) :])
 
-        return events
+        return [
+            {
+                "ticker": ticker,
+                "start_date": start,
+                # Use None for end_date to represent a genuinely open-ended limit
+                "end_date": None if is_open else next(end_strs),
+                "max_amount": self.config.limit_max_amount,
+                "reason": reason,
+            }
+            for start, is_open in zip(start_strs, open_ended.tolist())
+        ]
@@ -2,8 +2,14 @@
 Main entry point for LOF mock data generation.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from .config import MockConfig
 from .generators import (
@@ -14,6 +20,112 @@ from .generators import (
 )
 
 
+# On-disk market schema: dictionary-encoded ticker, float32 prices, int32 volume
+MARKET_SCHEMA = pa.schema(
+    [
+        ("date", pa.timestamp("ns")),
+        ("ticker", pa.dictionary(pa.int32(), pa.string())),
+        ("open", pa.float32()),
+        ("high", pa.float32()),
+        ("low", pa.float32()),
+        ("close", pa.float32()),
+        ("volume", pa.int32()),
+    ]
+)
+
+# Generators reused by every ticker handled in this process, so their scratch
+# buffers are allocated once per process rather than once per ticker
+_generators: Dict[str, object] = {}
+
+
+def _init_generators(config: MockConfig) -> None:
+    """Create the per-process generators for ``config``.
+    
+    Used as the worker-pool initializer and by the in-process path.
+    
+    Args:
+        config: Configuration used for generation.
+    """
+    _generators.update(
+        config=config,
+        nav=NAVGenerator(config),
+        price=PriceGenerator(config),
+        status=FundStatusGenerator(config),
+    )
+
+
+def _process_one_ticker(
+    ticker: str,
+    config: MockConfig,
+    nav_dir: str,
+    market_dir: str
+) -> Tuple[str, List[Dict], Dict[str, float]]:
+    """Generate and save NAV and market data for one ticker.
+    
+    Runs in a worker process, so it only writes the per-ticker parquet files
+    and returns the limit events instead of touching the shared database.
+    Summary statistics are computed from the in-memory arrays so nothing has
+    to be read back from disk.
+    
+    Args:
+        ticker: Fund ticker symbol.
+        config: Configuration used for generation.
+        nav_dir: Directory for NAV parquet files, as a plain string.
+        market_dir: Directory for market parquet files, as a plain string.
+        
+    Returns:
+        Tuple of (ticker, list of limit event dictionaries, summary statistics).
+    """
+    if _generators.get('config') != config:
+        _init_generators(config)
+    
+    # Generate NAV
+    dates, nav = _generators['nav'].generate(ticker)
+    nav_path = f"{nav_dir}/{ticker}.parquet"
+    pq.write_table(
+        NAVGenerator.to_table(ticker, dates, nav),
+        nav_path,
+        compression="snappy",
+        use_dictionary=True,
+    )
+    
+    # Generate market prices
+    price_df = _generators['price'].generate(ticker, dates, nav)
+    
+    # Save market data (without premium_rate column) with compact dtypes;
+    # the schema selects and casts columns during the Arrow conversion, so
+    # no intermediate column-subset DataFrame is built
+    market_path = f"{market_dir}/{ticker}.parquet"
+    pq.write_table(
+        pa.Table.from_pandas(price_df, schema=MARKET_SCHEMA, preserve_index=False),
+        market_path,
+        compression="snappy",
+        use_dictionary=True,
+    )
+    
+    # Identify fund status events
+    events = _generators['status'].identify_limit_events(ticker, price_df)
+    
+    close = price_df['close'].values
+    premium_rates = price_df['premium_rate'].values
+    stats = {
+        'trading_days': len(dates),
+        'nav_min': float(np.min(nav)),
+        'nav_max': float(np.max(nav)),
+        'close_min': float(np.min(close)),
+        'close_max': float(np.max(close)),
+        'premium_mean': float(np.mean(premium_rates)),
+        'premium_std': float(np.std(premium_rates, ddof=1)),
+        'premium_min': float(np.min(premium_rates)),
+        'premium_max': float(np.max(premium_rates)),
+        'high_premium_days': int(np.sum(premium_rates > config.limit_trigger_threshold)),
+        'market_bytes': os.path.getsize(market_path),
+        'nav_bytes': os.path.getsize(nav_path),
+    }
+    
+    return ticker, events, stats
+
+
 def generate_mock_data(config: Optional[MockConfig] = None) -> None:
     """Generate complete mock dataset for LOF fund backtesting.
     
@@ -52,8 +164,6 @@ def generate_mock_data(config: Optional[MockConfig] = None) -> None:
     config_dir.mkdir(parents=True, exist_ok=True)
     
     # Initialize generators
-    nav_gen = NAVGenerator(config)
-    price_gen = PriceGenerator(config)
     fee_gen = FeeConfigGenerator(config)
     status_gen = FundStatusGenerator(config)
     
@@ -66,36 +176,57 @@ def generate_mock_data(config: Optional[MockConfig] = None) -> None:
     # Initialize database for fund status
     db_path = config_dir / "fund_status.db"
     
-    total_limit_events = 0
-    
-    # Generate data for each ticker
+    # Generate data for each ticker; tickers are independent, so they run in
+    # parallel and only the database write is done here (SQLite has one writer)
     print(f"\n[2/4] Generating NAV and market data for {len(config.tickers)} tickers...")
     
-    for i, ticker in enumerate(config.tickers, 1):
-        print(f"  [{i}/{len(config.tickers)}] Processing {ticker}...")
-        
-        # Generate NAV
-        nav_df = nav_gen.generate(ticker)
-        nav_path = nav_dir / f"{ticker}.parquet"
-        nav_df.to_parquet(nav_path, index=False)
-        
-        # Generate market prices
-        price_df = price_gen.generate(ticker, nav_df)
-        
-        # Save market data (without premium_rate column)
-        market_df = price_df[['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']]
-        market_path = market_dir / f"{ticker}.parquet"
-        market_df.to_parquet(market_path, index=False)
-        
-        print(f"      NAV: {nav_path}")
-        print(f"      Market: {market_path}")
-        
-        # Generate fund status events
-        num_events = status_gen.generate(ticker, price_df, db_path)
-        total_limit_events += num_events
-        
-        if num_events > 0:
-            print(f"      Limit Events: {num_events}")
+    tickers = config.tickers
+    max_workers = min(os.cpu_count() or 1, len(tickers))
+    all_events: List[Dict] = []
+    ticker_stats: Dict[str, Dict[str, float]] = {}
+    
+    # Plain strings once, instead of Path arithmetic per ticker and per write
+    nav_dir_str = os.fspath(nav_dir)
+    market_dir_str = os.fspath(market_dir)
+    args = (
+        tickers,
+        [config] * len(tickers),
+        [nav_dir_str] * len(tickers),
+        [market_dir_str] * len(tickers),
+    )
+    
+    executor = None
+    if max_workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_generators,
+            initargs=(config,),
+        )
+        results = executor.map(_process_one_ticker, *args)
+    else:
+        # Single worker: run in-process and skip the pool start-up cost
+        results = map(_process_one_ticker, *args)
+    
+    try:
+        for i, (ticker, events, stats) in enumerate(results, 1):
+            print(f"  [{i}/{len(tickers)}] Processed {ticker}")
+            print(f"      NAV: {nav_dir_str}/{ticker}.parquet")
+            print(f"      Market: {market_dir_str}/{ticker}.parquet")
+            if events:
+                print(f"      Limit Events: {len(events)}")
+            all_events.extend(events)
+            ticker_stats[ticker] = stats
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    # Open the database only after the workers have exited
+    status_gen.initialize_db(db_path)
+    try:
+        status_gen.store_limit_events(all_events)
+    finally:
+        status_gen.close()
+    total_limit_events = len(all_events)
     
     print(f"\n[3/4] Generating fund status database...")
     print(f"  [OK] Generated: {db_path}")
@@ -104,7 +235,7 @@ def generate_mock_data(config: Optional[MockConfig] = None) -> None:
     # Generate summary statistics
     print(f"\n[4/4] Summary Statistics")
     print("=" * 70)
-    _print_summary_statistics(config, market_dir, nav_dir, total_limit_events)
+    _print_summary_statistics(config, ticker_stats, total_limit_events)
     
     print("=" * 70)
     print("[SUCCESS] Mock data generation completed successfully!")
@@ -113,47 +244,38 @@ def generate_mock_data(config: Optional[MockConfig] = None) -> None:
 
 def _print_summary_statistics(
     config: MockConfig,
-    market_dir: Path,
-    nav_dir: Path,
+    ticker_stats: Dict[str, Dict[str, float]],
     total_limit_events: int
 ) -> None:
     """Print summary statistics of generated data.
     
     Args:
         config: Configuration used for generation.
-        market_dir: Directory containing market data files.
-        nav_dir: Directory containing NAV data files.
+        ticker_stats: Per-ticker statistics returned by ``_process_one_ticker``.
         total_limit_events: Total number of limit events generated.
     """
-    import pandas as pd
-    
     print(f"  Total Tickers: {len(config.tickers)}")
     print(f"  Total Limit Events: {total_limit_events}")
     print(f"  Average Limit Events per Ticker: {total_limit_events / len(config.tickers):.2f}")
     
     # Sample one ticker for detailed stats
     sample_ticker = config.tickers[0]
-    market_df = pd.read_parquet(market_dir / f"{sample_ticker}.parquet")
-    nav_df = pd.read_parquet(nav_dir / f"{sample_ticker}.parquet")
-    
-    # Calculate premium rate for sample ticker
-    merged = market_df.merge(nav_df[['date', 'nav']], on='date')
-    merged['premium_rate'] = (merged['close'] - merged['nav']) / merged['nav']
+    stats = ticker_stats[sample_ticker]
     
     print(f"\n  Sample Ticker: {sample_ticker}")
-    print(f"    Trading Days: {len(market_df)}")
-    print(f"    NAV Range: {nav_df['nav'].min():.4f} - {nav_df['nav'].max():.4f}")
-    print(f"    Price Range: {market_df['close'].min():.2f} - {market_df['close'].max():.2f}")
+    print(f"    Trading Days: {stats['trading_days']}")
+    print(f"    NAV Range: {stats['nav_min']:.4f} - {stats['nav_max']:.4f}")
+    print(f"    Price Range: {stats['close_min']:.2f} - {stats['close_max']:.2f}")
     print(f"    Premium Rate Stats:")
-    print(f"      Mean: {merged['premium_rate'].mean()*100:.2f}%")
-    print(f"      Std Dev: {merged['premium_rate'].std()*100:.2f}%")
-    print(f"      Min: {merged['premium_rate'].min()*100:.2f}%")
-    print(f"      Max: {merged['premium_rate'].max()*100:.2f}%")
-    print(f"      Days > {config.limit_trigger_threshold*100:.0f}%: {(merged['premium_rate'] > config.limit_trigger_threshold).sum()}")
+    print(f"      Mean: {stats['premium_mean']*100:.2f}%")
+    print(f"      Std Dev: {stats['premium_std']*100:.2f}%")
+    print(f"      Min: {stats['premium_min']*100:.2f}%")
+    print(f"      Max: {stats['premium_max']*100:.2f}%")
+    print(f"      Days > {config.limit_trigger_threshold*100:.0f}%: {stats['high_premium_days']}")
     
     print(f"\n  File Sizes:")
-    market_size = sum(f.stat().st_size for f in market_dir.glob("*.parquet"))
-    nav_size = sum(f.stat().st_size for f in nav_dir.glob("*.parquet"))
+    market_size = sum(st['market_bytes'] for st in ticker_stats.values())
+    nav_size = sum(st['nav_bytes'] for st in ticker_stats.values())
     print(f"    Market Data: {market_size / 1024:.2f} KB")
     print(f"    NAV Data: {nav_size / 1024:.2f} KB")
 
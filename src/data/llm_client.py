@@ -6,12 +6,28 @@ structured purchase limit information from fund announcement text.
 
 Setup:
     1. Install Ollama from https://ollama.com
-    2. Pull a suitable model: `ollama pull qwen3:8b` (recommended for Chinese)
+    2. Pull a suitable model: `ollama pull qwen3:8b-q4_K_M` (recommended for
+       Chinese; for higher extraction accuracy at half the decode speed, pull
+       `qwen3:8b-q8_0` and set OLLAMA_MODEL to it)
     3. Ensure Ollama is running: `ollama serve` (or let it auto-start)
 
 Environment Variables:
     OLLAMA_HOST: Base URL for Ollama API (default: http://localhost:11434)
-    OLLAMA_MODEL: Model name to use (default: qwen3:8b)
+    OLLAMA_MODEL: Model name to use (default: qwen3:8b-q4_K_M)
+    OLLAMA_NUM_PARALLEL: How many requests each Ollama server handles at once
+        (server-side setting, default 4 here). parse_many()/aparse_many() read
+        it to size their concurrency, so set it for the client process too.
+    OLLAMA_MAX_LOADED_MODELS: Server-side limit on models kept in memory; keep
+        it >= 1 so the parsing model is not evicted between batches.
+    OLLAMA_KEEP_ALIVE: How long the model stays loaded after a request; sent
+        with every request (default -1, forever).
+    OLLAMA_KV_CACHE_TYPE: Server-side; q8_0 (with OLLAMA_FLASH_ATTENTION=1)
+        halves KV cache memory, leaving room for more parallel slots.
+
+Prompt caching:
+    The system prompt is identical for every request with the same ticker and
+    settings, and the announcement text is whitespace-normalized, so a warm
+    model reuses the evaluated system prompt prefix instead of recomputing it.
 
 Example Usage:
     >>> from src.data.llm_client import LLMClient, parse_announcement
@@ -23,6 +39,9 @@ Example Usage:
     >>> # Using the convenience function
     >>> result = parse_announcement(extracted_text, ticker="161005")
     >>>
+    >>> # Parsing many announcements concurrently
+    >>> results = asyncio.run(client.aparse_many(texts, ticker="161005"))
+    >>>
     >>> print(result)
     [
         {
@@ -37,25 +56,156 @@ Example Usage:
     ]
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+
+if TYPE_CHECKING:
+    import ollama
 
-import ollama
+    from ._llm_cache import EmbeddingCache, FileCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+def _ollama():
+    """Import the ollama SDK on first use (it pulls in pydantic at import time)."""
+    import ollama
+
+    return ollama
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `llm_client.ollama` reachable (e.g. for mock.patch targets) without
+    # importing the SDK when the module itself is imported
+    if name == "ollama":
+        return _ollama()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Configuration constants
-DEFAULT_MODEL = "qwen3:8b"  # Good for Chinese text processing
+# Good for Chinese text processing; the quantization is pinned so decode speed
+# and memory use do not depend on which variant the `qwen3:8b` tag points to
+DEFAULT_MODEL = "qwen3:8b-q4_K_M"
 MAX_TEXT_LENGTH = 8000  # Truncate input text to prevent context window overflow
-
-# System prompt template: instructions, schema, and few-shot examples
-# Contains {ticker_instruction} placeholder filled by _build_system_prompt()
+# Bump whenever output cleaning changes so cached results are not reused
+# across incompatible versions (prompt/schema edits are fingerprinted
+# automatically, see _PROMPT_FINGERPRINT)
+PROMPT_VERSION = "v3"
+
+# JSON schema passed as the chat `format`: Ollama constrains decoding to it, so
+# responses come back as a bare, well-typed array (no fences or prose).
+# The client-side extraction/cleaning below is kept as a fallback for servers
+# that don't enforce schemas and for thinking-model output.
+# Passing a schema dict as `format` needs ollama-python >= 0.4.0 and an Ollama
+# server >= 0.5.0; older servers ignore it. The `think` argument needs
+# ollama-python >= 0.5.0, the floor pinned in requirements.txt.
+_NULLABLE_DATE = {"type": ["string", "null"], "pattern": r"^\d{4}-\d{2}-\d{2}$"}
+RESPONSE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "ticker": {"type": ["string", "null"]},
+            "limit_amount": {"type": ["number", "null"]},
+            "start_date": _NULLABLE_DATE,
+            "end_date": _NULLABLE_DATE,
+            "announcement_type": {
+                "enum": ["complete", "open-start", "end-only", "modify", None]
+            },
+            "is_purchase_limit_announcement": {"type": "boolean"},
+            "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+        },
+        "required": [
+            "ticker",
+            "limit_amount",
+            "start_date",
+            "end_date",
+            "announcement_type",
+            "is_purchase_limit_announcement",
+            "confidence",
+        ],
+    },
+}
+
+# Generation options: deterministic decoding and a cap on output length
+# (a record is ~60 tokens; the cap leaves room for multi-date arrays)
+CHAT_OPTIONS = {"temperature": 0, "num_predict": 1024}
+
+# Precompiled patterns used on every parsed record / response
+_THINK_RX = re.compile(r"<think>.*?</think>", re.DOTALL)
+_FENCE_RX = re.compile(r"```(?:json)?\s*")
+_TRAILING_COMMA_RX = re.compile(r",(\s*[}\]])")
+# raw_decode finds the end of an embedded JSON value in C (orjson has no
+# equivalent), so payloads surrounded by prose need no Python-level scan
+_JSON_DECODER = json.JSONDecoder()
+# Sentences worth keeping when an announcement has to be shortened; a text
+# with none of these words is not a purchase-limit announcement at all
+_KEYWORD_RX = re.compile(r"限购|申购|暂停|恢复|限额|大额|单日")
+_SENTENCE_SPLIT_RX = re.compile(r"(?<=。)")
+_WHITESPACE_RX = re.compile(r"\s+")
+_NUMBER_RX = re.compile(r"\d+(?:\.\d+)?")
+# Amount with an optional unit; the unit group picks the multiplier
+_AMOUNT_RX = re.compile(r"(?P<num>\d+(?:\.\d+)?)\s*(?P<unit>万亿|万|亿)?")
+_AMOUNT_UNITS = {"万": 1e4, "亿": 1e8, "万亿": 1e12}
+# Single pattern covering YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD and YYYY年MM月DD日
+_DATE_RX = re.compile(r"(\d{4})[-/年.](\d{1,2})[-/月.](\d{1,2})日?")
+
+# Embedding model used by the optional semantic cache
+DEFAULT_EMBED_MODEL = "nomic-embed-text"
+
+# Parallel request slots per Ollama server when OLLAMA_NUM_PARALLEL is unset
+DEFAULT_NUM_PARALLEL = 4
+
+# How long the server keeps the model loaded after a request (-1 = forever)
+# unless OLLAMA_KEEP_ALIVE or the keep_alive argument says otherwise
+DEFAULT_KEEP_ALIVE = -1
+
+# Seconds a backend that refused a connection is skipped by the round-robin
+BACKEND_RETRY_SECONDS = 30.0
+
+# httpx options for the sync client: keep enough warm connections for callers
+# that share one LLMClient across a thread pool
+CLIENT_KWARGS = {
+    "limits": httpx.Limits(
+        max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0
+    ),
+}
+
+# httpx options for the AsyncClient used by aparse_many(): enough pooled
+# keep-alive connections for the server's parallel slots
+ASYNC_CLIENT_KWARGS = {
+    "timeout": httpx.Timeout(120.0, connect=10.0),
+    "limits": httpx.Limits(
+        max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0
+    ),
+}
+
+# System prompt template: instructions and schema
+# Contains {ticker_instruction} and {few_shot_block} placeholders filled by
+# _build_system_prompt()
 SYSTEM_PROMPT_TEMPLATE = """You are a financial document parser specializing in Chinese fund announcements.
 
 Your task is to extract purchase limit information from the provided fund announcement text.
@@ -94,52 +244,97 @@ Analyze the text carefully and return a JSON **array** of records with the extra
 - is_purchase_limit_announcement: Set to false if this is not a purchase restriction announcement (e.g., regular report, dividend notice, etc.)
 - confidence: Your confidence in this extraction (0.0-1.0). Use lower values for ambiguous cases.
 
-**Few-shot Examples:**
+{few_shot_block}**Important Notes:**
+- If the text is NOT a purchase limit announcement (e.g., quarterly report, dividend announcement, manager change), set `is_purchase_limit_announcement: false`
+- Use null for any field that is not clearly specified in the text
+- Chinese dates may be in various formats (e.g., "2024年1月15日", "2024-01-15"), normalize to YYYY-MM-DD
+- Amounts may be specified in different units (元, 万元), convert to numeric CNY
+
+Return ONLY the JSON array, no additional explanation."""
+
+
+# Optional few-shot examples (~1300 tokens). Off by default: the schema-constrained
+# output rarely needs them, and every request pays their prompt-eval cost.
+FEW_SHOT_EXAMPLES = """**Few-shot Examples:**
 
 Example 1 (Complete announcement):
 Input: "富国天惠精选成长混合型证券投资基金(LOF)暂停大额申购、转换转入及定期定额投资业务的公告 为保护基金份额持有人的利益，本基金将于2024年1月15日起暂停大额申购，单日单账户累计申购金额不得超过100元，恢复时间另行通知。预计恢复时间为2024年3月1日。"
 Output:
 [
-    {{"ticker": "161005", "limit_amount": 100.0, "start_date": "2024-01-15", "end_date": "2024-03-01", "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.95}}
+    {"ticker": "161005", "limit_amount": 100.0, "start_date": "2024-01-15", "end_date": "2024-03-01", "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.95}
 ]
 
 Example 2 (Open-start announcement):
 Input: "关于限制旗下基金大额申购业务的公告 即日起，本基金单日单账户申购限额调整为1000元，上述限制将维持至2024年6月30日。"
 Output:
 [
-    {{"ticker": null, "limit_amount": 1000.0, "start_date": null, "end_date": "2024-06-30", "announcement_type": "open-start", "is_purchase_limit_announcement": true, "confidence": 0.90}}
+    {"ticker": null, "limit_amount": 1000.0, "start_date": null, "end_date": "2024-06-30", "announcement_type": "open-start", "is_purchase_limit_announcement": true, "confidence": 0.90}
 ]
 
 Example 3 (End-only announcement):
 Input: "关于恢复旗下基金大额申购业务的公告 本基金将于2024年2月1日起恢复大额申购业务，取消此前100元的单日申购限额。"
 Output:
 [
-    {{"ticker": null, "limit_amount": null, "start_date": null, "end_date": "2024-02-01", "announcement_type": "end-only", "is_purchase_limit_announcement": true, "confidence": 0.92}}
+    {"ticker": null, "limit_amount": null, "start_date": null, "end_date": "2024-02-01", "announcement_type": "end-only", "is_purchase_limit_announcement": true, "confidence": 0.92}
 ]
 
 Example 4 (Multiple non-consecutive dates):
 Input: "南方中证500ETF联接基金(LOF)(160119)自2024年4月18日、4月21日、7月1日起暂停大额申购，单日限额100元。"
 Output:
 [
-    {{"ticker": "160119", "limit_amount": 100.0, "start_date": "2024-04-18", "end_date": "2024-04-18", "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.90}},
-    {{"ticker": "160119", "limit_amount": 100.0, "start_date": "2024-04-21", "end_date": "2024-04-21", "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.90}},
-    {{"ticker": "160119", "limit_amount": 100.0, "start_date": "2024-07-01", "end_date": "2024-07-01", "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.90}}
+    {"ticker": "160119", "limit_amount": 100.0, "start_date": "2024-04-18", "end_date": "2024-04-18", "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.90},
+    {"ticker": "160119", "limit_amount": 100.0, "start_date": "2024-04-21", "end_date": "2024-04-21", "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.90},
+    {"ticker": "160119", "limit_amount": 100.0, "start_date": "2024-07-01", "end_date": "2024-07-01", "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.90}
 ]
 
 Example 5 (Multi-ticker — extract only the specified ticker):
 Input (ticker=160127): "南方消费活力灵活配置混合型证券投资基金(160127)及南方中证互联网指数分级证券投资基金(160142)暂停大额申购，限额1000元，自2024年3月1日起。"
 Output:
 [
-    {{"ticker": "160127", "limit_amount": 1000.0, "start_date": "2024-03-01", "end_date": null, "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.92}}
+    {"ticker": "160127", "limit_amount": 1000.0, "start_date": "2024-03-01", "end_date": null, "announcement_type": "complete", "is_purchase_limit_announcement": true, "confidence": 0.92}
 ]
 
-**Important Notes:**
-- If the text is NOT a purchase limit announcement (e.g., quarterly report, dividend announcement, manager change), set `is_purchase_limit_announcement: false`
-- Use null for any field that is not clearly specified in the text
-- Chinese dates may be in various formats (e.g., "2024年1月15日", "2024-01-15"), normalize to YYYY-MM-DD
-- Amounts may be specified in different units (元, 万元), convert to numeric CNY
+"""
 
-Return ONLY the JSON array, no additional explanation."""
+
+# Fingerprint of everything that shapes the model's answer, folded into cache
+# keys so editing the prompt, schema or options invalidates old entries
+_PROMPT_FINGERPRINT = hashlib.blake2b(
+    json.dumps(
+        [SYSTEM_PROMPT_TEMPLATE, FEW_SHOT_EXAMPLES, RESPONSE_SCHEMA, CHAT_OPTIONS],
+        sort_keys=True,
+    ).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+
+def _prefilter(text: str, max_chars: int = MAX_TEXT_LENGTH) -> str:
+    """
+    Shorten an announcement to at most ``max_chars`` characters.
+
+    Texts within the budget are returned unchanged. Longer ones keep the
+    opening sentence (title and lead) plus, in document order, the sentences
+    mentioning purchase limits; legal boilerplate further down is dropped
+    instead of blindly cutting the text at ``max_chars``.
+
+    Args:
+        text: Extracted announcement text
+        max_chars: Character budget for the text sent to the model
+
+    Returns:
+        Text of at most ``max_chars`` characters
+    """
+    if len(text) <= max_chars:
+        return text
+
+    sentences = _SENTENCE_SPLIT_RX.split(text)
+    kept = [sentences[0][:max_chars]]
+    budget = max_chars - len(kept[0])
+    for sentence in sentences[1:]:
+        if len(sentence) <= budget and _KEYWORD_RX.search(sentence):
+            kept.append(sentence)
+            budget -= len(sentence)
+    return "".join(kept)
 
 
 class LLMError(Exception):
@@ -155,32 +350,168 @@ class LLMClient:
     Uses the ollama Python SDK with the Chat API for reliable instruction-following.
 
     Attributes:
-        host: The base URL for the Ollama API
+        host: The base URL for the Ollama API (or the list of URLs)
         model: The model name to use for inference
     """
 
-    def __init__(self, base_url: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Union[str, List[str], None] = None,
+        model: Optional[str] = None,
+        cache: Optional["FileCache"] = None,
+        few_shot: bool = False,
+        max_chars: int = MAX_TEXT_LENGTH,
+        memo_size: int = 256,
+        semantic_cache: Optional["EmbeddingCache"] = None,
+        embed_model: str = DEFAULT_EMBED_MODEL,
+        keyword_filter: bool = True,
+        keep_alive: Union[float, str, None] = None,
+    ):
         """
         Initialize the LLM client.
 
         Args:
             base_url: Ollama API base URL. If None, the ollama SDK uses its own
                       default (reads OLLAMA_HOST env var, falls back to 127.0.0.1:11434).
-            model: Model name to use. Defaults to OLLAMA_MODEL env var or qwen3:8b.
+                      A list of URLs spreads requests round-robin across several
+                      Ollama instances; a backend that refuses connections is
+                      skipped for BACKEND_RETRY_SECONDS.
+            model: Model name to use. Defaults to OLLAMA_MODEL env var or DEFAULT_MODEL.
+            cache: Optional FileCache for parsed results. Identical text (for the
+                   same model, ticker and PROMPT_VERSION) is then parsed only once.
+            few_shot: Include the few-shot examples in the system prompt. Improves
+                      accuracy on unusual announcements at the cost of ~1300 extra
+                      prompt tokens per request.
+            max_chars: Character budget for announcement text. Longer texts are
+                       reduced to their lead plus purchase-limit sentences
+                       (see _prefilter); lower it to cut prompt-eval time.
+            memo_size: Number of parsed results kept in an in-memory LRU in front
+                       of ``cache`` (0 disables it).
+            semantic_cache: Optional EmbeddingCache consulted after an exact-cache
+                            miss. Texts whose ``embed_model`` embedding is close
+                            to a previous one, and which contain exactly the
+                            same numbers (dates, amounts, codes), reuse its
+                            result. Saved on close().
+            embed_model: Ollama embedding model for ``semantic_cache``.
+            keyword_filter: Answer texts containing none of the purchase-limit
+                            keywords (限购, 申购, 暂停, ...) as non-announcements
+                            without calling the model.
+            keep_alive: Passed with every request so the server does not unload
+                        the model between parses; seconds or a duration such
+                        as "30m". Defaults to OLLAMA_KEEP_ALIVE, else -1
+                        (stay loaded).
         """
         self.host = base_url  # None lets ollama SDK pick its default
         self.model = model or os.getenv("OLLAMA_MODEL", DEFAULT_MODEL)
+        self.cache = cache
+        self.few_shot = few_shot
+        self.max_chars = max_chars
+        self.memo_size = memo_size
+        self.semantic_cache = semantic_cache
+        self.embed_model = embed_model
+        self.keyword_filter = keyword_filter
+        if keep_alive is None:
+            keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", DEFAULT_KEEP_ALIVE)
+        try:
+            # Bare numbers from the environment mean seconds
+            keep_alive = float(keep_alive)
+        except (TypeError, ValueError):
+            pass
+        self.keep_alive = keep_alive
+        self._memo: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        # System prompts are constant per (ticker, few_shot); built once each
+        self._system_prompts: Dict[Tuple[Optional[str], bool], str] = {}
+        self._hosts: List[Optional[str]] = (
+            list(base_url) if isinstance(base_url, (list, tuple)) else [base_url]
+        )
+        if not self._hosts:
+            raise ValueError("base_url list must not be empty")
         # Only pass host when explicitly set; otherwise let the SDK resolve it
         # (avoids localhost → IPv6 issues on Windows)
-        if self.host:
-            self._client = ollama.Client(host=self.host)
-        else:
-            self._client = ollama.Client()
+        self._clients = [
+            _ollama().Client(host=h, **CLIENT_KWARGS)
+            if h
+            else _ollama().Client(**CLIENT_KWARGS)
+            for h in self._hosts
+        ]
+        self._client = self._clients[0]
+        # Round-robin state, shared by parse_many() worker threads
+        self._lock = threading.Lock()
+        self._next_index = 0
+        self._down_until = [0.0] * len(self._hosts)
+        # Async clients are created lazily by _get_async_client()
+        self._aclients: Dict[int, "ollama.AsyncClient"] = {}
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info(f"Initialized LLMClient with model {self.model}")
 
+    def close(self) -> None:
+        """Release the pooled HTTP connections of the sync and async clients."""
+        if self.semantic_cache is not None:
+            self.semantic_cache.save()
+        for client in self._clients:
+            client.close()
+        if self._aclients:
+            # The loop that created the async clients may already be closed
+            # (e.g. after asyncio.run); their sockets are then dropped with it
+            if not self._aclient_loop.is_closed():
+                for aclient in self._aclients.values():
+                    self._aclient_loop.run_until_complete(aclient.close())
+            self._aclients = {}
+            self._aclient_loop = None
+
+    def preload(self) -> bool:
+        """
+        Load the model on every backend ahead of the first parse.
+
+        An empty generate request makes Ollama load the model and keep it for
+        ``keep_alive``, so the first announcement does not pay the cold start.
+
+        Returns:
+            True if all backends loaded the model
+        """
+        ok = True
+        for host, client in zip(self._hosts, self._clients):
+            try:
+                client.generate(model=self.model, keep_alive=self.keep_alive)
+            except Exception as e:
+                logger.warning(f"Could not preload {self.model} on {host}: {e}")
+                ok = False
+        return ok
+
+    def _default_parallelism(self) -> int:
+        """Requests worth keeping in flight: OLLAMA_NUM_PARALLEL slots per backend."""
+        slots = int(os.getenv("OLLAMA_NUM_PARALLEL", DEFAULT_NUM_PARALLEL))
+        return slots * len(self._hosts)
+
+    def _next_backend(self) -> int:
+        """Pick the next backend index round-robin, skipping ones marked down."""
+        if len(self._hosts) == 1:
+            return 0
+        with self._lock:
+            now = time.monotonic()
+            n = len(self._hosts)
+            for offset in range(n):
+                index = (self._next_index + offset) % n
+                if self._down_until[index] <= now:
+                    break
+            else:
+                # Everything is marked down: try the next one anyway
+                index = self._next_index % n
+            self._next_index = index + 1
+            return index
+
+    def _mark_down(self, index: int) -> None:
+        if len(self._hosts) > 1:
+            logger.warning(
+                f"Ollama backend {self._hosts[index]} unreachable; "
+                f"skipping it for {BACKEND_RETRY_SECONDS:.0f}s"
+            )
+            with self._lock:
+                self._down_until[index] = time.monotonic() + BACKEND_RETRY_SECONDS
+
     # Keep base_url as an alias for backward compatibility
     @property
-    def base_url(self) -> Optional[str]:
+    def base_url(self) -> Union[str, List[str], None]:
         return self.host
 
     def _build_system_prompt(self, ticker: Optional[str] = None) -> str:
@@ -194,6 +525,14 @@ class LLMClient:
         Returns:
             Formatted system prompt string
         """
+        key = (ticker or None, self.few_shot)
+        prompt = self._system_prompts.get(key)
+        if prompt is None:
+            prompt = self._system_prompts[key] = self._format_system_prompt(ticker)
+        return prompt
+
+    def _format_system_prompt(self, ticker: Optional[str] = None) -> str:
+        """Fill SYSTEM_PROMPT_TEMPLATE for the given ticker (uncached)."""
         if ticker:
             ticker_instruction = (
                 f"You are parsing an announcement that belongs to ticker `{ticker}`. "
@@ -202,7 +541,10 @@ class LLMClient:
             )
         else:
             ticker_instruction = ""
-        return SYSTEM_PROMPT_TEMPLATE.format(ticker_instruction=ticker_instruction)
+        return SYSTEM_PROMPT_TEMPLATE.format(
+            ticker_instruction=ticker_instruction,
+            few_shot_block=FEW_SHOT_EXAMPLES if self.few_shot else "",
+        )
 
     def _build_prompt(self, text: str, ticker: Optional[str] = None) -> str:
         """
@@ -240,7 +582,7 @@ Return ONLY the JSON array, no additional explanation."""
         Returns:
             Text with thinking blocks removed
         """
-        return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+        return _THINK_RX.sub("", text).strip()
 
     @staticmethod
     def _extract_json_from_response(text: str) -> str:
@@ -256,6 +598,54 @@ Return ONLY the JSON array, no additional explanation."""
         Returns:
             Extracted JSON string (may be array or object)
 
+        Raises:
+            ValueError: If no valid JSON can be found
+        """
+        return LLMClient._load_json_from_response(text)[0]
+
+    @staticmethod
+    def _balanced_slice(text: str, start: int) -> Optional[str]:
+        """
+        Return the bracketed span opening at text[start], or None if unclosed.
+
+        Brackets inside JSON string literals are ignored. Only used to salvage
+        payloads that fail to decode.
+        """
+        opener = text[start]
+        closer = "]" if opener == "[" else "}"
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(text)):
+            ch = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == opener:
+                depth += 1
+            elif ch == closer:
+                depth -= 1
+                if depth == 0:
+                    return text[start : i + 1]
+        return None
+
+    @staticmethod
+    def _load_json_from_response(text: str) -> Tuple[str, Any]:
+        """
+        Locate and decode the JSON payload in an LLM response.
+
+        Same search as _extract_json_from_response(), but also returns the
+        decoded value so callers don't decode the payload a second time.
+
+        Returns:
+            Tuple of (extracted JSON string, decoded value)
+
         Raises:
             ValueError: If no valid JSON can be found
         """
@@ -263,50 +653,40 @@ Return ONLY the JSON array, no additional explanation."""
         text = LLMClient._strip_thinking_tokens(text)
 
         # Remove markdown code blocks
-        cleaned = re.sub(r"```json\s*", "", text)
-        cleaned = re.sub(r"```\s*", "", cleaned)
-        cleaned = cleaned.strip()
+        cleaned = _FENCE_RX.sub("", text).strip()
 
         # Try parsing directly first
         try:
-            json.loads(cleaned)
-            return cleaned
-        except json.JSONDecodeError:
+            return cleaned, _json_loads(cleaned)
+        except ValueError:
             pass
 
-        # Try to find a JSON array in the text using bracket matching
-        bracket_start = cleaned.find("[")
-        if bracket_start != -1:
-            depth = 0
-            for i in range(bracket_start, len(cleaned)):
-                if cleaned[i] == "[":
-                    depth += 1
-                elif cleaned[i] == "]":
-                    depth -= 1
-                    if depth == 0:
-                        candidate = cleaned[bracket_start : i + 1]
-                        try:
-                            json.loads(candidate)
-                            return candidate
-                        except json.JSONDecodeError:
-                            break
-
-        # Try to find a JSON object in the text using brace matching
-        brace_start = cleaned.find("{")
-        if brace_start != -1:
-            depth = 0
-            for i in range(brace_start, len(cleaned)):
-                if cleaned[i] == "{":
-                    depth += 1
-                elif cleaned[i] == "}":
-                    depth -= 1
-                    if depth == 0:
-                        candidate = cleaned[brace_start : i + 1]
-                        try:
-                            json.loads(candidate)
-                            return candidate
-                        except json.JSONDecodeError:
-                            break
+        # Try to find a JSON array, then a JSON object, in the surrounding text
+        starts = []
+        for opener in "[{":
+            start = cleaned.find(opener)
+            if start == -1:
+                continue
+            try:
+                value, end = _JSON_DECODER.raw_decode(cleaned, start)
+                return cleaned[start:end], value
+            except ValueError:
+                starts.append(start)
+
+        # Salvage slightly malformed payloads (trailing commas) rather than
+        # discarding them, since re-running the model is far more expensive.
+        # Outermost candidate first so a repaired object wins over its
+        # nested array.
+        for start in sorted(starts):
+            candidate = LLMClient._balanced_slice(cleaned, start)
+            if candidate is None:
+                continue
+            repaired = _TRAILING_COMMA_RX.sub(r"\1", candidate)
+            if repaired != candidate:
+                try:
+                    return repaired, _json_loads(repaired)
+                except ValueError:
+                    pass
 
         raise ValueError(f"No valid JSON found in response")
 
@@ -323,38 +703,58 @@ Return ONLY the JSON array, no additional explanation."""
         if not date_str or date_str.lower() in ("null", "none", ""):
             return None
 
-        # Try common date formats
-        formats = [
-            "%Y-%m-%d",
-            "%Y/%m/%d",
-            "%Y年%m月%d日",
-            "%Y.%m.%d",
-        ]
+        if (
+            len(date_str) == 10
+            and date_str[4] == "-"
+            and date_str[7] == "-"
+            and date_str.isascii()
+            and date_str[:4].isdigit()
+            and date_str[5:7].isdigit()
+            and date_str[8:].isdigit()
+        ):
+            # Already YYYY-MM-DD (what the schema asks for): skip the regex
+            year, month, day = int(date_str[:4]), int(date_str[5:7]), int(date_str[8:])
+        else:
+            match = _DATE_RX.search(date_str)
+            if not match:
+                return None
+            year, month, day = map(int, match.groups())
 
-        for fmt in formats:
+        if year < 1 or not 1 <= month <= 12 or not 1 <= day <= 31:
+            return None
+        # Only month ends need a calendar check (e.g. 2024-02-30)
+        if day > 28:
             try:
-                parsed = datetime.strptime(date_str, fmt)
-                return parsed.strftime("%Y-%m-%d")
+                datetime(year, month, day)
             except ValueError:
-                continue
+                return None
 
-        # Try to extract date using regex as fallback
-        patterns = [
-            r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})",
-            r"(\d{4})年(\d{1,2})月(\d{1,2})日",
-        ]
+        return f"{year:04d}-{month:02d}-{day:02d}"
 
-        for pattern in patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                year, month, day = match.groups()
-                try:
-                    parsed = datetime(int(year), int(month), int(day))
-                    return parsed.strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
+    @staticmethod
+    def _parse_amount(value: Any) -> Optional[float]:
+        """
+        Convert an LLM-supplied amount to CNY.
 
-        return None
+        Numbers pass through; strings such as "100元" or "1.5万元" (seen when
+        the server doesn't enforce RESPONSE_SCHEMA) are parsed with their unit.
+
+        Args:
+            value: Raw limit_amount value
+
+        Returns:
+            Amount in CNY or None if it can't be interpreted
+        """
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            pass
+        if not isinstance(value, str):
+            return None
+        match = _AMOUNT_RX.search(value.replace(",", ""))
+        if not match:
+            return None
+        return float(match["num"]) * _AMOUNT_UNITS.get(match["unit"], 1.0)
 
     def _clean_single_record(self, raw: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -380,10 +780,7 @@ Return ONLY the JSON array, no additional explanation."""
             cleaned["ticker"] = raw["ticker"].strip() or None
 
         if raw.get("limit_amount") is not None:
-            try:
-                cleaned["limit_amount"] = float(raw["limit_amount"])
-            except (ValueError, TypeError):
-                cleaned["limit_amount"] = None
+            cleaned["limit_amount"] = self._parse_amount(raw["limit_amount"])
 
         # Validate dates
         if raw.get("start_date"):
@@ -444,6 +841,339 @@ Return ONLY the JSON array, no additional explanation."""
                 }
             ]
 
+    @staticmethod
+    def _error_result(message: str) -> List[Dict[str, Any]]:
+        """
+        Build the single-record error result returned instead of raising.
+
+        Args:
+            message: Human-readable error description
+
+        Returns:
+            List with one record carrying default field values and an ``error`` key
+        """
+        return [
+            {
+                "ticker": None,
+                "limit_amount": None,
+                "start_date": None,
+                "end_date": None,
+                "announcement_type": None,
+                "is_purchase_limit_announcement": False,
+                "confidence": 0.0,
+                "error": message,
+            }
+        ]
+
+    @staticmethod
+    def _not_announcement_result() -> List[Dict[str, Any]]:
+        """Result for texts rejected by the keyword filter."""
+        return [
+            {
+                "ticker": None,
+                "limit_amount": None,
+                "start_date": None,
+                "end_date": None,
+                "announcement_type": None,
+                "is_purchase_limit_announcement": False,
+                "confidence": 1.0,
+            }
+        ]
+
+    def _build_messages(
+        self, text: str, ticker: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Build the system + user messages for the Chat API.
+
+        Input text is whitespace-normalized and reduced to ``max_chars`` to
+        prevent context overflow.
+
+        Args:
+            text: The extracted text from the PDF announcement
+            ticker: Optional fund ticker code for filtering
+
+        Returns:
+            List of chat messages
+        """
+        # Same normalization as the cache key, then shorten long texts to
+        # prevent context window overflow
+        normalized = _WHITESPACE_RX.sub(" ", text).strip()
+        truncated_text = _prefilter(normalized, self.max_chars)
+        if len(truncated_text) < len(normalized):
+            logger.info(
+                f"Reduced input from {len(normalized)} to "
+                f"{len(truncated_text)} characters"
+            )
+
+        # Build system prompt with ticker filtering
+        system_prompt = self._build_system_prompt(ticker)
+
+        # Build user message with optional ticker hint
+        if ticker:
+            user_content = (
+                f"你正在解析基金代码 {ticker} 的公告。文档内容如下：\n{truncated_text}"
+            )
+        else:
+            user_content = f"文档内容如下：\n{truncated_text}"
+
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content},
+        ]
+
+    def _cache_key(self, text: str, ticker: Optional[str] = None) -> str:
+        """
+        Cache key for a (model, prompt, options, ticker, text) combination.
+
+        Whitespace is normalized first so re-extracted PDFs that differ only in
+        line breaks or spacing share an entry.
+        """
+        normalized = _WHITESPACE_RX.sub(" ", text).strip()
+        return hashlib.blake2b(
+            f"{self.model}|{PROMPT_VERSION}|{_PROMPT_FINGERPRINT}|"
+            f"{int(self.few_shot)}|{self.max_chars}|{ticker or ''}|"
+            f"{normalized}".encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+    def _memo_get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            cached = self._memo.get(key)
+            if cached is None:
+                return None
+            self._memo.move_to_end(key)
+        # Copy so callers can't mutate the cached records
+        return [dict(r) for r in cached]
+
+    def _memo_set(self, key: str, result: List[Dict[str, Any]]) -> None:
+        if self.memo_size <= 0:
+            return
+        with self._lock:
+            self._memo[key] = [dict(r) for r in result]
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def _cache_get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        cached = self._memo_get(key)
+        if cached is None and self.cache is not None:
+            cached = self.cache.get(self.model, key)
+            if cached is not None:
+                self._memo_set(key, cached)
+        return cached
+
+    def _cache_set(self, key: str, result: List[Dict[str, Any]]) -> None:
+        # Error results are transient (connection, timeout...) - never cache them
+        if any(r.get("error") for r in result):
+            return
+        self._memo_set(key, result)
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(self.model, key, result)
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry: {e}")
+
+    def _semantic_signature(self, text: str, ticker: Optional[str]) -> str:
+        """
+        Exact-match part of a semantic cache entry.
+
+        Besides the prompt settings it lists every number in the text the model
+        sees, so announcements that only differ in dates or amounts never
+        share a result however similar their wording.
+        """
+        numbers = ",".join(_NUMBER_RX.findall(_prefilter(text, self.max_chars)))
+        return (
+            f"{self.model}|{PROMPT_VERSION}|{_PROMPT_FINGERPRINT}|"
+            f"{int(self.few_shot)}|{ticker or ''}|{numbers}"
+        )
+
+    def _semantic_get(
+        self, response: Any, text: str, ticker: Optional[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Look up an embed() response in the semantic cache."""
+        hit = self.semantic_cache.lookup(
+            response["embeddings"][0], self._semantic_signature(text, ticker)
+        )
+        return None if hit is None else [dict(r) for r in hit]
+
+    def _semantic_set(
+        self,
+        response: Any,
+        text: str,
+        ticker: Optional[str],
+        result: List[Dict[str, Any]],
+    ) -> None:
+        if response is None or any(r.get("error") for r in result):
+            return
+        self.semantic_cache.add(
+            response["embeddings"][0], self._semantic_signature(text, ticker), result
+        )
+
+    def _do_parse(self, response: Any) -> List[Dict[str, Any]]:
+        """
+        Turn a Chat API response into cleaned records.
+
+        Shared by the sync and async parse paths.
+
+        Args:
+            response: Chat API response (mapping with ``message.content``)
+
+        Returns:
+            List of cleaned records, or a single error record on invalid JSON
+        """
+        # Extract the response content
+        llm_response_text = response["message"]["content"]
+        logger.debug(f"Raw LLM response length: {len(llm_response_text)} chars")
+
+        # Schema-constrained output is parsed directly; the repairs (thinking
+        # tokens, code fences) only run for servers that ignore format=
+        try:
+            _, parsed = self._load_json_from_response(llm_response_text)
+        except ValueError as e:
+            logger.error(f"Failed to extract JSON from LLM response: {e}")
+            logger.debug(f"Raw response: {llm_response_text[:500]}")
+            return self._error_result(f"Invalid JSON in LLM response: {e}")
+
+        # Clean and validate the output (returns List[Dict])
+        cleaned = self._clean_output(parsed)
+
+        logger.info(
+            f"Successfully parsed announcement: {len(cleaned)} record(s), "
+            f"ticker={cleaned[0]['ticker']}, "
+            f"type={cleaned[0]['announcement_type']}, "
+            f"is_limit={cleaned[0]['is_purchase_limit_announcement']}"
+        )
+
+        return cleaned
+
+    def _handle_error(
+        self, e: Exception, timeout: int, host: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Map an exception raised during a chat request to an error result.
+
+        Args:
+            e: The exception raised by the Ollama client
+            timeout: Request timeout in seconds (for the error message)
+            host: Backend the request was sent to (for the error message)
+
+        Returns:
+            Single error record describing the failure
+        """
+        if isinstance(e, _ollama().ResponseError):
+            logger.error(f"Ollama API error: {e}")
+            return self._error_result(f"Ollama API error: {str(e)}")
+        if isinstance(e, ConnectionError):
+            host_display = host or "default (127.0.0.1:11434)"
+            logger.error(f"Failed to connect to Ollama at {host_display}: {e}")
+            return self._error_result(
+                f"Connection error: Cannot connect to Ollama at {host_display}. "
+                f"Ensure Ollama is installed and running. Visit https://ollama.com for setup instructions."
+            )
+        if isinstance(e, TimeoutError):
+            logger.error(f"Request to Ollama timed out after {timeout}s: {e}")
+            return self._error_result(
+                f"Timeout error: Request took longer than {timeout} seconds"
+            )
+        logger.error(f"Unexpected error during parsing: {e}")
+        return self._error_result(f"Unexpected error: {str(e)}")
+
+    def _prepare(
+        self, text: str, ticker: Optional[str], caller: str
+    ) -> Union[List[Dict[str, Any]], Tuple[str, List[Dict[str, str]]]]:
+        """
+        Steps shared by the sync and async parse paths before any request.
+
+        Args:
+            text: The extracted text from the PDF announcement
+            ticker: Optional fund ticker code for filtering
+            caller: Name of the parse method (for the empty-input warning)
+
+        Returns:
+            A finished result (empty input, no limit keywords or a cache hit),
+            or the cache key and chat messages for a request
+        """
+        if not text or not text.strip():
+            logger.warning(f"Empty text provided to {caller}")
+            return self._error_result("Empty input text")
+
+        if self.keyword_filter and not _KEYWORD_RX.search(text):
+            logger.debug("No purchase-limit keywords, skipping LLM call")
+            return self._not_announcement_result()
+
+        key = self._cache_key(text, ticker)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug("LLM cache hit")
+            return cached
+
+        return key, self._build_messages(text, ticker)
+
+    def _semantic_lookup(
+        self, key: str, embedding: Any, text: str, ticker: Optional[str]
+    ) -> Tuple[Any, Optional[List[Dict[str, Any]]]]:
+        """
+        Look up an embed() response in the semantic cache.
+
+        Returns:
+            The embedding (None when it is missing or unusable) and the cached
+            result, which is also stored under ``key`` on a hit
+        """
+        if embedding is None:
+            return None, None
+        try:
+            cached = self._semantic_get(embedding, text, ticker)
+        except Exception as e:
+            logger.warning(f"Embedding failed, skipping semantic cache: {e}")
+            return None, None
+        if cached is not None:
+            logger.debug("LLM semantic cache hit")
+            self._cache_set(key, cached)
+        return embedding, cached
+
+    def _chat_kwargs(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Keyword arguments for a sync or async chat() request."""
+        return {
+            "model": self.model,
+            "messages": messages,
+            "format": RESPONSE_SCHEMA,
+            "options": CHAT_OPTIONS,
+            "think": False,
+            "keep_alive": self.keep_alive,
+        }
+
+    def _chat_error(
+        self, e: Exception, index: int, attempt: int, timeout: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Handle an exception from a chat request to backend ``index``.
+
+        Returns:
+            None when the backend refused the connection and another one is
+            left to try, otherwise the error result
+        """
+        if isinstance(e, ConnectionError):
+            self._mark_down(index)
+            if attempt + 1 < len(self._hosts):
+                return None
+        return self._handle_error(e, timeout, self._hosts[index])
+
+    def _finish(
+        self,
+        key: str,
+        embedding: Any,
+        text: str,
+        ticker: Optional[str],
+        result: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Store a parsed result in the exact and semantic caches."""
+        self._cache_set(key, result)
+        if embedding is not None:
+            self._semantic_set(embedding, text, ticker, result)
+        return result
+
     def parse_announcement(
         self, text: str, ticker: Optional[str] = None, timeout: int = 120
     ) -> List[Dict[str, Any]]:
@@ -472,149 +1202,213 @@ Return ONLY the JSON array, no additional explanation."""
         Raises:
             LLMError: If the API call fails or returns an invalid response
         """
-        if not text or not text.strip():
-            logger.warning("Empty text provided to parse_announcement")
-            return [
-                {
-                    "ticker": None,
-                    "limit_amount": None,
-                    "start_date": None,
-                    "end_date": None,
-                    "announcement_type": None,
-                    "is_purchase_limit_announcement": False,
-                    "confidence": 0.0,
-                    "error": "Empty input text",
-                }
-            ]
+        prepared = self._prepare(text, ticker, "parse_announcement")
+        if isinstance(prepared, list):
+            return prepared
+        key, messages = prepared
 
-        # Truncate long texts to prevent context window overflow
-        truncated_text = text[:MAX_TEXT_LENGTH]
-        if len(text) > MAX_TEXT_LENGTH:
-            logger.info(
-                f"Truncated input from {len(text)} to {MAX_TEXT_LENGTH} characters"
-            )
+        embedding = None
+        if self.semantic_cache is not None:
+            try:
+                embedding = self._clients[self._next_backend()].embed(
+                    model=self.embed_model, input=[_prefilter(text, self.max_chars)]
+                )
+            except Exception as e:
+                logger.warning(f"Embedding failed, skipping semantic cache: {e}")
+            embedding, cached = self._semantic_lookup(key, embedding, text, ticker)
+            if cached is not None:
+                return cached
+
+        # With several backends, a refused connection moves on to the next one
+        for attempt in range(len(self._hosts)):
+            index = self._next_backend()
+            try:
+                logger.debug(f"Sending chat request to Ollama")
+                response = self._clients[index].chat(**self._chat_kwargs(messages))
+                result = self._do_parse(response)
+                break
+            except LLMError:
+                raise
+            except Exception as e:
+                error = self._chat_error(e, index, attempt, timeout)
+                if error is not None:
+                    return error
+
+        return self._finish(key, embedding, text, ticker, result)
+
+    def parse_many(
+        self,
+        texts: List[str],
+        ticker: Optional[str] = None,
+        workers: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Parse several announcements concurrently from synchronous code.
 
-        # Build system prompt with ticker filtering
-        system_prompt = self._build_system_prompt(ticker)
+        Cache hits are resolved up front; the remaining texts are sent from a
+        thread pool over the shared client.
 
-        # Build user message with optional ticker hint
-        if ticker:
-            user_content = (
-                f"你正在解析基金代码 {ticker} 的公告。文档内容如下：\n{truncated_text}"
-            )
-        else:
-            user_content = f"文档内容如下：\n{truncated_text}"
+        Args:
+            texts: Extracted announcement texts
+            ticker: Optional fund ticker code applied to every text
+            workers: Number of concurrent requests (default:
+                     OLLAMA_NUM_PARALLEL per backend, see _default_parallelism)
 
-        # Build messages for the Chat API (system + user separation)
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_content},
+        Returns:
+            One result list per input text, in input order. A failure on one
+            text yields an error record for that text only.
+        """
+        keys = [self._cache_key(t, ticker) for t in texts]
+        results: List[Optional[List[Dict[str, Any]]]] = [
+            self._memo_get(k) for k in keys
         ]
+        misses = [i for i, r in enumerate(results) if r is None]
+        if misses and self.cache is not None:
+            hits = self.cache.get_many(self.model, [keys[i] for i in misses])
+            for i in misses:
+                results[i] = hits.get(keys[i])
+            misses = [i for i in misses if results[i] is None]
+        if not misses:
+            return results
+
+        def _parse_one(text: str) -> List[Dict[str, Any]]:
+            try:
+                return self.parse_announcement(text, ticker=ticker)
+            except Exception as e:
+                logger.error(f"Unexpected error during parsing: {e}")
+                return self._error_result(f"Unexpected error: {str(e)}")
+
+        # Texts with the same cache key (e.g. a re-posted announcement) are
+        # parsed once and the result is shared
+        by_key: Dict[str, List[int]] = {}
+        for i in misses:
+            by_key.setdefault(keys[i], []).append(i)
+        unique = [indices[0] for indices in by_key.values()]
+
+        workers = workers or self._default_parallelism()
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique)))) as pool:
+            parsed = pool.map(_parse_one, [texts[i] for i in unique])
+            for first, result in zip(unique, parsed):
+                results[first] = result
+                for i in by_key[keys[first]][1:]:
+                    results[i] = [dict(r) for r in result]
+
+        return results
+
+    def _get_async_client(self, index: int = 0) -> "ollama.AsyncClient":
+        """
+        Return the AsyncClient for backend ``index`` bound to the running loop.
 
-        try:
-            logger.debug(f"Sending chat request to Ollama")
-            response = self._client.chat(
-                model=self.model,
-                messages=messages,
-                format="json",
-            )
+        httpx connection pools are tied to the loop that created them, so new
+        clients are built when called from a different loop (e.g. successive
+        ``asyncio.run`` calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient_loop is not loop:
+            self._aclients = {}
+            self._aclient_loop = loop
+        aclient = self._aclients.get(index)
+        if aclient is None:
+            host = self._hosts[index]
+            if host:
+                aclient = _ollama().AsyncClient(host=host, **ASYNC_CLIENT_KWARGS)
+            else:
+                aclient = _ollama().AsyncClient(**ASYNC_CLIENT_KWARGS)
+            self._aclients[index] = aclient
+        return aclient
+
+    async def aparse_announcement(
+        self, text: str, ticker: Optional[str] = None, timeout: int = 120
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of parse_announcement().
 
-            # Extract the response content
-            llm_response_text = response["message"]["content"]
-            logger.debug(f"Raw LLM response length: {len(llm_response_text)} chars")
+        Uses ollama.AsyncClient so several announcements can be in flight at
+        once; the Ollama server processes up to OLLAMA_NUM_PARALLEL of them
+        concurrently.
 
-            # Extract JSON from the response (handles thinking tokens, code blocks)
+        Args:
+            text: The extracted text from the PDF announcement
+            ticker: Optional fund ticker code for filtering results
+            timeout: Request timeout in seconds (default: 120)
+
+        Returns:
+            List of cleaned records (same shape as parse_announcement())
+        """
+        prepared = self._prepare(text, ticker, "aparse_announcement")
+        if isinstance(prepared, list):
+            return prepared
+        key, messages = prepared
+
+        embedding = None
+        if self.semantic_cache is not None:
+            try:
+                embedding = await self._get_async_client(self._next_backend()).embed(
+                    model=self.embed_model, input=[_prefilter(text, self.max_chars)]
+                )
+            except Exception as e:
+                logger.warning(f"Embedding failed, skipping semantic cache: {e}")
+            embedding, cached = self._semantic_lookup(key, embedding, text, ticker)
+            if cached is not None:
+                return cached
+
+        # With several backends, a refused connection moves on to the next one
+        for attempt in range(len(self._hosts)):
+            index = self._next_backend()
             try:
-                json_str = self._extract_json_from_response(llm_response_text)
-                parsed = json.loads(json_str)
-            except (ValueError, json.JSONDecodeError) as e:
-                logger.error(f"Failed to extract JSON from LLM response: {e}")
-                logger.debug(f"Raw response: {llm_response_text[:500]}")
-                return [
-                    {
-                        "ticker": None,
-                        "limit_amount": None,
-                        "start_date": None,
-                        "end_date": None,
-                        "announcement_type": None,
-                        "is_purchase_limit_announcement": False,
-                        "confidence": 0.0,
-                        "error": f"Invalid JSON in LLM response: {e}",
-                    }
-                ]
-
-            # Clean and validate the output (returns List[Dict])
-            cleaned = self._clean_output(parsed)
+                logger.debug(f"Sending async chat request to Ollama")
+                response = await self._get_async_client(index).chat(
+                    **self._chat_kwargs(messages)
+                )
+                result = self._do_parse(response)
+                break
+            except LLMError:
+                raise
+            except Exception as e:
+                error = self._chat_error(e, index, attempt, timeout)
+                if error is not None:
+                    return error
+
+        return self._finish(key, embedding, text, ticker, result)
+
+    async def aparse_many(
+        self,
+        texts: List[str],
+        ticker: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Parse several announcements concurrently.
 
-            logger.info(
-                f"Successfully parsed announcement: {len(cleaned)} record(s), "
-                f"ticker={cleaned[0]['ticker']}, "
-                f"type={cleaned[0]['announcement_type']}, "
-                f"is_limit={cleaned[0]['is_purchase_limit_announcement']}"
-            )
+        At most ``concurrency`` requests are in flight at a time, so the
+        server's parallel slots stay busy without queueing extra requests.
 
-            return cleaned
+        Args:
+            texts: Extracted announcement texts
+            ticker: Optional fund ticker code applied to every text
+            concurrency: Maximum number of simultaneous requests (default:
+                         OLLAMA_NUM_PARALLEL per backend, see _default_parallelism)
+
+        Returns:
+            One result list per input text, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency or self._default_parallelism())
+
+        async def _parse_one(text: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.aparse_announcement(text, ticker=ticker)
+
+        return list(await asyncio.gather(*(_parse_one(t) for t in texts)))
 
-        except ollama.ResponseError as e:
-            logger.error(f"Ollama API error: {e}")
-            return [
-                {
-                    "ticker": None,
-                    "limit_amount": None,
-                    "start_date": None,
-                    "end_date": None,
-                    "announcement_type": None,
-                    "is_purchase_limit_announcement": False,
-                    "confidence": 0.0,
-                    "error": f"Ollama API error: {str(e)}",
-                }
-            ]
-        except ConnectionError as e:
-            host_display = self.host or "default (127.0.0.1:11434)"
-            logger.error(f"Failed to connect to Ollama at {host_display}: {e}")
-            return [
-                {
-                    "ticker": None,
-                    "limit_amount": None,
-                    "start_date": None,
-                    "end_date": None,
-                    "announcement_type": None,
-                    "is_purchase_limit_announcement": False,
-                    "confidence": 0.0,
-                    "error": f"Connection error: Cannot connect to Ollama at {host_display}. "
-                    f"Ensure Ollama is installed and running. Visit https://ollama.com for setup instructions.",
-                }
-            ]
-        except TimeoutError as e:
-            logger.error(f"Request to Ollama timed out after {timeout}s: {e}")
-            return [
-                {
-                    "ticker": None,
-                    "limit_amount": None,
-                    "start_date": None,
-                    "end_date": None,
-                    "announcement_type": None,
-                    "is_purchase_limit_announcement": False,
-                    "confidence": 0.0,
-                    "error": f"Timeout error: Request took longer than {timeout} seconds",
-                }
-            ]
-        except LLMError:
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error during parsing: {e}")
-            return [
-                {
-                    "ticker": None,
-                    "limit_amount": None,
-                    "start_date": None,
-                    "end_date": None,
-                    "announcement_type": None,
-                    "is_purchase_limit_announcement": False,
-                    "confidence": 0.0,
-                    "error": f"Unexpected error: {str(e)}",
-                }
-            ]
+
+@lru_cache(maxsize=8)
+def _get_client(
+    base_url: Union[str, Tuple[str, ...], None], model: Optional[str]
+) -> LLMClient:
+    """Return a process-wide LLMClient for (base_url, model), created on first use."""
+    if isinstance(base_url, tuple):
+        base_url = list(base_url)
+    return LLMClient(base_url=base_url, model=model)
 
 
 def parse_announcement(
@@ -623,8 +1417,9 @@ def parse_announcement(
     """
     Convenience function to parse announcement text using default client.
 
-    This function creates a new LLMClient instance with default configuration
-    and parses the provided text.
+    Clients are shared per (base_url, model), so repeated calls reuse warm
+    HTTP connections. Other kwargs (cache, few_shot, ...) get a one-off client
+    that is closed after the call.
 
     Args:
         text: The extracted text from the PDF announcement
@@ -640,8 +1435,18 @@ def parse_announcement(
         >>> print(result[0]['is_purchase_limit_announcement'])
         True
     """
+    if set(kwargs) <= {"base_url", "model"}:
+        base_url = kwargs.get("base_url")
+        if isinstance(base_url, list):
+            base_url = tuple(base_url)
+        client = _get_client(base_url, kwargs.get("model"))
+        return client.parse_announcement(text, ticker=ticker)
+
     client = LLMClient(**kwargs)
-    return client.parse_announcement(text, ticker=ticker)
+    try:
+        return client.parse_announcement(text, ticker=ticker)
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
@@ -668,9 +1473,9 @@ if __name__ == "__main__":
         print(f"Error: File not found: {args.text_file}")
         sys.exit(1)
 
-    # Read the text file
-    with open(args.text_file, "r", encoding="utf-8") as f:
-        text = f.read()
+    # Read the text file (binary read + decode skips newline translation)
+    with open(args.text_file, "rb") as f:
+        text = f.read().decode("utf-8", errors="replace")
 
     print(f"Processing file: {args.text_file}")
     print(f"Text length: {len(text)} characters")
@@ -683,7 +1488,10 @@ if __name__ == "__main__":
         result = parse_announcement(text, ticker=args.ticker)
 
         print(f"\nExtracted {len(result)} record(s):")
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        if ORJSON_AVAILABLE:
+            print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        else:
+            print(json.dumps(result, ensure_ascii=False, indent=2))
 
     except LLMError as e:
         print(f"\nError: {e}")
@@ -5,12 +5,110 @@ Reads market data, NAV, limit events, and fees from disk and provides
 unified data access for backtesting.
 """
 
+import hashlib
+import os
+import pickle
 import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 import pandas as pd
 import numpy as np
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+# Columns read from each parquet source; other columns are never loaded
+MARKET_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+NAV_COLUMNS = ["date", "nav"]
+
+# Upper bound on threads used by DataLoader.load_bundles
+MAX_LOAD_WORKERS = 16
+
+# Shared pool for reading a bundle's NAV file alongside its market file;
+# created on first use so importing the module starts no threads
+_read_pool: Optional[ThreadPoolExecutor] = None
+_read_pool_lock = threading.Lock()
+
+
+def _get_read_pool() -> ThreadPoolExecutor:
+    """Return the shared parquet read pool, creating it on first use."""
+    global _read_pool
+    with _read_pool_lock:
+        if _read_pool is None:
+            _read_pool = ThreadPoolExecutor(
+                max_workers=MAX_LOAD_WORKERS, thread_name_prefix="parquet-read"
+            )
+        return _read_pool
+
+
+def _read_parquet_columns(path: Path, columns: List[str]) -> pd.DataFrame:
+    """Read ``columns`` of a single parquet file, memory-mapped.
+
+    ParquetFile skips the dataset discovery done by pq.read_table, which
+    dominates for the small per-ticker files; pre_buffer coalesces the
+    column chunk reads.
+    """
+    with pq.ParquetFile(path, memory_map=True, pre_buffer=True) as pf:
+        return pf.read(columns=columns).to_pandas()
+
+
+def _slice_dates(
+    df: pd.DataFrame, start_date: Optional[str], end_date: Optional[str]
+) -> pd.DataFrame:
+    """Select rows from start_date through end_date (inclusive).
+
+    Same rows as ``df.loc[start_date:end_date]``, including partial-string
+    bounds such as ``'2024-02'`` covering the whole month; on a sorted index
+    slice_indexer locates the bounds by binary search.
+    """
+    return df.iloc[df.index.slice_indexer(start_date, end_date)]
+
+
+def _parquet_stems(directory: Path) -> set:
+    """Return the stems of the ``*.parquet`` files in ``directory``.
+
+    Uses ``os.scandir`` so the file type comes from the directory listing
+    itself, with no per-entry stat call or Path object.
+    """
+    suffix = ".parquet"
+    with os.scandir(directory) as entries:
+        return {
+            entry.name[: -len(suffix)]
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        }
+
+
+def _latest_parquet_date(path: Path) -> Optional[pd.Timestamp]:
+    """Return the latest ``date`` in a parquet file, or None if it is empty.
+
+    Uses the row-group max statistics from the file footer, so no column
+    data is decoded; files written without statistics fall back to reading
+    the date column.
+    """
+    with pq.ParquetFile(path, memory_map=True) as pf:
+        meta = pf.metadata
+        latest = None
+        for rg in range(meta.num_row_groups):
+            row_group = meta.row_group(rg)
+            if row_group.num_rows == 0:
+                continue
+            column = next(
+                row_group.column(i)
+                for i in range(row_group.num_columns)
+                if row_group.column(i).path_in_schema == "date"
+            )
+            stats = column.statistics
+            if stats is None or not stats.has_min_max:
+                dates = pf.read(columns=["date"]).column(0).to_pandas()
+                return pd.Timestamp(pd.to_datetime(dates).max())
+            rg_max = pd.Timestamp(stats.max)
+            if latest is None or rg_max > latest:
+                latest = rg_max
+        return latest
 
 
 class DataLoader:
@@ -18,17 +116,54 @@ class DataLoader:
 
     Attributes:
         data_dir: Root directory containing mock data.
-        _fees_cache: Cached fee configuration DataFrame.
+        cache_dir: Directory for cached bundles and fees, or None to disable.
+        memo_size: Number of bundles kept in memory (0 disables it).
+        _market_dir, _nav_dir, _db_path, _fees_path: Source locations under
+            data_dir, resolved once.
+        _fees_cache: Cached fee configuration per ticker.
+        _limits_cache: Cached limit events per ticker as
+            (start_dates, end_dates, max_amounts) arrays.
+        _limits_stamp: Size/mtime of the limit events database that
+            _limits_cache was read from.
+        _bundle_memo: LRU of full-history bundles keyed by
+            (ticker, source file stamp).
     """
 
-    def __init__(self, data_dir: str = "./data/mock"):
+    def __init__(
+        self,
+        data_dir: str = "./data/mock",
+        cache_dir: Optional[str] = None,
+        memo_size: int = 64,
+    ):
         """Initialize DataLoader with data directory.
 
         Args:
             data_dir: Path to directory containing mock data.
+            cache_dir: Optional directory for feather copies of processed
+                bundles. A bundle is rebuilt only when its market, NAV or
+                limit events file has changed since it was cached. The
+                parsed fees.csv is cached there too.
+            memo_size: Number of processed bundles kept in memory, so repeated
+                loads of a ticker (e.g. parameter sweeps) skip all file I/O
+                while the source files are unchanged. 0 disables it.
         """
         self.data_dir = Path(data_dir)
-        self._fees_cache: Optional[pd.DataFrame] = None
+        self._market_dir = self.data_dir / "market"
+        self._nav_dir = self.data_dir / "nav"
+        self._db_path = self.data_dir / "config" / "fund_status.db"
+        self._fees_path = self.data_dir / "config" / "fees.csv"
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.memo_size = memo_size
+        self._fees_cache: Optional[Dict[str, Dict[str, float]]] = None
+        self._limits_cache: Optional[
+            Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]
+        ] = None
+        self._limits_stamp: Optional[str] = None
+        self._bundle_memo: "OrderedDict[Tuple[str, str], pd.DataFrame]" = (
+            OrderedDict()
+        )
+        # Guards lazy loading of the caches above when bundles load in threads
+        self._cache_lock = threading.Lock()
 
         # Validate directory structure
         required_dirs = ["market", "nav", "config"]
@@ -58,55 +193,182 @@ class DataLoader:
         Raises:
             FileNotFoundError: If market or NAV data files don't exist.
         """
-        # Load market data
-        market_path = self.data_dir / "market" / f"{ticker}.parquet"
+        market_path = self._market_dir / f"{ticker}.parquet"
         if not market_path.exists():
             raise FileNotFoundError(f"Market data not found: {market_path}")
-        df_market = pd.read_parquet(market_path)
-
-        # Load NAV data
-        nav_path = self.data_dir / "nav" / f"{ticker}.parquet"
+        nav_path = self._nav_dir / f"{ticker}.parquet"
         if not nav_path.exists():
             raise FileNotFoundError(f"NAV data not found: {nav_path}")
-        df_nav = pd.read_parquet(nav_path)
+
+        stamp = self._source_stamp(market_path, nav_path)
+        df = self._memo_get((ticker, stamp))
+        if df is None:
+            if self.cache_dir is None:
+                df = self._build_bundle(ticker, market_path, nav_path)
+            else:
+                df = self._load_cached_bundle(ticker, stamp, market_path, nav_path)
+            self._memo_set((ticker, stamp), df)
+
+        # Apply date filtering if specified
+        if start_date is not None or end_date is not None:
+            df = _slice_dates(df, start_date, end_date)
+
+        if self.memo_size:
+            # Callers add columns; keep the memoized frame untouched
+            df = df.copy()
+
+        # Attach fee configuration as DataFrame attributes
+        fees = self.load_fees(ticker)
+        df.attrs.update(fees)
+
+        return df
+
+    def _build_bundle(
+        self, ticker: str, market_path: Path, nav_path: Path
+    ) -> pd.DataFrame:
+        """Read, join and enrich the market and NAV data of one ticker.
+
+        Returns:
+            Full-history bundle (see load_bundle), without fee attributes.
+        """
+        # The two files are independent and pyarrow releases the GIL, so
+        # read NAV on the shared pool while this thread reads market data
+        nav_future = _get_read_pool().submit(
+            _read_parquet_columns, nav_path, NAV_COLUMNS
+        )
+        df_market = _read_parquet_columns(market_path, MARKET_COLUMNS)
+        df_nav = nav_future.result()
 
         # Set date as index for both DataFrames
         df_market = df_market.set_index("date")
         df_nav = df_nav.set_index("date")
 
         # Ensure index is DatetimeIndex for proper matching in backtest
-        df_market.index = pd.to_datetime(df_market.index)
-        df_nav.index = pd.to_datetime(df_nav.index)
-
-        # Merge market and NAV data on date index
-        df = pd.merge(
-            df_market[["open", "high", "low", "close", "volume"]],
-            df_nav[["nav"]],
-            left_index=True,
-            right_index=True,
-            how="inner",
-        )
-
-        # Calculate premium rate
-        df["premium_rate"] = (df["close"] - df["nav"]) / df["nav"]
+        # (timestamp columns already arrive as one; only strings need parsing)
+        if not isinstance(df_market.index, pd.DatetimeIndex):
+            df_market.index = pd.to_datetime(df_market.index, cache=True)
+        if not isinstance(df_nav.index, pd.DatetimeIndex):
+            df_nav.index = pd.to_datetime(df_nav.index, cache=True)
+
+        # Join market and NAV data on date index. concat is the faster
+        # index intersection but needs unique dates; join handles duplicates
+        if df_market.index.is_unique and df_nav.index.is_unique:
+            df = pd.concat([df_market, df_nav], axis=1, join="inner")
+        else:
+            df = df_market.join(df_nav, how="inner")
+
+        # Calculate premium rate on the raw arrays (no index alignment needed)
+        close = df["close"].to_numpy()
+        nav = df["nav"].to_numpy()
+        df["premium_rate"] = (close - nav) / nav
 
         # Load and resample limit events to daily series
         daily_limits = self._resample_limits_to_daily(ticker, df.index)
         df["daily_limit"] = daily_limits
 
-        # Apply forward fill to handle any NaN values
-        df = df.ffill()
+        # Forward fill NaN values, touching only the columns that have any
+        # (source gaps such as missing volume; usually none after the join)
+        gap_cols = df.columns[df.isna().to_numpy().any(axis=0)]
+        if len(gap_cols):
+            df[gap_cols] = df[gap_cols].ffill()
 
-        # Apply date filtering if specified
-        if start_date is not None or end_date is not None:
-            df = df.loc[start_date:end_date]
+        return df
 
-        # Attach fee configuration as DataFrame attributes
-        fees = self.load_fees(ticker)
-        df.attrs.update(fees)
+    @staticmethod
+    def _file_stamp(path: Path) -> str:
+        """Size and modification time of ``path`` ("" if it does not exist)."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return ""
+        return f"{st.st_size}:{st.st_mtime_ns}"
+
+    def _source_stamp(self, market_path: Path, nav_path: Path) -> str:
+        """Stamp of every file a bundle is built from; changes on any edit."""
+        paths = (market_path, nav_path, self._db_path)
+        return "|".join(map(self._file_stamp, paths))
+
+    def _memo_get(self, key: Tuple[str, str]) -> Optional[pd.DataFrame]:
+        with self._cache_lock:
+            df = self._bundle_memo.get(key)
+            if df is not None:
+                self._bundle_memo.move_to_end(key)
+            return df
+
+    def _memo_set(self, key: Tuple[str, str], df: pd.DataFrame) -> None:
+        if not self.memo_size:
+            return
+        with self._cache_lock:
+            # Drop the entry of an older version of the same ticker
+            for old_key in [k for k in self._bundle_memo if k[0] == key[0]]:
+                del self._bundle_memo[old_key]
+            self._bundle_memo[key] = df
+            while len(self._bundle_memo) > self.memo_size:
+                self._bundle_memo.popitem(last=False)
+
+    def _load_cached_bundle(
+        self, ticker: str, stamp: str, market_path: Path, nav_path: Path
+    ) -> pd.DataFrame:
+        """Return the bundle from cache_dir, building and storing it on a miss.
+
+        Cache files are named after a hash of the source files' sizes and
+        modification times (``stamp``), so any change to them is a miss.
+        """
+        digest = hashlib.blake2b(stamp.encode(), digest_size=8).hexdigest()
+        cache_path = self.cache_dir / f"{ticker}_{digest}.feather"
 
+        try:
+            table = feather.read_table(cache_path, memory_map=True)
+            return table.to_pandas().set_index("date")
+        except (OSError, ValueError):
+            pass
+
+        df = self._build_bundle(ticker, market_path, nav_path)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob(f"{ticker}_*.feather"):
+                stale.unlink(missing_ok=True)
+            tmp_path = cache_path.with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            df.reset_index().to_feather(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # caching is best effort
         return df
 
+    def load_bundles(
+        self,
+        tickers: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Load bundles for several tickers concurrently.
+
+        Parquet reads release the GIL, so bundles are loaded on a thread pool.
+
+        Args:
+            tickers: Fund ticker symbols.
+            start_date: Optional start date filter (format: 'YYYY-MM-DD').
+            end_date: Optional end date filter (format: 'YYYY-MM-DD').
+
+        Returns:
+            Dictionary mapping ticker to its bundle (see load_bundle), in the
+            order of ``tickers``.
+
+        Raises:
+            FileNotFoundError: If market or NAV data is missing for any ticker.
+        """
+        if not tickers:
+            return {}
+
+        workers = min(MAX_LOAD_WORKERS, len(tickers))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            bundles = pool.map(
+                lambda t: self.load_bundle(t, start_date, end_date), tickers
+            )
+            return dict(zip(tickers, bundles))
+
     # Default fee configuration for LOF funds
     DEFAULT_FEES: Dict[str, float] = {
         "fee_rate_tier_1": 0.015,
@@ -138,28 +400,114 @@ class DataLoader:
             Returns default fees if ticker not found in configuration.
         """
         # Load and cache fees CSV on first call
-        if self._fees_cache is None:
-            fees_path = self.data_dir / "config" / "fees.csv"
-            if not fees_path.exists():
-                # No fee config file, use defaults for all tickers
-                return self.DEFAULT_FEES.copy()
-            self._fees_cache = pd.read_csv(fees_path)
-            # Convert ticker column to string for consistent comparison
-            self._fees_cache["ticker"] = self._fees_cache["ticker"].astype(str)
-
-        # Filter for the specific ticker
-        ticker_fees = self._fees_cache[self._fees_cache["ticker"] == str(ticker)]
-
-        if ticker_fees.empty:
+        with self._cache_lock:
+            if self._fees_cache is None:
+                fees_path = self._fees_path
+                if not fees_path.exists():
+                    # No fee config file, use defaults for all tickers
+                    return self.DEFAULT_FEES.copy()
+                if self.cache_dir is not None:
+                    self._fees_cache = self._load_cached_fees(fees_path)
+                else:
+                    self._fees_cache = self._read_fees(fees_path)
+
+        fee_dict = self._fees_cache.get(str(ticker))
+        if fee_dict is None:
             # Ticker not in config, return defaults
             return self.DEFAULT_FEES.copy()
 
-        # Convert to dictionary (first row only)
-        fee_dict = ticker_fees.iloc[0].to_dict()
-        # Remove ticker from dict as it's not a fee parameter
-        fee_dict.pop("ticker", None)
+        return fee_dict.copy()
+
+    @staticmethod
+    def _read_fees(fees_path: Path) -> Dict[str, Dict[str, float]]:
+        """Parse fees.csv into a dict of fee configurations keyed by ticker."""
+        fees = pd.read_csv(fees_path)
+        # Convert ticker column to string for consistent comparison
+        fees["ticker"] = fees["ticker"].astype(str)
+        # Index by ticker, keeping the first row of duplicated tickers
+        fees = fees.drop_duplicates("ticker").set_index("ticker")
+        return fees.to_dict("index")
 
-        return fee_dict
+    def _load_cached_fees(self, fees_path: Path) -> Dict[str, Dict[str, float]]:
+        """Return the parsed fees from cache_dir, parsing and storing on a miss.
+
+        Like the bundle cache, the file name carries a hash of fees.csv's
+        size and modification time, so editing the CSV is a miss.
+        """
+        stamp = self._file_stamp(fees_path)
+        digest = hashlib.blake2b(stamp.encode(), digest_size=8).hexdigest()
+        cache_path = self.cache_dir / f"fees_{digest}.pkl"
+
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        fees = self._read_fees(fees_path)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob("fees_*.pkl"):
+                stale.unlink(missing_ok=True)
+            tmp_path = cache_path.with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp_path, "wb") as f:
+                pickle.dump(fees, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # caching is best effort
+        return fees
+
+    def _load_limit_events(
+        self,
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Load the limit_events table and group it by ticker.
+
+        The table is read once and re-read only when the database file
+        changes.
+
+        Returns:
+            Dictionary mapping ticker to (start_dates, end_dates, max_amounts)
+            arrays in table order. Empty if there is no limit events database.
+        """
+        stamp = self._file_stamp(self._db_path)
+        with self._cache_lock:
+            if self._limits_cache is None or stamp != self._limits_stamp:
+                self._limits_cache = self._read_limit_events()
+                self._limits_stamp = stamp
+            return self._limits_cache
+
+    def _read_limit_events(
+        self,
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Read and group the limit_events table (see _load_limit_events)."""
+        db_path = self._db_path
+        if not db_path.exists():
+            # No limit events database, all tickers unlimited
+            return {}
+
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute(
+                "SELECT ticker, start_date, end_date, max_amount FROM limit_events"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        grouped: Dict[str, List[tuple]] = {}
+        for ticker, *event in rows:
+            grouped.setdefault(str(ticker), []).append(event)
+
+        limits = {}
+        for ticker, events in grouped.items():
+            start_col, end_col, amount_col = zip(*events)
+            limits[ticker] = (
+                pd.to_datetime(list(start_col)).values,
+                pd.to_datetime(list(end_col)).values,
+                np.array(amount_col, dtype=float),
+            )
+        return limits
 
     def _resample_limits_to_daily(
         self, ticker: str, date_index: pd.DatetimeIndex
@@ -177,52 +525,42 @@ class DataLoader:
         Returns:
             Series indexed by date with daily_limit values.
         """
-        # Initialize all dates with no limit (infinity)
-        daily_limits = pd.Series(float("inf"), index=date_index, name="daily_limit")
-
-        # Load limit events from SQLite
-        db_path = self.data_dir / "config" / "fund_status.db"
-        if not db_path.exists():
-            # No limit events database, return all unlimited
-            return daily_limits
-
-        conn = sqlite3.connect(db_path)
-
-        # Query limit events for this ticker
-        query = """
-            SELECT start_date, end_date, max_amount
-            FROM limit_events
-            WHERE ticker = ?
-        """
-
-        try:
-            df_limits = pd.read_sql(query, conn, params=(ticker,))
-        finally:
-            conn.close()
-
-        # If no limit events found, return all unlimited
-        if df_limits.empty:
-            return daily_limits
-
-        # Convert date columns to datetime
-        df_limits["start_date"] = pd.to_datetime(df_limits["start_date"])
-        df_limits["end_date"] = pd.to_datetime(df_limits["end_date"])
+        events = self._load_limit_events().get(str(ticker))
+
+        # If no limit events found, return all unlimited (infinity)
+        if events is None:
+            return pd.Series(float("inf"), index=date_index, name="daily_limit")
+
+        start_dates, end_dates, max_amounts = events
+
+        # Locate each event's date range with binary search on the sorted
+        # index, then fill the slices in event order (later events win)
+        dates = date_index.values
+        order = None
+        if not date_index.is_monotonic_increasing:
+            order = np.argsort(dates, kind="stable")
+            dates = dates[order]
+
+        starts = np.searchsorted(dates, start_dates, "left")
+        # Open-ended limits (NULL/NaT end_date) apply to all dates >= start_date
+        ends = np.where(
+            np.isnat(end_dates),
+            len(dates),
+            np.searchsorted(dates, end_dates, "right"),
+        )
+        valid = ~np.isnat(start_dates)
 
-        # For each limit event, set daily_limit for dates in range
-        for _, event in df_limits.iterrows():
-            start = event["start_date"]
-            end = event["end_date"]
-            max_amount = event["max_amount"]
+        limits = np.full(len(dates), np.inf)
+        for start, end, max_amount, ok in zip(starts, ends, max_amounts, valid):
+            if ok:
+                limits[start:end] = max_amount
 
-            # Create mask for dates within this limit period
-            # Handle open-ended limits (NULL/NaT end_date) - applies to all dates >= start_date
-            if pd.isna(end):
-                mask = date_index >= start
-            else:
-                mask = (date_index >= start) & (date_index <= end)
-            daily_limits.loc[mask] = max_amount
+        if order is not None:
+            unsorted = np.empty_like(limits)
+            unsorted[order] = limits
+            limits = unsorted
 
-        return daily_limits
+        return pd.Series(limits, index=date_index, name="daily_limit")
 
     def list_available_tickers(self) -> List[str]:
         """Discover all tickers available in the data directory.
@@ -233,12 +571,30 @@ class DataLoader:
         Returns:
             Sorted list of ticker codes available in the data directory.
         """
-        market_dir = self.data_dir / "market"
-        nav_dir = self.data_dir / "nav"
-
-        market_tickers = {f.stem for f in market_dir.glob("*.parquet")}
-        nav_tickers = {f.stem for f in nav_dir.glob("*.parquet")}
+        market_tickers = _parquet_stems(self._market_dir)
+        nav_tickers = _parquet_stems(self._nav_dir)
 
         # Only return tickers that have both market and nav data
         valid_tickers = market_tickers & nav_tickers
         return sorted(valid_tickers)
+
+    def list_tickers_with_data(self, after_date: str) -> List[str]:
+        """List available tickers with market data on or after a date.
+
+        Only parquet footers are read: each file's latest date comes from
+        its row-group statistics (see _latest_parquet_date).
+
+        Args:
+            after_date: Cutoff date (format: 'YYYY-MM-DD'), inclusive.
+
+        Returns:
+            Sorted subset of list_available_tickers().
+        """
+        cutoff = pd.Timestamp(after_date)
+
+        tickers = []
+        for ticker in self.list_available_tickers():
+            latest = _latest_parquet_date(self._market_dir / f"{ticker}.parquet")
+            if latest is not None and latest >= cutoff:
+                tickers.append(ticker)
+        return tickers
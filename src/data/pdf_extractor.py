@@ -5,15 +5,27 @@ Uses pdfplumber for superior Chinese text support compared to PyPDF2.
 Handles multi-page PDFs with page markers and graceful error handling.
 """
 
+import hashlib
 import logging
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import pdfplumber
 
+if TYPE_CHECKING:
+    from ._llm_cache import FileCache
+
 logger = logging.getLogger(__name__)
 
+_SPACES_RX = re.compile(r" +")
+
+# FileCache namespace for extracted text; bump when _clean_text or the page
+# marker format changes so stale entries are not reused
+_CACHE_NAMESPACE = "pdf_text_v1"
+
 
 class PDFExtractionError(Exception):
     """Raised when PDF extraction fails."""
@@ -27,7 +39,7 @@ def _clean_text(text: str) -> str:
 
     - Normalize whitespace (multiple spaces -> single)
     - Preserve Chinese punctuation
-    - Remove excessive newlines but keep paragraph structure
+    - Strip each line and drop blank ones
 
     Args:
         text: Raw extracted text
@@ -39,31 +51,64 @@ def _clean_text(text: str) -> str:
         return ""
 
     # Replace multiple spaces with single space
-    import re
-
-    text = re.sub(r" +", " ", text)
+    text = _SPACES_RX.sub(" ", text)
 
-    # Replace 3+ newlines with 2 newlines (preserve paragraph breaks)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # Strip each line and rejoin the non-empty ones in a single pass (this
+    # also removes blank-line runs, so no separate newline collapsing)
+    return "\n".join(filter(None, map(str.strip, text.split("\n"))))
 
-    # Remove leading/trailing whitespace from each line
-    lines = [line.strip() for line in text.split("\n")]
-
-    # Rejoin non-empty lines
-    text = "\n".join(line for line in lines if line)
-
-    return text.strip()
 
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages ``[start, stop)`` (0-based).
 
-def extract_pdf_text(pdf_path: Union[Path, str]) -> dict:
+    Runs in a worker process: each worker opens the PDF once and parses
+    only its own contiguous slice of pages.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return [pdf.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _extract_pages_parallel(
+    pdf_path: Path, page_count: int, max_workers: int
+) -> List[str]:
+    """Extract all pages across a process pool, preserving page order."""
+    workers = min(max_workers, page_count)
+    chunk = -(-page_count // workers)  # ceil division
+    bounds = [(s, min(s + chunk, page_count)) for s in range(0, page_count, chunk)]
+    with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+        futures = [
+            pool.submit(_extract_page_range, str(pdf_path), s, e) for s, e in bounds
+        ]
+        return [text for future in futures for text in future.result()]
+
+
+def extract_pdf_text(
+    pdf_path: Union[Path, str],
+    max_workers: Optional[int] = None,
+    cache: Optional["FileCache"] = None,
+) -> dict:
     """
     Extract text from a PDF file using pdfplumber.
 
     pdfplumber is chosen over PyPDF2 for superior Chinese text handling
     and better support for financial documents with tables.
 
+    Page layout analysis is pure Python and CPU-bound, so long documents
+    can be split across worker processes with ``max_workers``. The default
+    extracts sequentially, which is cheaper for the typical 1-3 page notice
+    (and when many PDFs are already being processed concurrently).
+
+    Announcements are often re-posted under new file names, so results can
+    be cached by content: with ``cache``, the file bytes are hashed and a
+    hit skips pdfplumber entirely.
+
     Args:
         pdf_path: Path to the PDF file (Path object or string)
+        max_workers: Number of worker processes for page extraction
+                     (None or < 2 extracts sequentially)
+        cache: Optional FileCache keyed by a hash of the PDF bytes. Only
+               successful extractions are stored.
 
     Returns:
         Dict with keys:
@@ -93,6 +138,16 @@ def extract_pdf_text(pdf_path: Union[Path, str]) -> dict:
             result["error"] = error_msg
             return result
 
+        cache_key = None
+        if cache is not None:
+            digest = hashlib.blake2b(pdf_path.read_bytes(), digest_size=16)
+            cache_key = digest.hexdigest()
+            cached = cache.get(_CACHE_NAMESPACE, cache_key)
+            if cached is not None:
+                result.update(success=True, text=cached["text"], pages=cached["pages"])
+                logger.info(f"Using cached text for PDF: {pdf_path}")
+                return result
+
         # Open and extract text using pdfplumber
         all_pages_text = []
         page_count = 0
@@ -100,15 +155,20 @@ def extract_pdf_text(pdf_path: Union[Path, str]) -> dict:
         with pdfplumber.open(pdf_path) as pdf:
             page_count = len(pdf.pages)
 
-            for i, page in enumerate(pdf.pages, 1):
-                # Extract text from page
-                page_text = page.extract_text()
+            if max_workers and max_workers > 1 and page_count > 1:
+                page_texts = None  # extracted below, after closing the file
+            else:
+                page_texts = [page.extract_text() for page in pdf.pages]
+
+        if page_texts is None:
+            page_texts = _extract_pages_parallel(pdf_path, page_count, max_workers)
 
-                if page_text:
-                    all_pages_text.append(page_text)
-                    # Add page marker between pages
-                    if i < page_count:
-                        all_pages_text.append(f"\n--- Page {i} ---\n")
+        for i, page_text in enumerate(page_texts, 1):
+            if page_text:
+                all_pages_text.append(page_text)
+                # Add page marker between pages
+                if i < page_count:
+                    all_pages_text.append(f"\n--- Page {i} ---\n")
 
         # Combine all pages
         raw_text = "\n".join(all_pages_text)
@@ -120,6 +180,16 @@ def extract_pdf_text(pdf_path: Union[Path, str]) -> dict:
         result["text"] = cleaned_text
         result["pages"] = page_count
 
+        if cache_key is not None:
+            try:
+                cache.set(
+                    _CACHE_NAMESPACE,
+                    cache_key,
+                    {"text": cleaned_text, "pages": page_count},
+                )
+            except OSError as e:
+                logger.warning(f"Could not cache extracted text: {e}")
+
         logger.info(f"Successfully extracted text from {page_count} pages: {pdf_path}")
 
     except pdfplumber.exceptions.PDFException as e:
@@ -154,6 +224,13 @@ if __name__ == "__main__":
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose logging"
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for page extraction (default: sequential)",
+    )
 
     args = parser.parse_args()
 
@@ -164,7 +241,7 @@ if __name__ == "__main__":
     )
 
     # Extract text
-    result = extract_pdf_text(args.pdf_path)
+    result = extract_pdf_text(args.pdf_path, max_workers=args.workers)
 
     if result["success"]:
         output = f"""Successfully extracted text from {result["pages"]} pages.
@@ -4,13 +4,20 @@ Backtesting engine module.
 Provides account management, backtest execution, and result analysis.
 """
 
-from src.engine.account import Account, PendingSettlement
-from src.engine.backtest import BacktestEngine, BacktestResult, calculate_subscription_fee
+from src.engine.account import Account, PendingSettlement, build_settle_dates
+from src.engine.backtest import (
+    BacktestEngine,
+    BacktestResult,
+    calculate_subscription_fee,
+    get_fee_tiers,
+)
 
 __all__ = [
     'Account',
     'PendingSettlement',
+    'build_settle_dates',
     'BacktestEngine',
     'BacktestResult',
     'calculate_subscription_fee',
+    'get_fee_tiers',
 ]
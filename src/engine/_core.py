@@ -0,0 +1,212 @@
+"""
+Compiled daily loop for BacktestEngine.run.
+
+The loop works on dense (T, N) market arrays (day x ticker) and mirrors the
+pure-Python path in BacktestEngine.run step for step, including the order of
+floating-point operations, so both produce the same results.
+"""
+
+import numpy as np
+
+# Numba - optional dependency, JIT-compiles the backtest loop
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Trade action codes in the core's trade table
+ACTION_SELL = 0
+ACTION_BUY = 1
+
+# Columns of the core's trade table
+TRADE_DAY, TRADE_ACTION, TRADE_TICKER, TRADE_SHARES = 0, 1, 2, 3
+TRADE_PRICE, TRADE_AMOUNT, TRADE_FEE, TRADE_NET_AMOUNT = 4, 5, 6, 7
+N_TRADE_COLUMNS = 8
+
+
+@njit(cache=True)
+def _append_row(table: np.ndarray, n_rows: int) -> np.ndarray:
+    """Return ``table`` with room for one more row, doubling when full."""
+    if n_rows < table.shape[0]:
+        return table
+    grown = np.empty((2 * table.shape[0], table.shape[1]))
+    grown[:n_rows] = table[:n_rows]
+    return grown
+
+
+@njit(cache=True)
+def _run_core(
+    close: np.ndarray,
+    nav: np.ndarray,
+    volume: np.ndarray,
+    ma5_volume: np.ndarray,
+    premium: np.ndarray,
+    limit: np.ndarray,
+    settle_idx: np.ndarray,
+    fee_limit_1: np.ndarray,
+    fee_limit_2: np.ndarray,
+    fee_rate_tier_1: np.ndarray,
+    fee_rate_tier_2: np.ndarray,
+    fee_fixed: np.ndarray,
+    initial_cash: float,
+    buy_threshold: float,
+    liquidity_ratio: float,
+    commission_rate: float,
+    use_ma5_liquidity: bool,
+    cash_constrained: bool,
+):
+    """Run the sell/buy/record loop over all trading days.
+
+    Args:
+        close, nav, volume, ma5_volume, premium, limit: (T, N) market arrays.
+        settle_idx: Per day, index of the first trading day on or after its
+            T+2 settlement date (T when it settles after the last day).
+        fee_limit_1 ... fee_fixed: Per-ticker subscription fee tiers.
+        initial_cash: Starting cash.
+        buy_threshold: Minimum premium rate for a buy.
+        liquidity_ratio: Tradable fraction of volume.
+        commission_rate: Commission rate on sells.
+        use_ma5_liquidity: Use min(volume, ma5_volume) for liquidity.
+        cash_constrained: True for risk_mode 'fixed'.
+
+    Returns:
+        Tuple of (total_assets, cash, positions_value) arrays of length T and
+        the trade table, one row per trade with N_TRADE_COLUMNS columns.
+    """
+    n_days, n_tickers = close.shape
+    inf = np.inf
+
+    total_assets = np.empty(n_days)
+    cash_out = np.empty(n_days)
+    positions_value_out = np.empty(n_days)
+
+    trades = np.empty((max(16, n_days), N_TRADE_COLUMNS))
+    n_trades = 0
+
+    # Pending settlements are a FIFO queue: settle_idx never decreases from
+    # one day to the next, so they mature in purchase order
+    pending = np.empty((max(16, n_days), 3))  # (settle day, ticker, shares)
+    n_pending = 0
+    pending_head = 0
+
+    positions = np.zeros(n_tickers)  # settled shares
+    held_shares = np.zeros(n_tickers)  # settled + pending shares
+    cash = initial_cash
+
+    for i in range(n_days):
+        # Step 1: Settle T+2 positions
+        while pending_head < n_pending and pending[pending_head, 0] <= i:
+            j = int(pending[pending_head, 1])
+            positions[j] += pending[pending_head, 2]
+            pending_head += 1
+
+        # Step 2: SELL Phase - sell all positions that have available shares
+        for j in range(n_tickers):
+            shares = positions[j]
+            if shares > 0:
+                price = close[i, j]
+                gross = shares * price
+                commission = gross * commission_rate
+                net_proceeds = gross - commission
+
+                positions[j] -= shares
+                if positions[j] < 1e-9:
+                    positions[j] = 0.0
+                cash += net_proceeds
+                held_shares[j] -= shares
+
+                trades = _append_row(trades, n_trades)
+                trades[n_trades, TRADE_DAY] = i
+                trades[n_trades, TRADE_ACTION] = ACTION_SELL
+                trades[n_trades, TRADE_TICKER] = j
+                trades[n_trades, TRADE_SHARES] = shares
+                trades[n_trades, TRADE_PRICE] = price
+                trades[n_trades, TRADE_AMOUNT] = shares * price
+                trades[n_trades, TRADE_FEE] = shares * price * commission_rate
+                trades[n_trades, TRADE_NET_AMOUNT] = net_proceeds
+                n_trades += 1
+
+        # Step 3: BUY Phase - candidates by premium_rate (descending, stable)
+        n_candidates = 0
+        candidates = np.empty(n_tickers, dtype=np.int64)
+        for j in range(n_tickers):
+            if premium[i, j] > buy_threshold and limit[i, j] > 0:
+                candidates[n_candidates] = j
+                n_candidates += 1
+        candidates = candidates[:n_candidates]
+        order = np.argsort(-premium[i, candidates], kind='mergesort')
+
+        for k in range(n_candidates):
+            if cash <= 0:
+                break
+            j = candidates[order[k]]
+
+            # Constraints, compared in the same order as Python's min()
+            max_amount = limit[i, j]
+            if np.isinf(max_amount):
+                max_amount = inf
+            effective_volume = volume[i, j]
+            if use_ma5_liquidity and ma5_volume[i, j] < effective_volume:
+                effective_volume = ma5_volume[i, j]
+            liquid_cap = effective_volume * liquidity_ratio * close[i, j]
+            if liquid_cap < max_amount:
+                max_amount = liquid_cap
+            if cash_constrained and cash < max_amount:
+                max_amount = cash
+
+            if max_amount <= 0 or cash <= 0:
+                continue
+            if cash < max_amount:
+                max_amount = cash
+
+            # Tiered subscription fee
+            if max_amount < fee_limit_1[j]:
+                fee = max_amount * fee_rate_tier_1[j]
+            elif max_amount < fee_limit_2[j]:
+                fee = max_amount * fee_rate_tier_2[j]
+            else:
+                fee = fee_fixed[j]
+            if max_amount <= fee:
+                continue
+
+            price = nav[i, j]
+            shares = (max_amount - fee) / price
+            cash -= max_amount
+            held_shares[j] += shares
+
+            pending = _append_row(pending, n_pending)
+            pending[n_pending, 0] = settle_idx[i]
+            pending[n_pending, 1] = j
+            pending[n_pending, 2] = shares
+            n_pending += 1
+
+            trades = _append_row(trades, n_trades)
+            trades[n_trades, TRADE_DAY] = i
+            trades[n_trades, TRADE_ACTION] = ACTION_BUY
+            trades[n_trades, TRADE_TICKER] = j
+            trades[n_trades, TRADE_SHARES] = shares
+            trades[n_trades, TRADE_PRICE] = price
+            trades[n_trades, TRADE_AMOUNT] = max_amount
+            trades[n_trades, TRADE_FEE] = fee
+            trades[n_trades, TRADE_NET_AMOUNT] = max_amount - fee
+            n_trades += 1
+
+        # Step 4: Record daily performance (a missing close values at 0)
+        positions_value = 0.0
+        for j in range(n_tickers):
+            price = close[i, j]
+            if not np.isnan(price):
+                positions_value += price * held_shares[j]
+        total_assets[i] = cash + positions_value
+        cash_out[i] = cash
+        positions_value_out[i] = positions_value
+
+    return total_assets, cash_out, positions_value_out, trades[:n_trades]
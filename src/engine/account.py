@@ -2,14 +2,40 @@
 Account management with T+2 settlement for LOF Backtesting Engine.
 """
 
+import heapq
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def build_settle_dates(trading_days: List[date]) -> Dict[date, date]:
+    """Map each trading day to its T+2 settlement date.
+    
+    Built once per backtest so each buy is a dict lookup rather than a
+    search of the trading calendar. Days within two days of the end of the
+    calendar settle on a conservative estimate of four calendar days later.
+    
+    Args:
+        trading_days: Sorted list of trading days.
+        
+    Returns:
+        Dict mapping trading day to settlement date.
+    """
+    n_days = len(trading_days)
+    settle_dates = {}
+    for idx, day in enumerate(trading_days):
+        if idx + 2 < n_days:
+            settle_dates[day] = trading_days[idx + 2]
+        else:
+            # Beyond available trading days, estimate
+            settle_dates[day] = day + timedelta(days=4)
+    return settle_dates
+
+
 @dataclass
 class PendingSettlement:
     """Represents a pending share settlement.
@@ -35,14 +61,41 @@ class Account:
     Attributes:
         cash: Available cash balance.
         positions: Settled positions as {ticker: shares}.
-        pending: List of pending settlements awaiting T+2.
+        pending: List of pending settlements awaiting T+2, in purchase order.
+            Maintained by buy/update_date; treat as read-only.
         _current_date: Current simulation date.
+        _maturity_heap: Min-heap of (settle_date, sequence, settlement), so
+            update_date only touches settlements that have matured.
+        _pending_by_ticker: Pending settlements grouped by ticker.
     """
     
     cash: float
     positions: Dict[str, float] = field(default_factory=dict)
     pending: List[PendingSettlement] = field(default_factory=list)
     _current_date: Optional[date] = None
+    _maturity_heap: List[Tuple[date, int, PendingSettlement]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _pending_by_ticker: Dict[str, Deque[PendingSettlement]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _pending_seq: int = field(default=0, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Index any settlements passed in through ``pending``."""
+        for settlement in self.pending:
+            self._index_pending(settlement)
+    
+    def _index_pending(self, settlement: PendingSettlement) -> None:
+        """Add a settlement to the maturity heap and its ticker's queue."""
+        heapq.heappush(
+            self._maturity_heap,
+            (settlement.settle_date, self._pending_seq, settlement)
+        )
+        self._pending_seq += 1
+        self._pending_by_ticker.setdefault(settlement.ticker, deque()).append(
+            settlement
+        )
     
     def update_date(self, current_date: date) -> None:
         """Advance to a new date and settle any matured positions.
@@ -54,20 +107,21 @@ class Account:
         """
         self._current_date = current_date
         
-        # Separate matured and still-pending settlements
-        matured = []
-        still_pending = []
+        # Pop matured settlements off the heap; most days nothing matures
+        heap = self._maturity_heap
+        if not heap or heap[0][0] > current_date:
+            return
         
-        for settlement in self.pending:
-            if settlement.settle_date <= current_date:
-                matured.append(settlement)
-            else:
-                still_pending.append(settlement)
+        matured = []
+        while heap and heap[0][0] <= current_date:
+            matured.append(heapq.heappop(heap))
         
-        # Process matured settlements
-        for settlement in matured:
+        # Process matured settlements in purchase order
+        matured.sort(key=lambda item: item[1])
+        for _, _, settlement in matured:
             ticker = settlement.ticker
             shares = settlement.shares
+            self._pending_by_ticker[ticker].remove(settlement)
             
             if ticker not in self.positions:
                 self.positions[ticker] = 0.0
@@ -78,7 +132,8 @@ class Account:
                 ticker, shares, current_date
             )
         
-        self.pending = still_pending
+        matured_ids = {id(settlement) for _, _, settlement in matured}
+        self.pending = [p for p in self.pending if id(p) not in matured_ids]
     
     def sell(
         self,
@@ -135,7 +190,7 @@ class Account:
         amount: float,
         nav: float,
         fee: float,
-        trading_days: List[date]
+        settle_dates: Dict[date, date]
     ) -> float:
         """Execute a buy order with T+2 settlement.
         
@@ -146,7 +201,8 @@ class Account:
             amount: Total amount to invest (including fee).
             nav: NAV for share calculation.
             fee: Subscription fee (already calculated).
-            trading_days: List of trading days for T+2 calculation.
+            settle_dates: T+2 settlement dates by trading day
+                (see build_settle_dates).
             
         Returns:
             Number of shares purchased.
@@ -167,14 +223,16 @@ class Account:
         self.cash -= amount
         
         # Calculate T+2 settlement date
-        settle_date = self._calculate_t2_date(trading_days)
+        settle_date = self._calculate_t2_date(settle_dates)
         
         # Add to pending queue
-        self.pending.append(PendingSettlement(
+        settlement = PendingSettlement(
             settle_date=settle_date,
             ticker=ticker,
             shares=shares
-        ))
+        )
+        self.pending.append(settlement)
+        self._index_pending(settlement)
         
         logger.info(
             "BUY %s: %.2f CNY -> %.2f shares @ NAV %.4f (fee: %.2f, settle: %s)",
@@ -183,11 +241,11 @@ class Account:
         
         return shares
     
-    def _calculate_t2_date(self, trading_days: List[date]) -> date:
+    def _calculate_t2_date(self, settle_dates: Dict[date, date]) -> date:
         """Calculate T+2 settlement date based on trading calendar.
         
         Args:
-            trading_days: Sorted list of trading days.
+            settle_dates: T+2 settlement dates by trading day.
             
         Returns:
             Settlement date (T+2 trading days from current date).
@@ -195,21 +253,11 @@ class Account:
         if self._current_date is None:
             raise ValueError("Current date not set. Call update_date first.")
         
-        # Find current date index in trading days
-        try:
-            current_idx = trading_days.index(self._current_date)
-        except ValueError:
+        settle_date = settle_dates.get(self._current_date)
+        if settle_date is None:
             # Current date not in trading days, use fallback
             return self._current_date + timedelta(days=2)
-        
-        # T+2 means 2 trading days after current
-        settle_idx = current_idx + 2
-        
-        if settle_idx < len(trading_days):
-            return trading_days[settle_idx]
-        else:
-            # Beyond available trading days, estimate
-            return self._current_date + timedelta(days=4)  # Conservative estimate
+        return settle_date
     
     def get_available_shares(self, ticker: str) -> float:
         """Get available (settled) shares for a ticker.
@@ -231,10 +279,7 @@ class Account:
         Returns:
             Number of shares awaiting settlement.
         """
-        return sum(
-            p.shares for p in self.pending 
-            if p.ticker == ticker
-        )
+        return sum(p.shares for p in self._pending_by_ticker.get(ticker, ()))
     
     def get_total_shares(self, ticker: str) -> float:
         """Get total shares (settled + pending) for a ticker.
@@ -13,11 +13,55 @@ import pandas as pd
 
 from src.config import BacktestConfig
 from src.data.loader import DataLoader
-from src.engine.account import Account
+from src.engine import _core
+from src.engine.account import Account, build_settle_dates
 from src.strategy.base import BaseStrategy, Signal
 
 logger = logging.getLogger(__name__)
 
+# Per-day market columns the run loop reads, as (T, N) arrays
+MARKET_ARRAY_COLUMNS = (
+    'close', 'nav', 'volume', 'ma5_volume', 'premium_rate', 'daily_limit'
+)
+
+
+# Subscription fee tiers as (fee_limit_1, fee_limit_2, fee_rate_tier_1,
+# fee_rate_tier_2, fee_fixed)
+FeeTiers = Tuple[float, float, float, float, float]
+
+
+def get_fee_tiers(attrs: Dict[str, Any]) -> FeeTiers:
+    """Read the subscription fee tiers from DataFrame attrs.
+    
+    Resolving the five attrs once per ticker keeps dict lookups out of the
+    per-trade fee calculation.
+    
+    Args:
+        attrs: DataFrame attrs containing fee configuration.
+        
+    Returns:
+        Fee tiers, with defaults for missing keys.
+    """
+    return (
+        attrs.get('fee_limit_1', 500_000.0),
+        attrs.get('fee_limit_2', 2_000_000.0),
+        attrs.get('fee_rate_tier_1', 0.015),
+        attrs.get('fee_rate_tier_2', 0.01),
+        attrs.get('fee_fixed', 1000.0),
+    )
+
+
+def _tiered_fee(amount: float, fee_tiers: FeeTiers) -> float:
+    """Calculate the subscription fee for pre-resolved fee tiers."""
+    fee_limit_1, fee_limit_2, fee_rate_tier_1, fee_rate_tier_2, fee_fixed = fee_tiers
+    
+    if amount < fee_limit_1:
+        return amount * fee_rate_tier_1
+    elif amount < fee_limit_2:
+        return amount * fee_rate_tier_2
+    else:
+        return fee_fixed
+
 
 def calculate_subscription_fee(amount: float, attrs: Dict[str, Any]) -> float:
     """Calculate tiered subscription fee based on amount.
@@ -34,18 +78,7 @@ def calculate_subscription_fee(amount: float, attrs: Dict[str, Any]) -> float:
     Returns:
         Calculated fee in CNY.
     """
-    fee_limit_1 = attrs.get('fee_limit_1', 500_000.0)
-    fee_limit_2 = attrs.get('fee_limit_2', 2_000_000.0)
-    fee_rate_tier_1 = attrs.get('fee_rate_tier_1', 0.015)
-    fee_rate_tier_2 = attrs.get('fee_rate_tier_2', 0.01)
-    fee_fixed = attrs.get('fee_fixed', 1000.0)
-    
-    if amount < fee_limit_1:
-        return amount * fee_rate_tier_1
-    elif amount < fee_limit_2:
-        return amount * fee_rate_tier_2
-    else:
-        return fee_fixed
+    return _tiered_fee(amount, get_fee_tiers(attrs))
 
 
 @dataclass
@@ -224,7 +257,8 @@ class BacktestEngine:
         self,
         config: BacktestConfig,
         strategy: BaseStrategy,
-        data_loader: Optional[DataLoader] = None
+        data_loader: Optional[DataLoader] = None,
+        use_compiled: bool = True
     ):
         """Initialize backtest engine.
         
@@ -232,10 +266,14 @@ class BacktestEngine:
             config: Backtest configuration.
             strategy: Trading strategy instance.
             data_loader: DataLoader instance. If None, creates default.
+            use_compiled: Run the daily loop in the numba-compiled core when
+                numba is installed. Set to False for the Account-based loop,
+                which logs every BUY/SELL at INFO level.
         """
         self.config = config
         self.strategy = strategy
         self.data_loader = data_loader or DataLoader()
+        self.use_compiled = use_compiled
     
     def _load_multi_data(
         self,
@@ -255,11 +293,9 @@ class BacktestEngine:
             - Dict mapping ticker to DataFrame with market data
             - DatetimeIndex of aligned trading days (intersection)
         """
-        all_data: Dict[str, pd.DataFrame] = {}
+        all_data = self.data_loader.load_bundles(tickers, start_date, end_date)
         
-        for ticker in tickers:
-            df = self.data_loader.load_bundle(ticker, start_date, end_date)
-            
+        for ticker, df in all_data.items():
             # Pre-compute MA5 volume
             if self.config.use_ma5_liquidity:
                 df['ma5_volume'] = df['volume'].rolling(5, min_periods=1).mean()
@@ -268,8 +304,6 @@ class BacktestEngine:
             
             # Add ticker column
             df['ticker'] = ticker
-            
-            all_data[ticker] = df
         
         # Find intersection of all trading days
         if not all_data:
@@ -287,6 +321,37 @@ class BacktestEngine:
         
         return all_data, aligned_dates
     
+    @staticmethod
+    def _stack_market_arrays(
+        all_data: Dict[str, pd.DataFrame],
+        ticker_list: List[str],
+        aligned_dates: pd.DatetimeIndex
+    ) -> Dict[str, np.ndarray]:
+        """Materialize the run loop's inputs as dense (T, N) arrays.
+        
+        Row i is aligned_dates[i] and column j is ticker_list[j], so the loop
+        reads market data by integer position instead of per-day label
+        lookups (.loc) on every ticker's DataFrame.
+        
+        Args:
+            all_data: Dict mapping ticker to DataFrame (see _load_multi_data).
+            ticker_list: Tickers in column order.
+            aligned_dates: Trading days in row order.
+            
+        Returns:
+            Dict mapping each of MARKET_ARRAY_COLUMNS to a float64 array.
+        """
+        frames = [
+            df if df.index.equals(aligned_dates) else df.reindex(aligned_dates)
+            for df in (all_data[ticker] for ticker in ticker_list)
+        ]
+        return {
+            col: np.column_stack(
+                [df[col].to_numpy(dtype=np.float64) for df in frames]
+            )
+            for col in MARKET_ARRAY_COLUMNS
+        }
+    
     def run(
         self,
         tickers: Union[str, List[str]],
@@ -327,27 +392,51 @@ class BacktestEngine:
         
         # Extract trading days as date objects
         trading_days: List[date] = [d.date() for d in aligned_dates]
+        settle_dates = build_settle_dates(trading_days)
+        
+        # Dense (T, N) market arrays. aligned_dates is the intersection of all
+        # tickers' dates, so every ticker has a row on every day.
+        arrays = self._stack_market_arrays(all_data, ticker_list, aligned_dates)
+        
+        if self.use_compiled and _core.NUMBA_AVAILABLE:
+            return self._run_compiled(
+                all_data, ticker_list, aligned_dates, settle_dates, arrays
+            )
+        
+        close = arrays['close']
+        premium = arrays['premium_rate']
+        limit = arrays['daily_limit']
         
         # Initialize account
         account = Account(cash=self.config.initial_cash)
         
+        # Shares held per ticker (settled + pending), in ticker_list order.
+        # Mirrors the account's holdings so daily valuation is one dot product;
+        # a missing (NaN) close values a ticker at 0 rather than poisoning it.
+        held_shares = np.zeros(len(ticker_list))
+        valuation_close = np.nan_to_num(close, nan=0.0)
+        
+        # Buy filter: must exceed threshold and have positive limit
+        buy_mask = (premium > self.config.buy_threshold) & (limit > 0)
+        
+        fee_tiers = [get_fee_tiers(all_data[ticker].attrs) for ticker in ticker_list]
+        
         # Storage for results
         daily_records: List[Dict[str, Any]] = []
         trade_records: List[Dict[str, Any]] = []
         
+        def market_row(i: int, j: int) -> Dict[str, float]:
+            return {col: arrays[col][i, j] for col in MARKET_ARRAY_COLUMNS}
+        
         # Main backtest loop
-        for timestamp in aligned_dates:
-            current_date = timestamp.date()
+        for i, timestamp in enumerate(aligned_dates):
+            current_date = trading_days[i]
             
             # Step 1: Settle T+2 positions
             account.update_date(current_date)
             
             # Step 2: SELL Phase - sell all positions that have available shares
-            for ticker in ticker_list:
-                if ticker not in all_data or timestamp not in all_data[ticker].index:
-                    continue
-                
-                row = all_data[ticker].loc[timestamp]
+            for j, ticker in enumerate(ticker_list):
                 available_shares = account.get_available_shares(ticker)
                 
                 if available_shares > 0:
@@ -355,68 +444,49 @@ class BacktestEngine:
                     trade = self._execute_sell(
                         account=account,
                         signal=signal,
-                        row=row,
+                        row=market_row(i, j),
                         current_date=current_date
                     )
                     if trade:
                         trade_records.append(trade)
+                        held_shares[j] -= trade['shares']
             
-            # Step 3: BUY Phase - collect candidates, sort by premium_rate, buy greedily
-            buy_candidates = []
-            
-            for ticker in ticker_list:
-                if ticker not in all_data or timestamp not in all_data[ticker].index:
-                    continue
-                
-                row = all_data[ticker].loc[timestamp]
-                premium_rate = row['premium_rate']
-                daily_limit = row['daily_limit']
-                
-                # Filter: must exceed threshold and have positive limit
-                if premium_rate > self.config.buy_threshold and daily_limit > 0:
-                    buy_candidates.append({
-                        'ticker': ticker,
-                        'premium_rate': premium_rate,
-                        'row': row,
-                        'attrs': all_data[ticker].attrs
-                    })
-            
-            # Sort by premium_rate descending (highest first)
-            buy_candidates.sort(key=lambda x: x['premium_rate'], reverse=True)
+            # Step 3: BUY Phase - candidates sorted by premium_rate (highest
+            # first; the stable sort keeps ticker order on ties), bought greedily
+            candidates = np.flatnonzero(buy_mask[i])
+            order = candidates[np.argsort(-premium[i, candidates], kind='stable')]
             
             # Greedy buy: iterate until cash exhausted
-            for candidate in buy_candidates:
+            for j in order:
                 if account.cash <= 0:
                     break
                 
+                ticker = ticker_list[j]
                 signal = Signal(
                     action='buy',
-                    ticker=candidate['ticker'],
+                    ticker=ticker,
                     amount=float('inf')
                 )
                 trade = self._execute_buy(
                     account=account,
                     signal=signal,
-                    row=candidate['row'],
-                    df_attrs=candidate['attrs'],
-                    trading_days=trading_days,
+                    row=market_row(i, j),
+                    fee_tiers=fee_tiers[j],
+                    settle_dates=settle_dates,
                     current_date=current_date
                 )
                 if trade:
                     trade_records.append(trade)
+                    held_shares[j] += trade['shares']
             
-            # Step 4: Record daily performance
-            # Collect current prices for all tickers
-            prices: Dict[str, float] = {}
-            for ticker in ticker_list:
-                if ticker in all_data and timestamp in all_data[ticker].index:
-                    prices[ticker] = all_data[ticker].loc[timestamp, 'close']
+            # Step 4: Record daily performance (positions at today's close)
+            positions_value = float(valuation_close[i] @ held_shares)
             
             daily_records.append({
                 'date': timestamp,
-                'total_assets': account.get_total_value(prices),
+                'total_assets': account.cash + positions_value,
                 'cash': account.cash,
-                'positions_value': account.get_positions_value(prices),
+                'positions_value': positions_value,
             })
         
         # Build result DataFrames
@@ -432,11 +502,109 @@ class BacktestEngine:
             config=self.config
         )
     
+    def _run_compiled(
+        self,
+        all_data: Dict[str, pd.DataFrame],
+        ticker_list: List[str],
+        aligned_dates: pd.DatetimeIndex,
+        settle_dates: Dict[date, date],
+        arrays: Dict[str, np.ndarray]
+    ) -> BacktestResult:
+        """Run the daily loop with the numba-compiled core (see _core).
+        
+        Produces the same daily performance and trade logs as the Python
+        loop in run, without per-trade Account bookkeeping or logging.
+        
+        Args:
+            all_data: Dict mapping ticker to DataFrame (for fee attrs).
+            ticker_list: Tickers in column order of ``arrays``.
+            aligned_dates: Trading days in row order of ``arrays``.
+            settle_dates: T+2 settlement dates by trading day.
+            arrays: Dense (T, N) market arrays (see _stack_market_arrays).
+            
+        Returns:
+            BacktestResult with performance metrics and trade logs.
+        """
+        trading_days = [d.date() for d in aligned_dates]
+        
+        # Settlement date -> index of the first trading day on or after it
+        calendar = np.array(trading_days, dtype='datetime64[D]')
+        settle_idx = np.searchsorted(
+            calendar,
+            np.array([settle_dates[d] for d in trading_days], dtype='datetime64[D]')
+        )
+        
+        # Per-ticker fee tiers as five contiguous (N,) arrays
+        fee_limit_1, fee_limit_2, fee_rate_tier_1, fee_rate_tier_2, fee_fixed = (
+            np.array(
+                [get_fee_tiers(all_data[t].attrs) for t in ticker_list],
+                dtype=np.float64
+            ).T.copy()
+        )
+        
+        total_assets, cash, positions_value, trades = _core._run_core(
+            arrays['close'],
+            arrays['nav'],
+            arrays['volume'],
+            arrays['ma5_volume'],
+            arrays['premium_rate'],
+            arrays['daily_limit'],
+            settle_idx,
+            fee_limit_1,
+            fee_limit_2,
+            fee_rate_tier_1,
+            fee_rate_tier_2,
+            fee_fixed,
+            float(self.config.initial_cash),
+            float(self.config.buy_threshold),
+            float(self.config.liquidity_ratio),
+            float(self.config.commission_rate),
+            bool(self.config.use_ma5_liquidity),
+            self.config.risk_mode == 'fixed'
+        )
+        logger.info(
+            "Backtest finished: %d trades over %d days",
+            len(trades), len(trading_days)
+        )
+        
+        daily_perf = pd.DataFrame(
+            {
+                'total_assets': total_assets,
+                'cash': cash,
+                'positions_value': positions_value,
+            },
+            index=aligned_dates.rename('date')
+        )
+        
+        trade_logs = pd.DataFrame()
+        if len(trades):
+            days = trades[:, _core.TRADE_DAY].astype(np.int64)
+            tickers = trades[:, _core.TRADE_TICKER].astype(np.int64)
+            actions = trades[:, _core.TRADE_ACTION]
+            trade_logs = pd.DataFrame({
+                'date': [trading_days[i] for i in days],
+                'action': [
+                    'buy' if a == _core.ACTION_BUY else 'sell' for a in actions
+                ],
+                'ticker': [ticker_list[j] for j in tickers],
+                'shares': trades[:, _core.TRADE_SHARES],
+                'price': trades[:, _core.TRADE_PRICE],
+                'amount': trades[:, _core.TRADE_AMOUNT],
+                'fee': trades[:, _core.TRADE_FEE],
+                'net_amount': trades[:, _core.TRADE_NET_AMOUNT],
+            })
+        
+        return BacktestResult(
+            daily_perf=daily_perf,
+            trade_logs=trade_logs,
+            config=self.config
+        )
+    
     def _execute_sell(
         self,
         account: Account,
         signal: Signal,
-        row: pd.Series,
+        row: Dict[str, float],
         current_date: date
     ) -> Optional[Dict[str, Any]]:
         """Execute a sell order.
@@ -491,9 +659,9 @@ class BacktestEngine:
         self,
         account: Account,
         signal: Signal,
-        row: pd.Series,
-        df_attrs: Dict[str, Any],
-        trading_days: List[date],
+        row: Dict[str, float],
+        fee_tiers: FeeTiers,
+        settle_dates: Dict[date, date],
         current_date: date
     ) -> Optional[Dict[str, Any]]:
         """Execute a buy order with constraints.
@@ -507,8 +675,8 @@ class BacktestEngine:
             account: Account instance.
             signal: Buy signal.
             row: Current market data row.
-            df_attrs: DataFrame attrs with fee configuration.
-            trading_days: List of trading days for T+2 calculation.
+            fee_tiers: Ticker's fee tiers (see get_fee_tiers).
+            settle_dates: T+2 settlement dates by trading day.
             current_date: Current simulation date.
             
         Returns:
@@ -553,7 +721,7 @@ class BacktestEngine:
         max_amount = min(max_amount, account.cash)
         
         # Calculate fee
-        fee = calculate_subscription_fee(max_amount, df_attrs)
+        fee = _tiered_fee(max_amount, fee_tiers)
         
         # Ensure amount covers fee
         if max_amount <= fee:
@@ -570,7 +738,7 @@ class BacktestEngine:
             amount=max_amount,
             nav=nav,
             fee=fee,
-            trading_days=trading_days
+            settle_dates=settle_dates
         )
         
         return {
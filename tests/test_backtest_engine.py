@@ -0,0 +1,199 @@
+"""
+Unit tests for BacktestEngine.run.
+
+The daily loop has two implementations: the numba-compiled core in
+src/engine/_core.py and the Account-based Python loop in BacktestEngine.run.
+These tests run both on the same data and check that they agree.
+"""
+
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import BacktestConfig
+from src.data.loader import DataLoader
+from src.engine import _core
+from src.engine.backtest import BacktestEngine
+from src.strategy.simple_lof import SimpleLOFStrategy
+
+
+class TestCompiledCoreMatchesPythonLoop(unittest.TestCase):
+    """The compiled core and the Python loop produce the same results."""
+
+    def setUp(self):
+        """Set up temporary test data directory with mock data."""
+        self.temp_dir = tempfile.mkdtemp(prefix="lof_test_")
+        self.data_dir = Path(self.temp_dir) / "data"
+
+        # Create required directory structure
+        (self.data_dir / "market").mkdir(parents=True)
+        (self.data_dir / "nav").mkdir(parents=True)
+        (self.data_dir / "config").mkdir(parents=True)
+
+        self.dates = pd.bdate_range(start="2023-01-02", end="2023-12-29", freq="B")
+        self.tickers = ["TEST001", "TEST002", "TEST003", "TEST004", "TEST005"]
+        self._create_data()
+
+    def tearDown(self):
+        """Clean up temporary test data."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _create_data(self) -> None:
+        """Create market/NAV data, fees and limit events for all tickers.
+
+        TEST001 and TEST002 share identical prices, so their premium rates
+        tie on every day and the buy order has to fall back to ticker order.
+        """
+        rng = np.random.default_rng(42)
+        n_days = len(self.dates)
+
+        shared = None
+        for ticker in self.tickers:
+            if ticker == "TEST002":
+                nav, close, volume = shared
+            else:
+                nav = 1.0 + np.cumsum(rng.normal(0.0, 0.01, n_days))
+                close = nav * (1.0 + rng.normal(0.01, 0.02, n_days))
+                volume = rng.integers(200_000, 3_000_000, n_days)
+                if ticker == "TEST001":
+                    shared = (nav, close, volume)
+
+            pd.DataFrame(
+                {
+                    "date": self.dates,
+                    "ticker": ticker,
+                    "open": close,
+                    "high": close * 1.01,
+                    "low": close * 0.99,
+                    "close": close,
+                    "volume": volume,
+                }
+            ).to_parquet(self.data_dir / "market" / f"{ticker}.parquet", index=False)
+            pd.DataFrame({"date": self.dates, "ticker": ticker, "nav": nav}).to_parquet(
+                self.data_dir / "nav" / f"{ticker}.parquet", index=False
+            )
+
+        pd.DataFrame(
+            {
+                "ticker": self.tickers,
+                "fee_rate_tier_1": [0.015, 0.015, 0.012, 0.0, 0.015],
+                "fee_limit_1": [500000.0, 500000.0, 100000.0, 500000.0, 50000.0],
+                "fee_rate_tier_2": [0.010, 0.010, 0.008, 0.0, 0.010],
+                "fee_limit_2": [2000000.0, 2000000.0, 200000.0, 2000000.0, 80000.0],
+                "fee_fixed": [1000.0, 1000.0, 500.0, 0.0, 1000.0],
+                "redeem_fee_7d": [0.015] * 5,
+            }
+        ).to_csv(self.data_dir / "config" / "fees.csv", index=False)
+
+        # Suspended (0), capped and unlimited (inf, no event) days
+        events = [
+            ("TEST001", "2023-02-01", "2023-03-15", 0.0),
+            ("TEST002", "2023-02-01", "2023-03-15", 0.0),
+            ("TEST003", "2023-04-03", "2023-06-30", 10000.0),
+            ("TEST003", "2023-09-01", None, 50000.0),
+            ("TEST005", "2023-01-02", "2023-05-31", 0.0),
+            ("TEST005", "2023-06-01", "2023-08-31", 200.0),
+        ]
+        conn = sqlite3.connect(self.data_dir / "config" / "fund_status.db")
+        conn.execute("""
+            CREATE TABLE limit_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ticker TEXT NOT NULL,
+                start_date DATE NOT NULL,
+                end_date DATE,
+                max_amount REAL NOT NULL,
+                reason TEXT,
+                source_announcement_ids TEXT DEFAULT '[]',
+                is_open_ended INTEGER GENERATED ALWAYS AS (
+                    CASE WHEN end_date IS NULL THEN 1 ELSE 0 END
+                ) STORED
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO limit_events (ticker, start_date, end_date, max_amount) "
+            "VALUES (?, ?, ?, ?)",
+            events,
+        )
+        conn.commit()
+        conn.close()
+
+    def _run(self, config: BacktestConfig, compiled: bool):
+        engine = BacktestEngine(
+            config=config,
+            strategy=SimpleLOFStrategy(),
+            data_loader=DataLoader(data_dir=str(self.data_dir)),
+        )
+        with patch.object(
+            _core, "NUMBA_AVAILABLE", compiled and _core.NUMBA_AVAILABLE
+        ):
+            return engine.run(self.tickers)
+
+    def test_compiled_matches_python_loop(self):
+        """Trade logs are equal and daily performance is close in all modes."""
+        for risk_mode in ("fixed", "infinite"):
+            for use_ma5_liquidity in (True, False):
+                with self.subTest(
+                    risk_mode=risk_mode, use_ma5_liquidity=use_ma5_liquidity
+                ):
+                    config = BacktestConfig(
+                        initial_cash=300_000.0,
+                        buy_threshold=0.01,
+                        risk_mode=risk_mode,
+                        use_ma5_liquidity=use_ma5_liquidity,
+                    )
+                    compiled = self._run(config, compiled=True)
+                    python = self._run(config, compiled=False)
+
+                    self.assertGreater(compiled.num_buy_trades, 0)
+                    self.assertGreater(compiled.num_sell_trades, 0)
+                    pd.testing.assert_frame_equal(
+                        compiled.trade_logs, python.trade_logs
+                    )
+                    pd.testing.assert_frame_equal(
+                        compiled.daily_perf,
+                        python.daily_perf,
+                        check_exact=False,
+                        rtol=1e-9,
+                    )
+
+    def test_tied_premiums_buy_in_ticker_order(self):
+        """Tickers with equal premium rates are bought in ticker order."""
+        config = BacktestConfig(buy_threshold=0.01)
+        for compiled in (True, False):
+            with self.subTest(compiled=compiled):
+                logs = self._run(config, compiled=compiled).trade_logs
+                buys = logs[
+                    (logs["action"] == "buy")
+                    & logs["ticker"].isin(["TEST001", "TEST002"])
+                ]
+                for _, day in buys.groupby("date"):
+                    tickers = list(day["ticker"])
+                    self.assertEqual(tickers, sorted(tickers))
+
+    def test_use_compiled_false_runs_python_loop(self):
+        """use_compiled=False never enters the compiled core."""
+        engine = BacktestEngine(
+            config=BacktestConfig(),
+            strategy=SimpleLOFStrategy(),
+            data_loader=DataLoader(data_dir=str(self.data_dir)),
+            use_compiled=False,
+        )
+        with patch.object(BacktestEngine, "_run_compiled") as mock_compiled:
+            result = engine.run(self.tickers)
+
+        mock_compiled.assert_not_called()
+        self.assertEqual(len(result.daily_perf), len(self.dates))
+
+
+if __name__ == "__main__":
+    unittest.main()
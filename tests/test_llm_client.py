@@ -15,16 +15,26 @@ Note: These tests use mocking to avoid requiring a running Ollama instance.
 To run tests against a real Ollama server, set OLLAMA_TEST=1 environment variable.
 """
 
+import asyncio
 import json
 import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from src.data.llm_client import LLMClient, LLMError, parse_announcement
+from src.data._llm_cache import EmbeddingCache, FileCache
+from src.data.llm_client import (
+    RESPONSE_SCHEMA,
+    LLMClient,
+    LLMError,
+    _get_client,
+    _prefilter,
+    parse_announcement,
+)
 
 
 def _make_chat_response(content: str) -> dict:
@@ -37,7 +47,7 @@ class TestLLMClient(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.client = LLMClient()
+        self.client = LLMClient(keyword_filter=False)
         self.mock_json = json.dumps(
             [
                 {
@@ -59,8 +69,11 @@ class TestLLMClient(unittest.TestCase):
 
             result = self.client.parse_announcement("Test announcement text")
 
-            # Verify API was called
+            # Verify API was called with the response schema
             mock_chat.assert_called_once()
+            self.assertEqual(mock_chat.call_args.kwargs["format"], RESPONSE_SCHEMA)
+            self.assertIs(mock_chat.call_args.kwargs["think"], False)
+            self.assertEqual(mock_chat.call_args.kwargs["keep_alive"], -1)
 
             # Verify result is a list with one record
             self.assertIsInstance(result, list)
@@ -249,6 +262,10 @@ class TestLLMClient(unittest.TestCase):
         self.assertIn("modify", prompt)
         self.assertIn("Test announcement", prompt)
 
+        # Few-shot examples are opt-in
+        self.assertNotIn("Example 1", prompt)
+        prompt = LLMClient(few_shot=True)._build_prompt(text)
+
         # Check for example announcements (including new multi-date/multi-ticker)
         self.assertIn("Example 1", prompt)
         self.assertIn("Example 2", prompt)
@@ -353,12 +370,18 @@ class TestLLMClient(unittest.TestCase):
 
     def test_convenience_function(self):
         """Test the module-level parse_announcement convenience function."""
+        _get_client.cache_clear()
+        self.addCleanup(_get_client.cache_clear)
         with patch("src.data.llm_client.ollama.Client") as mock_client_cls:
             mock_instance = MagicMock()
             mock_instance.chat.return_value = _make_chat_response(self.mock_json)
             mock_client_cls.return_value = mock_instance
 
-            result = parse_announcement("Test text")
+            result = parse_announcement("限购 Test text")
+            parse_announcement("限购 Test text")
+
+            # The default client is created once and reused
+            mock_client_cls.assert_called_once()
 
             self.assertIsInstance(result, list)
             self.assertEqual(len(result), 1)
@@ -464,6 +487,12 @@ class TestLLMClient(unittest.TestCase):
         self.assertIsInstance(parsed, list)
         self.assertEqual(len(parsed), 2)
 
+        # Trailing commas and brackets inside strings are salvaged
+        malformed = 'Result: [{"ticker": "16]1", "confidence": 0.9,},] done'
+        result = LLMClient._extract_json_from_response(malformed)
+        parsed = json.loads(result)
+        self.assertEqual(parsed, [{"ticker": "16]1", "confidence": 0.9}])
+
     def test_ollama_response_error(self):
         """Test handling of ollama.ResponseError."""
         import ollama as ollama_module
@@ -551,6 +580,25 @@ class TestLLMClient(unittest.TestCase):
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0]["ticker"], "160127")
 
+    def test_prefilter_keeps_limit_sentences(self):
+        """Test long texts keep the lead and purchase-limit sentences only."""
+        lead = "关于暂停大额申购的公告。"
+        limit = "本基金自2024年1月15日起暂停大额申购，限额100元。"
+        filler = "本公告的解释权归本公司所有。" * 50
+        text = lead + filler + limit + filler
+
+        self.assertEqual(_prefilter(lead + limit, max_chars=100), lead + limit)
+        self.assertEqual(_prefilter(text, max_chars=100), lead + limit)
+
+    def test_clean_output_amount_units(self):
+        """Test that string amounts with Chinese units are converted to CNY."""
+        cleaned = self.client._clean_output(
+            [{"limit_amount": "100元"}, {"limit_amount": "1.5万元"}, {"limit_amount": "n/a"}]
+        )
+        self.assertEqual(cleaned[0]["limit_amount"], 100.0)
+        self.assertEqual(cleaned[1]["limit_amount"], 15000.0)
+        self.assertIsNone(cleaned[2]["limit_amount"])
+
     def test_clean_output_wraps_single_dict(self):
         """Test that _clean_output wraps a single dict in a list."""
         raw = {
@@ -578,6 +626,99 @@ class TestLLMClient(unittest.TestCase):
         # Should still have the array output format
         self.assertIn("JSON array", prompt)
 
+    def test_aparse_many_preserves_order(self):
+        """Test concurrent parsing returns one result per text, in order."""
+
+        async def fake_chat(model, messages, **kwargs):
+            ticker = "A" if "first" in messages[1]["content"] else "B"
+            return _make_chat_response(json.dumps({"ticker": ticker}))
+
+        with patch("src.data.llm_client.ollama.AsyncClient") as mock_cls:
+            mock_cls.return_value.chat.side_effect = fake_chat
+
+            results = asyncio.run(
+                self.client.aparse_many(["first text", "second text", ""])
+            )
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0][0]["ticker"], "A")
+        self.assertEqual(results[1][0]["ticker"], "B")
+        self.assertIn("Empty input text", results[2][0]["error"])
+
+    def test_cache_skips_repeat_calls(self):
+        """Test that cached results are returned without calling the LLM."""
+        with tempfile.TemporaryDirectory() as tmp:
+            client = LLMClient(cache=FileCache(dir=tmp), keyword_filter=False)
+            with patch.object(client._client, "chat") as mock_chat:
+                mock_chat.return_value = _make_chat_response(self.mock_json)
+
+                first = client.parse_announcement("Same text", ticker="161005")
+                second = client.parse_announcement("Same text", ticker="161005")
+                many = client.parse_many(["Same text"], ticker="161005")
+
+                mock_chat.assert_called_once()
+                self.assertEqual(first, second)
+                self.assertEqual(many, [first])
+
+            # A fresh client reads the disk cache; whitespace is normalized
+            other = LLMClient(cache=FileCache(dir=tmp), keyword_filter=False)
+            with patch.object(other._client, "chat") as other_chat:
+                result = other.parse_announcement("Same \n text ", ticker="161005")
+                other_chat.assert_not_called()
+                self.assertEqual(result, first)
+
+            # Error results are not cached
+            with patch.object(client._client, "chat") as mock_chat:
+                mock_chat.side_effect = ConnectionError("Connection refused")
+                client.parse_announcement("Other text")
+                client.parse_announcement("Other text")
+                self.assertEqual(mock_chat.call_count, 2)
+
+    def test_parse_many_deduplicates_texts(self):
+        """Test that duplicate texts in one batch cost a single LLM call."""
+        with tempfile.TemporaryDirectory() as tmp:
+            client = LLMClient(
+                cache=FileCache(dir=tmp), keyword_filter=False, memo_size=0
+            )
+            with patch.object(client._client, "chat") as mock_chat:
+                mock_chat.return_value = _make_chat_response(self.mock_json)
+
+                results = client.parse_many(["Dup text", "Dup  text", "Dup text"])
+
+                mock_chat.assert_called_once()
+                self.assertEqual(results[0], results[1])
+                self.assertEqual(results[0], results[2])
+                self.assertIsNot(results[0], results[2])
+
+    def test_semantic_cache_requires_same_numbers(self):
+        """Test that similar texts share a result only when their numbers match."""
+        client = LLMClient(semantic_cache=EmbeddingCache())
+        with patch.object(client._client, "embed") as mock_embed, patch.object(
+            client._client, "chat"
+        ) as mock_chat:
+            mock_embed.return_value = {"embeddings": [[0.1, 0.2, 0.3]]}
+            mock_chat.return_value = _make_chat_response(self.mock_json)
+
+            first = client.parse_announcement("自2024年1月1日起限购100元。")
+            second = client.parse_announcement("自2024年1月1日起，限购100元。")
+            client.parse_announcement("自2024年2月1日起限购100元。")
+
+            self.assertEqual(first, second)
+            self.assertEqual(mock_chat.call_count, 2)
+
+    def test_keyword_filter_skips_llm(self):
+        """Test that texts without limit keywords are answered without the LLM."""
+        client = LLMClient()
+        with patch.object(client._client, "chat") as mock_chat:
+            result = client.parse_announcement("2024年第一季度报告")
+            mock_chat.assert_not_called()
+            self.assertFalse(result[0]["is_purchase_limit_announcement"])
+            self.assertEqual(result[0]["confidence"], 1.0)
+
+            mock_chat.return_value = _make_chat_response(self.mock_json)
+            client.parse_announcement("关于暂停大额申购业务的公告")
+            mock_chat.assert_called_once()
+
 
 class TestLLMClientEnvironment(unittest.TestCase):
     """Test cases for environment variable handling."""
@@ -590,6 +731,12 @@ class TestLLMClientEnvironment(unittest.TestCase):
         self.assertIsNone(client.host)
         self.assertEqual(client.model, "custom-model")
 
+    @patch.dict(os.environ, {"OLLAMA_KEEP_ALIVE": "30m"})
+    def test_keep_alive_env(self):
+        """Test that keep_alive comes from OLLAMA_KEEP_ALIVE unless given."""
+        self.assertEqual(LLMClient().keep_alive, "30m")
+        self.assertEqual(LLMClient(keep_alive="600").keep_alive, 600.0)
+
     def test_explicit_base_url(self):
         """Test that explicit base_url is stored."""
         client = LLMClient(base_url="http://explicit:11434")
@@ -601,6 +748,27 @@ class TestLLMClientEnvironment(unittest.TestCase):
         self.assertIsNone(client.host)
         self.assertIsNone(client.base_url)
 
+    def test_multiple_backends_round_robin(self):
+        """Test requests rotate across backends and skip unreachable ones."""
+        client = LLMClient(
+            base_url=["http://a:11434", "http://b:11434"], keyword_filter=False
+        )
+        ok = _make_chat_response('[{"ticker": "161005"}]')
+        with patch.object(client._clients[0], "chat", return_value=ok) as chat_a, \
+                patch.object(client._clients[1], "chat", return_value=ok) as chat_b:
+            for i in range(4):
+                client.parse_announcement(f"Test text {i}")
+            self.assertEqual(chat_a.call_count, 2)
+            self.assertEqual(chat_b.call_count, 2)
+
+            # Backend a goes down: the request fails over to b, and a is skipped
+            chat_a.side_effect = ConnectionError("Connection refused")
+            result = client.parse_announcement("Test text 4")
+            self.assertEqual(result[0]["ticker"], "161005")
+            client.parse_announcement("Test text 5")
+            self.assertEqual(chat_a.call_count, 3)
+            self.assertEqual(chat_b.call_count, 4)
+
     def test_base_url_alias(self):
         """Test that base_url property returns host value."""
         client = LLMClient(base_url="http://test:11434")
@@ -617,7 +785,7 @@ class TestLLMClientIntegration(unittest.TestCase):
 
     To run these tests:
         1. Install Ollama: https://ollama.com
-        2. Pull a model: ollama pull qwen3:8b
+        2. Pull a model: ollama pull qwen3:8b-q4_K_M
         3. Start Ollama: ollama serve
         4. Run tests with: OLLAMA_TEST=1 python -m pytest tests/test_llm_client.py -v
     """
@@ -489,6 +489,28 @@ class TestOpenEndedLimits(unittest.TestCase):
         self.assertGreaterEqual(df_filtered.index[0], pd.Timestamp("2024-03-01"))
         self.assertLessEqual(df_filtered.index[-1], pd.Timestamp("2024-04-30"))
 
+    def test_date_filtering_with_month_strings(self):
+        """Test that month-only bounds cover whole months, as with .loc."""
+        self._create_market_data(self.ticker, self.date_range)
+        self._create_nav_data(self.ticker, self.date_range)
+        self._create_fee_config()
+        self._create_limit_events_db([])
+
+        loader = DataLoader(str(self.data_dir))
+        full = loader.load_bundle(self.ticker)
+
+        for start, end in [(None, "2024-02"), ("2024-03", "2024-05")]:
+            with self.subTest(start=start, end=end):
+                df_filtered = loader.load_bundle(
+                    self.ticker, start_date=start, end_date=end
+                )
+                pd.testing.assert_index_equal(
+                    df_filtered.index, full.loc[start:end].index
+                )
+
+        df_feb = loader.load_bundle(self.ticker, end_date="2024-02")
+        self.assertEqual(df_feb.index[-1], pd.Timestamp("2024-02-29"))
+
     def test_multiple_tickers_different_limits(self):
         """Test that different tickers can have different limit configurations."""
         tickers = ["TICKA", "TICKB"]
@@ -557,6 +579,94 @@ class TestOpenEndedLimits(unittest.TestCase):
             "TICKB should have no limit after Apr",
         )
 
+        # Concurrent loading returns the same bundles, keyed in input order
+        bundles = DataLoader(str(self.data_dir)).load_bundles(tickers)
+        self.assertEqual(list(bundles), tickers)
+        pd.testing.assert_frame_equal(bundles["TICKA"], df_a)
+        pd.testing.assert_frame_equal(bundles["TICKB"], df_b)
+
+    def test_bundle_cache_rebuilt_after_limit_change(self):
+        """Test that cached bundles are reused until a source file changes."""
+        self._create_market_data(self.ticker, self.date_range)
+        self._create_nav_data(self.ticker, self.date_range)
+        self._create_fee_config()
+        self._create_limit_events_db(
+            [{"start_date": "2024-02-15", "end_date": None, "max_amount": 500.0}]
+        )
+        cache_dir = Path(self.temp_dir) / "bundle_cache"
+
+        df = DataLoader(str(self.data_dir), cache_dir=str(cache_dir)).load_bundle(
+            self.ticker
+        )
+        cached = DataLoader(str(self.data_dir), cache_dir=str(cache_dir)).load_bundle(
+            self.ticker
+        )
+        pd.testing.assert_frame_equal(cached, df, check_freq=False)
+        self.assertEqual(len(list(cache_dir.glob("*.feather"))), 1)
+
+        # A new limit event changes the database, so the bundle is rebuilt
+        (self.data_dir / "config" / "fund_status.db").unlink()
+        self._create_limit_events_db(
+            [{"start_date": "2024-03-01", "end_date": None, "max_amount": 50.0}]
+        )
+        db_stat = (self.data_dir / "config" / "fund_status.db").stat()
+        os.utime(
+            self.data_dir / "config" / "fund_status.db",
+            ns=(db_stat.st_atime_ns, db_stat.st_mtime_ns + 10**9),
+        )
+        rebuilt = DataLoader(str(self.data_dir), cache_dir=str(cache_dir)).load_bundle(
+            self.ticker
+        )
+        self.assertEqual(rebuilt.loc["2024-03-01", "daily_limit"], 50.0)
+        self.assertEqual(len(list(cache_dir.glob("*.feather"))), 1)
+
+    def test_memoized_bundle_isolated_and_refreshed(self):
+        """Test that repeat loads are independent copies and see new events."""
+        self._create_market_data(self.ticker, self.date_range)
+        self._create_nav_data(self.ticker, self.date_range)
+        self._create_fee_config()
+        self._create_limit_events_db(
+            [{"start_date": "2024-02-15", "end_date": None, "max_amount": 500.0}]
+        )
+        loader = DataLoader(str(self.data_dir))
+
+        first = loader.load_bundle(self.ticker)
+        first["extra"] = 1.0
+        second = loader.load_bundle(self.ticker)
+        self.assertNotIn("extra", second.columns)
+
+        # Replacing the database invalidates both the memo and the limits cache
+        db_path = self.data_dir / "config" / "fund_status.db"
+        db_stat = db_path.stat()
+        db_path.unlink()
+        self._create_limit_events_db(
+            [{"start_date": "2024-03-01", "end_date": None, "max_amount": 50.0}]
+        )
+        os.utime(db_path, ns=(db_stat.st_atime_ns, db_stat.st_mtime_ns + 10**9))
+        third = loader.load_bundle(self.ticker)
+        self.assertEqual(third.loc["2024-02-20", "daily_limit"], float("inf"))
+        self.assertEqual(third.loc["2024-03-01", "daily_limit"], 50.0)
+
+    def test_list_tickers_with_data(self):
+        """Test filtering tickers by their latest market date."""
+        self._create_market_data(self.ticker, self.date_range)
+        self._create_nav_data(self.ticker, self.date_range)
+        early_dates = pd.bdate_range(start="2024-01-01", end="2024-02-29")
+        self._create_market_data("TEST002", early_dates)
+        self._create_nav_data("TEST002", early_dates)
+        self._create_fee_config()
+        self._create_limit_events_db([])
+        loader = DataLoader(str(self.data_dir))
+
+        self.assertEqual(
+            loader.list_tickers_with_data("2024-01-15"), ["TEST001", "TEST002"]
+        )
+        self.assertEqual(
+            loader.list_tickers_with_data("2024-02-29"), ["TEST001", "TEST002"]
+        )
+        self.assertEqual(loader.list_tickers_with_data("2024-03-01"), ["TEST001"])
+        self.assertEqual(loader.list_tickers_with_data("2024-07-01"), [])
+
 
 class TestOpenEndedLimitsEdgeCases(unittest.TestCase):
     """Edge case tests for open-ended limit handling."""
@@ -9,8 +9,10 @@ Tests cover:
 - Chinese text preservation
 """
 
+import hashlib
 import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -18,6 +20,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.data._llm_cache import FileCache
 from src.data.pdf_extractor import extract_pdf_text, PDFExtractionError
 
 
@@ -136,6 +139,16 @@ class TestPDFExtractor(unittest.TestCase):
             print(f"\nNote: PDF {self.test_pdf_path.name} has no Chinese text")
             print(f"First 200 chars: {text[:200]}")
 
+    def test_parallel_extraction_matches_sequential(self):
+        """Verify multi-process page extraction yields identical output."""
+        if not self.test_pdf_path:
+            self.skipTest("No real PDF files available for testing")
+
+        sequential = extract_pdf_text(self.test_pdf_path)
+        parallel = extract_pdf_text(self.test_pdf_path, max_workers=2)
+
+        self.assertEqual(sequential, parallel)
+
     def test_extract_directory_path(self):
         """Test error handling when path is a directory."""
         if not self.data_dir.exists():
@@ -176,6 +189,23 @@ class TestPDFExtractionEdgeCases(unittest.TestCase):
         result = extract_pdf_text(unicode_path)
         self.assertFalse(result["success"])
 
+    def test_content_cache(self):
+        """Test that cached text is keyed by file content, not file name."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FileCache(dir=tmp, ttl_days=None)
+            original = Path(tmp) / "original.pdf"
+            original.write_bytes(b"not really a pdf")
+            key = hashlib.blake2b(original.read_bytes(), digest_size=16).hexdigest()
+            cache.set("pdf_text_v1", key, {"text": "缓存文本", "pages": 2})
+
+            # A re-posted copy under another name is served from the cache
+            copy = Path(tmp) / "reposted.pdf"
+            copy.write_bytes(original.read_bytes())
+            result = extract_pdf_text(copy, cache=cache)
+            self.assertTrue(result["success"])
+            self.assertEqual(result["text"], "缓存文本")
+            self.assertEqual(result["pages"], 2)
+
 
 if __name__ == "__main__":
     # Configure logging to see warnings during tests